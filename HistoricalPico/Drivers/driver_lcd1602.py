@@ -3,13 +3,20 @@ import machine
 import time
 
 class LCD():
-    def __init__(self, addr=None, blen=1):
-        sda = machine.Pin(0)
-        scl = machine.Pin(1)
-        self.bus = machine.I2C(0,sda=sda, scl=scl, freq=400000)
+    def __init__(self, addr=None, blen=1, bus=None):
+        # bus: anything shaped like machine.I2C, e.g. an I2CBus device proxy
+        #   (retry / bus recovery / re-init via bus_dev.on_recover = lcd.init)
+        if bus is None:
+            sda = machine.Pin(0)
+            scl = machine.Pin(1)
+            bus = machine.I2C(0,sda=sda, scl=scl, freq=400000)
+        self.bus = bus
         print(self.bus.scan())
         self.addr = self.scanAddress(addr)
         self.blen = blen
+        self.init()
+
+    def init(self):
         self.send_command(0x33) # Must initialize to 8-line mode at first
         time.sleep(0.005)
         self.send_command(0x32) # Then initialize to 4-line mode
@@ -81,6 +88,21 @@ class LCD():
     
     def clear(self):
         self.send_command(0x01) # Clear Screen
+
+    def goto(self, x, y):
+        self.send_command(0x80 + 0x40 * y + x) # DDRAM address
+
+    def set_cgram(self, slot, rows):
+        # Custom glyph 0-7; 8 rows of 5 bits. Leaves the address in CGRAM -> goto() after
+        self.send_command(0x40 | (slot & 0x07) << 3)
+        for row in rows:
+            self.send_data(row & 0x1F)
+
+    def write_codes(self, x, y, codes):
+        # Raw character codes (0-7 = CGRAM glyphs)
+        self.goto(x, y)
+        for code in codes:
+            self.send_data(code)
         
     def openlight(self):  # Enable the backlight
         self.bus.writeto(self.addr,bytearray([0x08]))
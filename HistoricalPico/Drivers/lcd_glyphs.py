@@ -0,0 +1,191 @@
+#lcd_glyphs.py
+"""
+CGRAM glyph cache for the LCD1602 (driver_lcd1602.LCD)
+
+HD44780 has 8 custom character slots; uploading one costs 9 slow
+    command/data transfers (4 nibble writes + 2 sleeps each).
+GlyphCache ::
+    - glyphs are defined once (RAM); uploaded to CGRAM only on a miss
+    - LRU eviction, but never a slot that is still visible on screen
+        (CGRAM is displayed live; rewriting it would change those cells)
+    - a 16x2 shadow of the screen; put() sends only cells that changed
+    - no free slot -> the glyph's fallback character is drawn instead
+
+Meter / TuningBar reuse the same handful of partial-block glyphs,
+    so a steady signal or a slow tune sends one cell, or nothing.
+
+Usage ::
+    lcd = LCD()
+    cache = GlyphCache(lcd)
+    meter = Meter(cache, 0, 1, 8, 15)
+    tuning = TuningBar(cache, 0, 0, 16, 875, 1080)
+    meter.draw(radio.signal_adc_level)
+    tuning.draw(1011)
+"""
+from array import array
+
+SLOTS = 8
+COLS = 16
+ROWS = 2
+FULL = 0xFF     # ROM full block
+EMPTY = 0x20    # space
+
+
+class GlyphCache():
+    def __init__(self, lcd, slots=SLOTS):
+        self.lcd = lcd
+        self.glyphs = {}                    # key -> (rows, fallback code)
+        self.slot_key = [None] * slots
+        self.slot_of = {}                   # key -> slot
+        self.used = array('L', [0] * slots) # LRU stamps
+        self.refs = bytearray(slots)        # visible cells per slot (pinned while > 0)
+        self.shadow = bytearray(b" " * (COLS * ROWS))
+        self._stamp = 0
+        self._cursor = None                 # next DDRAM cell, if known
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.fallbacks = 0
+        self.cells_sent = 0
+
+    def define(self, key, rows, fallback=EMPTY):
+        """8 rows of 5 bits; redefining a cached glyph re-uploads it in place"""
+        rows = bytes(rows)
+        self.glyphs[key] = (rows, fallback)
+        slot = self.slot_of.get(key)
+        if slot is not None:
+            self.lcd.set_cgram(slot, rows)
+            self._cursor = None
+
+    def clear(self):
+        """LCD clear; every slot becomes evictable again"""
+        self.lcd.clear()
+        for i in range(len(self.shadow)):
+            self.shadow[i] = EMPTY
+        for i in range(len(self.refs)):
+            self.refs[i] = 0
+        self._cursor = None
+
+    # ───────────────────────────────────────────────────────────
+    # SLOTS
+    def code(self, key):
+        """CGRAM slot holding key (uploading on a miss), or the fallback code"""
+        self._stamp += 1
+        slot = self.slot_of.get(key)
+        if slot is not None:
+            self.hits += 1
+            self.used[slot] = self._stamp
+            return slot
+        rows, fallback = self.glyphs[key]
+        slot = self._victim()
+        if slot is None:
+            self.fallbacks += 1
+            return fallback
+        old = self.slot_key[slot]
+        if old is not None:
+            del self.slot_of[old]
+            self.evictions += 1
+        self.misses += 1
+        self.lcd.set_cgram(slot, rows)
+        self._cursor = None                 # address counter is in CGRAM now
+        self.slot_key[slot] = key
+        self.slot_of[key] = slot
+        self.used[slot] = self._stamp
+        return slot
+
+    def _victim(self):
+        """Empty slot first, else least recently used slot not on screen"""
+        best = None
+        for slot in range(len(self.slot_key)):
+            if self.slot_key[slot] is None:
+                return slot
+            if self.refs[slot]:
+                continue
+            if best is None or self.used[slot] < self.used[best]:
+                best = slot
+        return best
+
+    # ───────────────────────────────────────────────────────────
+    # CELLS
+    def put(self, x, y, items):
+        """items: int character codes or glyph keys; unchanged cells aren't sent"""
+        slots = len(self.refs)
+        for item in items:
+            if x >= COLS:
+                break
+            cell = y * COLS + x
+            old = self.shadow[cell]
+            if old < slots:
+                # release first so this cell's own slot can be reused
+                self.refs[old] -= 1
+            code = item if isinstance(item, int) else self.code(item)
+            if code < slots:
+                self.refs[code] += 1
+            if code != old:
+                if self._cursor != cell:
+                    self.lcd.goto(x, y)
+                self.lcd.send_data(code)
+                self.shadow[cell] = code
+                self.cells_sent += 1
+                self._cursor = cell + 1 if x + 1 < COLS else None
+            x += 1
+
+    def text(self, x, y, s):
+        self.put(x, y, [ord(c) for c in s])
+
+    def report(self):
+        print(f"GlyphCache :: hits {self.hits} misses {self.misses} evictions {self.evictions} "
+              f"fallbacks {self.fallbacks} cells {self.cells_sent}")
+
+
+# ───────────────────────────────────────────────────────────────
+# RENDERERS
+def _bar_rows(cols):
+    """cols (1-4) filled from the left, full height"""
+    return [(0x1F << (5 - cols)) & 0x1F] * 8
+
+
+def _tick_rows(col):
+    """One-pixel marker at col over the '_' baseline"""
+    return [0x10 >> col] * 6 + [0x1F, 0]
+
+
+class Meter():
+    """Horizontal bar, 5 steps per cell; at most one partial glyph visible"""
+    def __init__(self, cache, x, y, cells, max_value):
+        self.cache = cache
+        self.x, self.y = x, y
+        self.cells = cells
+        self.max_value = max_value
+        for n in range(1, 5):
+            cache.define(("bar", n), _bar_rows(n), FULL if n >= 3 else EMPTY)
+
+    def draw(self, value):
+        value = max(0, min(self.max_value, value))
+        fill = value * self.cells * 5 // self.max_value
+        full, part = divmod(fill, 5)
+        items = [FULL] * full
+        if part:
+            items.append(("bar", part))
+        items += [EMPTY] * (self.cells - len(items))
+        self.cache.put(self.x, self.y, items)
+
+
+class TuningBar():
+    """'_' scale with a 1-pixel marker; lo..hi mapped over cells*5 columns"""
+    def __init__(self, cache, x, y, cells, lo, hi):
+        self.cache = cache
+        self.x, self.y = x, y
+        self.cells = cells
+        self.lo, self.hi = lo, hi
+        for col in range(5):
+            cache.define(("tick", col), _tick_rows(col), ord("|"))
+
+    def draw(self, value):
+        value = max(self.lo, min(self.hi, value))
+        pos = (value - self.lo) * (self.cells * 5 - 1) // (self.hi - self.lo)
+        cell, col = divmod(pos, 5)
+        items = [ord("_")] * self.cells
+        items[cell] = ("tick", col)
+        self.cache.put(self.x, self.y, items)
@@ -11,12 +11,12 @@ print("I2C devices:", [hex(x) for x in i2c.scan()])
 def average_speed():
     timestamps = []
     for i in range(11):
-        timestamps.append(utime.ticks_us())  # milliseconds
+        timestamps.append(utime.ticks_us())  # microseconds
         utime.sleep_ms(0)  # optional delay
     # Print intervals between readings
     for i in range(1, len(timestamps)):
         delta = utime.ticks_diff(timestamps[i], timestamps[i-1])
-        print(f"Interval {i}: {delta} ms")
+        print(f"Interval {i}: {delta} us")
 average_speed()
 
 
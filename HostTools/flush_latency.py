@@ -0,0 +1,117 @@
+"""
+flush_latency.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"FLUSH WORKER INPUT LATENCY"  (PC only)
+
+Runs the real FlushWorker.py against a stand-in panel whose show_region()
+    takes as long as the I2C transfer would (bytes x 9 bits / clock).
+An 'input' task polls every POLL_MS on the same event loop (the encoder path);
+a 'render' task draws + flushes at the frame rate.
+
+Same run twice ::
+    synchronous   - show() blocks the loop for the transfer
+    threaded      - show() is a 1 KB copy; the worker thread sends
+Reports input poll lateness p50 / p99 / max for each.
+
+CPython's threads stand in for _thread; sleep() releases the GIL
+    like the ESP32 port does during a machine.I2C transfer.
+
+Usage ::
+    python HostTools/flush_latency.py --seconds 3 --fps 30 --clock 400000
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+import standins
+
+
+class StandInPanel:
+    """SSD1306 shape: buffer/width/pages/show/show_region(buf=); I2C-timed"""
+    def __init__(self, clock, width=128, pages=8):
+        self.width = width
+        self.pages = pages
+        self.buffer = bytearray(width * pages)
+        self.clock = clock
+        self.frames = 0
+
+    def _transfer(self, nbytes):
+        time.sleep((nbytes + 14) * 9 / self.clock)     # data + window commands
+
+    def show(self):
+        self._transfer(len(self.buffer))
+        self.frames += 1
+
+    def show_region(self, x0, x1, p0, p1, buf=None):
+        self._transfer((x1 - x0 + 1) * (p1 - p0 + 1))
+        self.frames += 1
+
+
+async def run_once(panel, seconds, fps, poll_ms):
+    late = []
+    stop = asyncio.Event()
+
+    async def poll_input():
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            await asyncio.sleep(poll_ms / 1000)
+            late.append((time.perf_counter() - t0) * 1000 - poll_ms)
+
+    async def render():
+        n = 0
+        while not stop.is_set():
+            n += 1
+            panel.buffer[n % len(panel.buffer)] ^= 0xFF      # 'draw'
+            panel.show()
+            await asyncio.sleep(1 / fps)
+
+    tasks = [asyncio.create_task(poll_input()), asyncio.create_task(render())]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    late.sort()
+    return late
+
+
+def summary(label, late):
+    p99 = late[min(len(late) - 1, int(len(late) * 0.99))]
+    print(f"{label:<12} polls {len(late):>5}  late ms  p50 {statistics.median(late):6.2f}  "
+          f"p99 {p99:6.2f}  max {late[-1]:6.2f}")
+    return p99
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Input latency: sync vs threaded OLED flush")
+    ap.add_argument("--seconds", type=float, default=3)
+    ap.add_argument("--fps", type=float, default=30)
+    ap.add_argument("--clock", type=int, default=400_000)
+    ap.add_argument("--poll-ms", type=float, default=5)
+    args = ap.parse_args(argv)
+    standins.install(standins.device_dir())
+    from FlushWorker import FlushWorker
+
+    print("─────── FLUSH LATENCY ───────")
+    panel = StandInPanel(args.clock)
+    sync_p99 = summary("synchronous", asyncio.run(
+        run_once(panel, args.seconds, args.fps, args.poll_ms)))
+
+    panel = StandInPanel(args.clock)
+    worker = FlushWorker(panel).attach()
+    if not worker.threaded:
+        print("no _thread; threaded run skipped")
+        return 1
+    thread_p99 = summary("threaded", asyncio.run(
+        run_once(panel, args.seconds, args.fps, args.poll_ms)))
+    worker.report()
+    worker.stop()
+    print(f"p99 input lateness {sync_p99:.2f} -> {thread_p99:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
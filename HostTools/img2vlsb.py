@@ -0,0 +1,235 @@
+"""
+img2vlsb.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"HOST-SIDE IMAGE PIPELINE"  (runs on the PC, NOT the ESP32)
+
+Decoding a BMP at boot costs time and RAM the board doesn't have.
+So the decode happens here, once;
+    BMP/DIB  ->  packed MONO_VLSB bytes  ->  tiny .py asset module
+
+The asset module is just three constants ::
+    WIDTH, HEIGHT, DATA (bytes)
+Images.py on the device wraps DATA without copying it,
+    and BootScreenIndicator blits it straight onto the OLED.
+
+MONO_VLSB (the SSD1306/framebuf native layout) ::
+    one byte = 8 vertical pixels, bit 0 on top
+    byte index = (y // 8) * WIDTH + x
+    HEIGHT is padded up to a multiple of 8
+
+Supported input ::
+    uncompressed BMP/DIB, 1/4/8/24/32 bits per pixel, bottom-up or top-down
+
+Lit pixels ::
+    default, DARK source pixels light up (ink on paper -> ink on OLED)
+    --invert lights the bright ones instead
+
+Usage ::
+    python HostTools/img2vlsb.py MP32_17-OCT-25/pixel-art-raven.bmp \\
+        -o MP32_17-OCT-25/Assets/raven.py
+    python HostTools/img2vlsb.py photo.bmp --dither --crop 10,0,128,64 -o Assets/photo.py
+
+Only the standard library is needed.
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import argparse
+import os
+import struct
+import sys
+
+# ───────────────────────────────────────────────────────────────
+# PANEL LIMITS
+OLED_W = 128
+OLED_H = 64
+
+
+# ───────────────────────────────────────────────────────────────
+# BMP DECODE -> grey rows (0..255), top row first
+def read_bmp(path):
+    with open(path, "rb") as f:
+        blob = f.read()
+    if blob[:2] != b"BM":
+        raise ValueError(f"{path}: not a BMP/DIB file")
+    (pixel_offset,) = struct.unpack_from("<I", blob, 10)
+    (header_size,) = struct.unpack_from("<I", blob, 14)
+    if header_size == 12:
+        # OS/2 BITMAPCOREHEADER
+        width, height, _, bpp = struct.unpack_from("<HHHH", blob, 18)
+        compression, colours = 0, 0
+        entry = 3
+    else:
+        width, height, _, bpp, compression = struct.unpack_from("<iiHHI", blob, 18)
+        (colours,) = struct.unpack_from("<I", blob, 46)
+        entry = 4
+    if compression not in (0, 3):
+        raise ValueError(f"{path}: compressed BMPs are not supported")
+    top_down = height < 0
+    height = abs(height)
+
+    palette = []
+    if bpp <= 8:
+        count = colours or (1 << bpp)
+        base = 14 + header_size
+        for i in range(count):
+            b, g, r = blob[base + i * entry: base + i * entry + 3]
+            palette.append(_luma(r, g, b))
+
+    stride = ((width * bpp + 31) // 32) * 4
+    rows = []
+    for row in range(height):
+        start = pixel_offset + row * stride
+        line = blob[start:start + stride]
+        grey = []
+        for x in range(width):
+            if bpp == 1:
+                index = (line[x >> 3] >> (7 - (x & 7))) & 1
+                grey.append(palette[index])
+            elif bpp == 4:
+                index = (line[x >> 1] >> (4 if x & 1 == 0 else 0)) & 0x0F
+                grey.append(palette[index])
+            elif bpp == 8:
+                grey.append(palette[line[x]])
+            elif bpp in (24, 32):
+                step = bpp // 8
+                b, g, r = line[x * step: x * step + 3]
+                grey.append(_luma(r, g, b))
+            else:
+                raise ValueError(f"{path}: {bpp} bpp not supported")
+        rows.append(grey)
+    if not top_down:
+        rows.reverse()
+    return width, height, rows
+
+
+def _luma(r, g, b):
+    return (r * 299 + g * 587 + b * 114) // 1000
+
+
+# ───────────────────────────────────────────────────────────────
+# CROP / FIT
+def crop(rows, x, y, w, h):
+    return [row[x:x + w] for row in rows[y:y + h]]
+
+
+def fit_panel(width, height, rows):
+    """Centre-crop anything bigger than the panel; never scales"""
+    w = min(width, OLED_W)
+    h = min(height, OLED_H)
+    x = (width - w) // 2
+    y = (height - h) // 2
+    return w, h, crop(rows, x, y, w, h)
+
+
+# ───────────────────────────────────────────────────────────────
+# 1-BIT CONVERSION
+def threshold(rows, level, invert):
+    lit = []
+    for row in rows:
+        lit.append([(v >= level) if invert else (v < level) for v in row])
+    return lit
+
+
+def dither(rows, invert):
+    """Floyd-Steinberg error diffusion; for greyscale/colour sources"""
+    work = [[float(v) for v in row] for row in rows]
+    h = len(work)
+    w = len(work[0]) if h else 0
+    lit = [[False] * w for _ in range(h)]
+    for y in range(h):
+        for x in range(w):
+            old = work[y][x]
+            new = 255.0 if old >= 128 else 0.0
+            err = old - new
+            lit[y][x] = (new > 0) if invert else (new == 0)
+            if x + 1 < w:
+                work[y][x + 1] += err * 7 / 16
+            if y + 1 < h:
+                if x > 0:
+                    work[y + 1][x - 1] += err * 3 / 16
+                work[y + 1][x] += err * 5 / 16
+                if x + 1 < w:
+                    work[y + 1][x + 1] += err * 1 / 16
+    return lit
+
+
+def pack_vlsb(lit, width, height):
+    """Bool rows -> MONO_VLSB bytes; height padded to whole pages"""
+    pages = (height + 7) // 8
+    out = bytearray(pages * width)
+    for y in range(height):
+        bit = 1 << (y & 7)
+        base = (y >> 3) * width
+        row = lit[y]
+        for x in range(width):
+            if row[x]:
+                out[base + x] |= bit
+    return bytes(out), pages * 8
+
+
+# ───────────────────────────────────────────────────────────────
+# OUTPUT
+def write_module(path, source, width, height, data):
+    name = os.path.basename(source)
+    lines = [
+        f'"""',
+        f"{os.path.basename(path)}",
+        f"Generated by HostTools/img2vlsb.py from {name} - do not edit",
+        f"MONO_VLSB, {width}x{height}, {len(data)} bytes",
+        f'"""',
+        f"WIDTH = {width}",
+        f"HEIGHT = {height}",
+        "DATA = (",
+    ]
+    for i in range(0, len(data), 16):
+        lines.append(f"    {bytes(data[i:i + 16])!r}")
+    lines.append(")")
+    with open(path, "w", newline="\n") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def preview(lit):
+    for row in lit:
+        print("".join("#" if v else "." for v in row))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="BMP/DIB -> MONO_VLSB asset module")
+    ap.add_argument("image")
+    ap.add_argument("-o", "--output", help="asset .py to write (default: print stats only)")
+    ap.add_argument("--crop", help="x,y,w,h applied before fitting to 128x64")
+    ap.add_argument("--dither", action="store_true", help="Floyd-Steinberg instead of threshold")
+    ap.add_argument("--threshold", type=int, default=128)
+    ap.add_argument("--invert", action="store_true", help="light bright pixels instead of dark")
+    ap.add_argument("--preview", action="store_true", help="ASCII preview on stdout")
+    args = ap.parse_args(argv)
+
+    width, height, rows = read_bmp(args.image)
+    if args.crop:
+        x, y, w, h = (int(v) for v in args.crop.split(","))
+        rows = crop(rows, x, y, w, h)
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+    width, height, rows = fit_panel(width, height, rows)
+    if args.dither:
+        lit = dither(rows, args.invert)
+    else:
+        lit = threshold(rows, args.threshold, args.invert)
+    data, padded = pack_vlsb(lit, width, height)
+
+    if args.preview:
+        preview(lit)
+    raw = os.path.getsize(args.image)
+    print(f"{args.image}: {width}x{height} -> {width}x{padded} VLSB, "
+          f"{len(data)} bytes (source {raw} bytes)")
+    if args.output:
+        write_module(args.output, args.image, width, padded, data)
+        print(f"wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""
+mirror_view.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"OLED MIRROR VIEWER"  (PC only)
+
+Rebuilds the OLED from ScreenMirror.py packets on the serial console.
+Draws it in the terminal (half-block characters, 128x32 cells),
+    with a frame-rate / bandwidth / compression readout.
+REPL text between packets is passed through underneath.
+
+Usage ::
+    python HostTools/mirror_view.py --port /dev/ttyUSB0           # needs pyserial
+    python HostTools/mirror_view.py --file capture.bin            # replay a capture
+    python HostTools/mirror_view.py --port COM5 --record frames/  # PBM per frame
+    python HostTools/mirror_view.py --port COM5 --save capture.bin
+
+Packet format lives in MP32_17-OCT-25/ScreenMirror.py.
+"""
+import argparse
+import os
+import sys
+import time
+
+WIDTH = 128
+PAGES = 8
+HEAD_LEN = 8
+SPAN_HEAD = 5
+
+
+# ───────────────────────────────────────────────────────────────
+# DECODE
+def unrle(data, start, end, out, at, width):
+    """PackBits decode data[start:end] into out[at:at+width]"""
+    i = start
+    pos = at
+    stop = at + width
+    while i < end and pos < stop:
+        n = data[i]
+        i += 1
+        if n < 128:
+            count = n + 1
+            out[pos:pos + count] = data[i:i + count]
+            i += count
+            pos += count
+        else:
+            count = n - 126
+            out[pos:pos + count] = bytes([data[i]]) * count
+            i += 1
+            pos += count
+    if pos != stop:
+        raise ValueError("span length mismatch")
+
+
+class Decoder:
+    """Feeds raw serial bytes; yields frames and passes text through"""
+    def __init__(self, width=WIDTH, pages=PAGES, text=sys.stderr):
+        self.width = width
+        self.pages = pages
+        self.frame = bytearray(width * pages)
+        self.pending = bytearray()
+        self.text = text
+        self.synced = False         # seen a keyframe yet
+        self.frames = 0
+        self.bad = 0
+        self.last_seq = None
+        self.lost = 0
+
+    def feed(self, chunk):
+        """Returns the number of complete frames applied"""
+        self.pending += chunk
+        applied = 0
+        buf = self.pending
+        while True:
+            at = buf.find(b"\xA5\x5A")
+            if at < 0:
+                keep = 1 if buf.endswith(b"\xA5") else 0
+                self._passthrough(buf[:len(buf) - keep])
+                del buf[:len(buf) - keep]
+                break
+            if at:
+                self._passthrough(buf[:at])
+                del buf[:at]
+            if len(buf) < HEAD_LEN:
+                break
+            kind = buf[2]
+            length = buf[6] | buf[7] << 8
+            total = HEAD_LEN + length + 1
+            if kind not in (0x4B, 0x44) or length > len(self.frame) * 2:
+                self.bad += 1
+                del buf[:1]
+                continue
+            if len(buf) < total:
+                break
+            payload = buf[HEAD_LEN:HEAD_LEN + length]
+            if sum(payload) & 0xFF != buf[total - 1]:
+                self.bad += 1
+                del buf[:1]
+                continue
+            seq = buf[3] | buf[4] << 8
+            if kind == 0x4B:
+                self.synced = True
+            if self.synced:
+                try:
+                    self._apply(buf, buf[5])
+                    applied += 1
+                    self.frames += 1
+                except (ValueError, IndexError):
+                    self.bad += 1
+                    self.synced = False
+            if self.last_seq is not None:
+                self.lost += (seq - self.last_seq - 1) & 0xFFFF
+            self.last_seq = seq
+            del buf[:total]
+        return applied
+
+    def _apply(self, buf, spans):
+        pos = HEAD_LEN
+        for _ in range(spans):
+            page, x0, width = buf[pos], buf[pos + 1], buf[pos + 2]
+            rle_len = buf[pos + 3] | buf[pos + 4] << 8
+            start = pos + SPAN_HEAD
+            unrle(buf, start, start + rle_len, self.frame,
+                  page * self.width + x0, width)
+            pos = start + rle_len
+
+    def _passthrough(self, data):
+        if data and self.text:
+            self.text.write(data.decode("utf-8", "replace"))
+            self.text.flush()
+
+    def pixel(self, x, y):
+        return (self.frame[(y >> 3) * self.width + x] >> (y & 7)) & 1
+
+
+# ───────────────────────────────────────────────────────────────
+# OUTPUT
+def render(dec):
+    """Half blocks: one character = two pixel rows"""
+    chars = (" ", "▀", "▄", "█")
+    lines = []
+    for y in range(0, dec.pages * 8, 2):
+        lines.append("".join(chars[dec.pixel(x, y) | dec.pixel(x, y + 1) << 1]
+                             for x in range(dec.width)))
+    return "\n".join(lines)
+
+
+def write_pbm(dec, path):
+    h = dec.pages * 8
+    with open(path, "w") as f:
+        f.write(f"P1\n{dec.width} {h}\n")
+        for y in range(h):
+            f.write(" ".join(str(dec.pixel(x, y)) for x in range(dec.width)) + "\n")
+
+
+class Meter:
+    """Rolling one-second frame & byte rate"""
+    def __init__(self):
+        self.t0 = time.monotonic()
+        self.frames = 0
+        self.bytes = 0
+        self.fps = 0.0
+        self.bps = 0.0
+        self.total_frames = 0
+        self.total_bytes = 0
+
+    def add(self, nbytes, frames):
+        self.bytes += nbytes
+        self.frames += frames
+        self.total_bytes += nbytes
+        self.total_frames += frames
+        now = time.monotonic()
+        if now - self.t0 >= 1.0:
+            span = now - self.t0
+            self.fps = self.frames / span
+            self.bps = self.bytes / span
+            self.t0, self.frames, self.bytes = now, 0, 0
+
+    def line(self, dec):
+        raw = self.total_frames * dec.width * dec.pages
+        ratio = 100 * self.total_bytes / raw if raw else 0
+        return (f"{self.fps:5.1f} fps  {self.bps / 1024:6.2f} KiB/s  "
+                f"{ratio:5.1f}% of raw  frames {dec.frames}  lost {dec.lost}  bad {dec.bad}")
+
+
+# ───────────────────────────────────────────────────────────────
+# SOURCES
+def open_source(args):
+    if args.file:
+        return open(args.file, "rb"), False
+    try:
+        import serial
+    except ImportError:
+        sys.exit("mirror_view :: pyserial not installed (pip install pyserial), or use --file")
+    return serial.Serial(args.port, args.baud, timeout=0.05), True
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="View the MP32 OLED over serial")
+    ap.add_argument("--port")
+    ap.add_argument("--baud", type=int, default=115200)
+    ap.add_argument("--file", help="read a saved capture instead of a port")
+    ap.add_argument("--save", help="append raw serial bytes here")
+    ap.add_argument("--record", help="directory for one PBM per frame")
+    ap.add_argument("--quiet", action="store_true", help="no terminal drawing")
+    args = ap.parse_args(argv)
+    if not (args.port or args.file):
+        ap.error("--port or --file")
+
+    src, live = open_source(args)
+    save = open(args.save, "ab") if args.save else None
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+    dec = Decoder()
+    meter = Meter()
+    try:
+        while True:
+            chunk = src.read(4096) if not live else src.read(src.in_waiting or 1)
+            if not chunk:
+                if live:
+                    continue
+                break
+            if save:
+                save.write(chunk)
+            got = dec.feed(bytes(chunk))
+            meter.add(len(chunk), got)
+            if got:
+                if args.record:
+                    write_pbm(dec, os.path.join(args.record, f"frame_{dec.frames:06d}.pbm"))
+                if not args.quiet:
+                    sys.stdout.write("\x1b[H" + render(dec) + "\n" + meter.line(dec) + "\x1b[K\n")
+                    sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if save:
+            save.close()
+    print(meter.line(dec))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""
+remote_load.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"REMOTE SERVER LOAD TEST"  (PC only)
+
+Runs the real RemoteServer.py on localhost against a stand-in radio,
+    then hammers it with many concurrent clients.
+
+Checks ::
+    - every command gets the right reply (ERR BUSY while a seek runs; retried)
+    - status pushes reach EVERY reader: clients stay connected for --hold s
+        (many push periods) while the dial moves, and each counts its S lines
+    - a pipelining client (--pipeline commands in one write, replies read
+        only afterwards) gets every reply and is never cut off
+    - stalled readers (never read, tiny receive window) are cut off after
+        STALL_MS, and no client's reply queue ever grows past MAX_OUT + a line
+    - a 'main loop' ticker sharing the event loop is never held up
+Reports command round-trip p50/p99 and the ticker's worst lateness.
+
+Usage ::
+    python HostTools/remote_load.py --clients 200 --commands 20 --stalled 10
+Exit status 0 when every check passes.
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import sys
+import time
+
+import standins
+
+
+class StandInRadio:
+    """Controller with RadioTuner's remote surface; no hardware"""
+    def __init__(self):
+        self.tenths = 1000
+        self.level = 5
+        self.stereo = False
+        self.presets = [None] * 8
+        self.seeks = 0
+        self.seeking = 0            # seeks in flight; the server refuses tunes meanwhile
+
+    def tune_to(self, tenths):
+        self.tenths = max(875, min(1080, tenths))
+        self.level = (self.tenths * 7) % 16
+        self.stereo = self.level > 9
+
+    def status(self):
+        return self.tenths, self.level, self.stereo
+
+    def busy(self):
+        return self.seeking > 0
+
+    def store_preset(self, slot):
+        self.presets[slot] = self.tenths
+
+    def recall_preset(self, slot):
+        if self.presets[slot] is not None:
+            self.tune_to(self.presets[slot])
+        return self.presets[slot]
+
+    async def seek(self, direction=1):
+        if self.busy():
+            return None
+        self.seeks += 1
+        self.seeking += 1
+        try:
+            await asyncio.sleep(0.02)
+            self.tune_to(self.tenths + 3 * direction)
+        finally:
+            self.seeking -= 1
+
+
+async def ticker(stop, period_ms=100):
+    """Stands in for Main.main(); records how late each wake-up is"""
+    worst = 0.0
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(period_ms / 1000)
+        worst = max(worst, (time.perf_counter() - t0) * 1000 - period_ms)
+    return worst
+
+
+PUSH_MS = 50
+MIN_PUSHES = 3              # status lines every reader must see while holding
+
+
+async def dial(radio, stop):
+    """Moves the station every push period, so every push has news"""
+    while not stop.is_set():
+        await asyncio.sleep(PUSH_MS / 1000)
+        radio.tune_to(875 + (radio.tenths - 875 + 1) % 205)
+
+
+async def client(port, n_commands, hold_s, rtts, failures, refused):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        first = await reader.readline()
+        if not first.startswith(b"S ") and not first.startswith(b"ERR BUSY"):
+            failures.append(("greeting", first))
+        if first.startswith(b"ERR BUSY"):
+            return "busy"
+        for i in range(n_commands):
+            tenths = 880 + (i * 13) % 200
+            t0 = time.perf_counter()
+            while True:
+                writer.write(f"TUNE {tenths / 10:.1f}\n".encode())
+                await writer.drain()
+                # skip pushed status lines until our reply
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        failures.append(("eof", i))
+                        return "eof"
+                    if line.startswith(b"OK ") or line.startswith(b"ERR"):
+                        break
+                if line != b"ERR BUSY\n":
+                    break
+                refused[0] += 1     # someone's seek owns the radio; try again
+                await asyncio.sleep(0.005)
+            rtts.append((time.perf_counter() - t0) * 1000)
+            if not line.startswith(b"OK "):
+                failures.append(("reply", line))
+        # idle reader: only pushes arrive now
+        pushed = 0
+        until = time.perf_counter() + hold_s
+        while (left := until - time.perf_counter()) > 0:
+            try:
+                line = await asyncio.wait_for(reader.readline(), left)
+            except asyncio.TimeoutError:
+                break
+            if not line:
+                failures.append(("eof", "hold"))
+                return "eof"
+            if line.startswith(b"S "):
+                pushed += 1
+        if pushed < MIN_PUSHES:
+            failures.append(("pushes", pushed))
+        writer.write(b"SEEK UP\nSTATUS\nPRESET SET 1\nPRESET 1\nBOGUS\nQUIT\n")
+        await writer.drain()
+        rest = await reader.read()
+        if b"OK SEEK" not in rest and b"ERR BUSY" not in rest:
+            failures.append(("missing", b"OK SEEK"))
+        if b"ERR UNKNOWN" not in rest:
+            failures.append(("missing", b"ERR UNKNOWN"))
+        return "ok"
+    finally:
+        writer.close()
+
+
+async def pipelined(port, n_commands, failures):
+    """All commands in one write, QUIT last; reads nothing until it's sent"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(b"PRESET SET 2\n" * n_commands + b"QUIT\n")
+        await writer.drain()
+        rest = await asyncio.wait_for(reader.read(), 10)
+        got = rest.count(b"OK 2\n")
+        if got != n_commands:
+            failures.append(("pipelined", f"{got} of {n_commands} replies"))
+        return got
+    finally:
+        writer.close()
+
+
+async def stalled(port, hold_s, failures):
+    """Tiny receive window, floods STATUS, never reads; must get cut off"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", port))
+    reader, writer = await asyncio.open_connection(sock=sock)
+    writer.write(b"STATUS\n" * 50_000)
+    t0 = time.perf_counter()
+    # reading EOF is the only way to see the close without draining replies
+    while time.perf_counter() - t0 < hold_s:
+        await asyncio.sleep(0.05)
+        if writer.transport.is_closing() or reader.at_eof():
+            break
+    writer.transport.abort()
+
+
+async def watch(server, stop, seen):
+    """Largest reply queue on any client, sampled while the load runs"""
+    while not stop.is_set():
+        for c in server.clients:
+            seen[0] = max(seen[0], len(c.out))
+        await asyncio.sleep(0.005)
+
+
+async def run(args):
+    import RemoteServer
+    RemoteServer.STALL_MS = args.stall_ms
+    radio = StandInRadio()
+    server = RemoteServer.RemoteServer(radio, host="127.0.0.1", port=0,
+                                       max_clients=args.clients + args.stalled + 1,
+                                       push_ms=PUSH_MS)
+    srv = await server.start()
+    # accepted sockets inherit this: a stall shows up in KB, not MB of kernel buffer
+    srv.sockets[0].setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+    port = srv.sockets[0].getsockname()[1]
+    stop = asyncio.Event()
+
+    async def pusher():
+        while not stop.is_set():
+            await asyncio.sleep(PUSH_MS / 1000)
+            server.push_status()
+
+    seen = [0]
+    side = [asyncio.create_task(pusher()), asyncio.create_task(dial(radio, stop)),
+            asyncio.create_task(watch(server, stop, seen))]
+    tick_task = asyncio.create_task(ticker(stop))
+    rtts, failures, refused = [], [], [0]
+    t0 = time.perf_counter()
+    slow = [asyncio.create_task(stalled(port, args.stall_ms / 1000 + 3, failures))
+            for _ in range(args.stalled)]
+    piped = asyncio.create_task(pipelined(port, args.pipeline, failures))
+    results = await asyncio.gather(*(client(port, args.commands, args.hold, rtts,
+                                            failures, refused)
+                                     for _ in range(args.clients)))
+    piped_got = await piped
+    await asyncio.sleep(args.stall_ms / 1000 + 0.5)
+    stalled_left = len(server.clients)
+    await asyncio.gather(*slow)
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    worst_late = await tick_task
+    await asyncio.gather(*side)
+    server.close()
+
+    limit = RemoteServer.MAX_OUT + RemoteServer.MAX_LINE
+    capped = seen[0] <= limit
+    if not capped:
+        failures.append(("queue", seen[0]))
+    if stalled_left:
+        failures.append(("stalled still connected", stalled_left))
+
+    rtts.sort()
+    print("─────── REMOTE LOAD ───────")
+    print(f"clients {args.clients} (+{args.stalled} stalled, +1 pipelined)  "
+          f"commands {len(rtts)}  {elapsed:.2f} s  {len(rtts) / elapsed:.0f} cmd/s")
+    if rtts:
+        p99 = rtts[min(len(rtts) - 1, int(len(rtts) * 0.99))]
+        print(f"rtt ms  p50 {statistics.median(rtts):.2f}  p99 {p99:.2f}  max {rtts[-1]:.2f}")
+    print(f"ticker worst lateness {worst_late:.1f} ms  pushes {server.pushes}  "
+          f"seeks {radio.seeks}  refused while seeking {refused[0]}")
+    print(f"pipelined replies {piped_got} of {args.pipeline}  "
+          f"largest queue {seen[0]} B (limit {limit})  stalled left connected {stalled_left}")
+    print(f"results {dict((r, results.count(r)) for r in set(results))}  failures {len(failures)}")
+    for f in failures[:5]:
+        print("  ", f)
+    return 0 if not failures and results.count("ok") == args.clients else 1
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Load-test RemoteServer on localhost")
+    ap.add_argument("--clients", type=int, default=100)
+    ap.add_argument("--commands", type=int, default=20)
+    ap.add_argument("--stalled", type=int, default=5)
+    ap.add_argument("--pipeline", type=int, default=100, help="commands in one write")
+    ap.add_argument("--hold", type=float, default=0.5, help="s each client idles reading pushes")
+    ap.add_argument("--stall-ms", type=int, default=1000, help="overrides RemoteServer.STALL_MS")
+    args = ap.parse_args(argv)
+    standins.install(standins.device_dir())
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
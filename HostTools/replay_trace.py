@@ -0,0 +1,82 @@
+"""
+replay_trace.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"HOST ENCODER REPLAY"  (PC only)
+
+Feeds a captured encoder trace (InputTrace.stop_capture) through the
+    real HardwareLayer.Encoder FSM on the PC, via stand-in pins.
+Exit status 0 when the replay lands on the captured end position;
+    usable as a regression check in any script.
+
+Usage ::
+    python HostTools/replay_trace.py enc_trace.bin            # flat out
+    python HostTools/replay_trace.py enc_trace.bin --speed 1  # real time
+    python HostTools/replay_trace.py --synth 20               # 20 clean CW detents
+
+--synth builds a textbook quadrature trace (plus contact bounce with
+    --bounce) when no capture is at hand.
+
+RadioTuner replay needs the OLED/radio stack; run that one on the device ::
+    events, meta = InputTrace.load()
+    Replay(hal.Inputs.EncoderPins, tuner).run(events, 1, meta)
+"""
+import argparse
+import sys
+
+import standins
+
+
+def synth_trace(detents, bounce=0, period_us=4000):
+    """
+    Quadrature CW detents as (ticks_us, pin, level) edges.
+    Per detent: left falls, right falls, left rises, right rises.
+    bounce=n adds n chatter pairs on every edge.
+    Returns (events, meta).
+    """
+    events = []
+    t = 0
+    step = period_us // 4
+    sign = 1 if detents >= 0 else -1
+    first, second = (0, 1) if sign > 0 else (1, 0)
+    for _ in range(abs(detents)):
+        for pin, level in ((first, 0), (second, 0), (first, 1), (second, 1)):
+            for _ in range(bounce):
+                events.append((t, pin, level))
+                t += 20
+                events.append((t, pin, 1 - level))
+                t += 20
+            events.append((t, pin, level))
+            t += step
+    return events, {"count": len(events), "start_pos": 0, "end_pos": detents}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Replay an encoder trace on the PC")
+    ap.add_argument("trace", nargs="?", help="trace file from InputTrace.stop_capture")
+    ap.add_argument("--speed", type=float, default=0, help="1 = real time, 0 = flat out")
+    ap.add_argument("--synth", type=int, help="synthesise N detents (negative = CCW)")
+    ap.add_argument("--bounce", type=int, default=0, help="chatter pairs per synthetic edge")
+    args = ap.parse_args(argv)
+
+    standins.install(standins.device_dir())
+    import InputTrace
+    from HardwareLayer import hal
+
+    if args.synth is not None:
+        events, meta = synth_trace(args.synth, args.bounce)
+    elif args.trace:
+        events, meta = InputTrace.load(args.trace)
+    else:
+        ap.error("give a trace file or --synth N")
+
+    encoder = hal.Inputs.EncoderPins
+    result = InputTrace.Replay(encoder).run(events, speed=args.speed, meta=meta)
+    result.report()
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
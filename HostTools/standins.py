@@ -0,0 +1,204 @@
+"""
+standins.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"HOST STAND-INS FOR MICROPYTHON MODULES"  (PC only)
+
+Lets the device modules (HardwareLayer, InputTrace, RemoteServer ...)
+    import under CPython for replay, load tests and latency measurements.
+
+install() registers minimal stand-ins, only for modules that are missing ::
+    micropython  - const()
+    utime        - ticks_* with MicroPython's 30-bit wrap, sleep_*
+    uasyncio     - CPython asyncio + sleep_ms(), wait_for_ms()
+    machine      - Pin (settable level, irq ignored), I2C/SoftI2C (null bus,
+                   every write ACKs, reads return zeros), Timer (inert)
+
+These are *stand-ins*, not simulators; nothing here pretends to be hardware
+    beyond what the calling tool drives explicitly.
+
+Usage ::
+    import standins; standins.install("MP32_17-OCT-25")
+    from HardwareLayer import hal
+"""
+import asyncio
+import os
+import sys
+import time
+import types
+
+TICKS_PERIOD = 1 << 30
+_T0 = time.perf_counter_ns()
+
+
+# ───────────────────────────────────────────────────────────────
+# micropython
+def _micropython():
+    mod = types.ModuleType("micropython")
+    mod.const = lambda x: x
+    mod.alloc_emergency_exception_buf = lambda n: None
+    mod.schedule = lambda fn, arg: fn(arg)
+    return mod
+
+
+# ───────────────────────────────────────────────────────────────
+# utime
+def _utime():
+    mod = types.ModuleType("utime")
+
+    def ticks_us():
+        return ((time.perf_counter_ns() - _T0) // 1000) % TICKS_PERIOD
+
+    def ticks_ms():
+        return ((time.perf_counter_ns() - _T0) // 1_000_000) % TICKS_PERIOD
+
+    def ticks_diff(a, b):
+        d = (a - b) % TICKS_PERIOD
+        return d - TICKS_PERIOD if d >= TICKS_PERIOD // 2 else d
+
+    def ticks_add(a, delta):
+        return (a + delta) % TICKS_PERIOD
+
+    mod.ticks_us = ticks_us
+    mod.ticks_ms = ticks_ms
+    mod.ticks_cpu = ticks_us
+    mod.ticks_diff = ticks_diff
+    mod.ticks_add = ticks_add
+    mod.sleep = time.sleep
+    mod.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    mod.sleep_us = lambda us: time.sleep(us / 1_000_000)
+    mod.time = time.time
+    mod.localtime = time.localtime
+    return mod
+
+
+# ───────────────────────────────────────────────────────────────
+# uasyncio
+def _uasyncio():
+    mod = types.ModuleType("uasyncio")
+    mod.__dict__.update(
+        {k: getattr(asyncio, k) for k in dir(asyncio) if not k.startswith("_")})
+    mod.sleep_ms = lambda ms: asyncio.sleep(ms / 1000)
+    mod.wait_for_ms = lambda aw, ms: asyncio.wait_for(aw, ms / 1000)
+    return mod
+
+
+# ───────────────────────────────────────────────────────────────
+# machine
+class Pin:
+    IN, OUT, OPEN_DRAIN = 1, 3, 7
+    PULL_UP, PULL_DOWN = 1, 2
+    IRQ_FALLING, IRQ_RISING = 2, 1
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        self.level = 1 if pull == Pin.PULL_UP else 0
+        if value is not None:
+            self.level = value
+        self.handler = None
+
+    def init(self, mode=-1, pull=-1, value=None):
+        if value is not None:
+            self.level = value
+
+    def value(self, v=None):
+        if v is None:
+            return self.level
+        self.level = 1 if v else 0
+
+    __call__ = value
+
+    def on(self):
+        self.level = 1
+
+    def off(self):
+        self.level = 0
+
+    def irq(self, trigger=0, handler=None):
+        self.handler = handler
+
+
+class I2C:
+    """Null bus; writes ACK, reads return zero bytes"""
+    def __init__(self, id=0, scl=None, sda=None, freq=400_000, timeout=None):
+        self.freq = freq
+
+    def init(self, scl=None, sda=None, freq=400_000, timeout=None):
+        self.freq = freq
+
+    def scan(self):
+        return [0x3C, 0x60]
+
+    def writeto(self, addr, buf, stop=True):
+        return len(buf)
+
+    def writevto(self, addr, bufs, stop=True):
+        return sum(len(b) for b in bufs)
+
+    def readfrom(self, addr, n, stop=True):
+        return bytes(n)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        for i in range(len(buf)):
+            buf[i] = 0
+
+    def deinit(self):
+        pass
+
+
+class SoftI2C(I2C):
+    def __init__(self, scl=None, sda=None, freq=400_000, timeout=None):
+        super().__init__(-1, scl, sda, freq)
+
+
+class Timer:
+    """Inert; host tools drive callbacks themselves"""
+    PERIODIC, ONE_SHOT = 1, 0
+
+    def __init__(self, id=-1, **kwargs):
+        self.callback = None
+
+    def init(self, mode=1, freq=-1, period=-1, callback=None):
+        self.callback = callback
+
+    def deinit(self):
+        self.callback = None
+
+
+def _machine():
+    mod = types.ModuleType("machine")
+    mod.Pin = Pin
+    mod.I2C = I2C
+    mod.SoftI2C = SoftI2C
+    mod.Timer = Timer
+    mod.freq = lambda *a: 240_000_000
+    mod.reset = lambda: sys.exit("machine.reset()")
+    mod.disable_irq = lambda: 0
+    mod.enable_irq = lambda state=0: None
+    return mod
+
+
+# ───────────────────────────────────────────────────────────────
+# INSTALL
+def install(device_dir=None):
+    """Registers any missing stand-ins; optionally puts device_dir on sys.path"""
+    for name, factory in (("micropython", _micropython), ("utime", _utime),
+                          ("uasyncio", _uasyncio), ("machine", _machine)):
+        if name not in sys.modules:
+            try:
+                __import__(name)
+            except ImportError:
+                sys.modules[name] = factory()
+    if device_dir:
+        path = os.path.abspath(device_dir)
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def device_dir():
+    """MP32 device folder next to HostTools/"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(os.path.dirname(here), "MP32_17-OCT-25")
@@ -0,0 +1,156 @@
+"""
+textpack.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"HOST-SIDE TEXT PACKER"  (runs on the PC, NOT the ESP32)
+
+Long text (HistoricalPico/Text/Entity.txt is ~65 KB) eats flash,
+    and the board can't hold it in RAM to page through anyway.
+So it is packed here into independently decompressible blocks ::
+    text  ->  ~BLOCK bytes cut at whitespace  ->  raw deflate each  ->  .tpk
+TextPack.py on the device inflates only the block a page sits in.
+
+.tpk layout (little endian) ::
+    header  '<4sBBHHI'  magic b"TPK1", wbits, 0, block, count, raw_len
+    index   '<IIHH' x count   raw_off, file_off, comp_len, raw_len
+    blocks  raw deflate streams (no zlib header), back to back
+
+wbits is the deflate window (2**wbits bytes); the device allocates
+    one window per page-open, so it stays small (default 10 = 1 KB).
+
+Text is folded for the OLED font (ASCII only) unless --raw ::
+    CRLF -> LF, curly quotes/dashes/ellipsis -> ASCII
+
+Usage ::
+    python HostTools/textpack.py HistoricalPico/Text/Entity.txt \\
+        -o MP32_17-OCT-25/Assets/entity.tpk
+    python HostTools/textpack.py notes.txt --block 2048 --wbits 11
+
+Only the standard library is needed.
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import argparse
+import struct
+import sys
+import time
+import zlib
+
+# ───────────────────────────────────────────────────────────────
+# FORMAT (mirrors MP32_17-OCT-25/TextPack.py)
+MAGIC = b"TPK1"
+HEADER = "<4sBBHHI"
+ENTRY = "<IIHH"
+BLOCK = 1024
+WBITS = 10
+
+FOLD = {
+    "‘": "'", "’": "'", "“": '"', "”": '"',
+    "–": "-", "—": "--", "…": "...", "■": "*",
+}
+
+
+def fold(text):
+    """OLED font is 7-bit; anything left over becomes '?'"""
+    text = text.replace("\r\n", "\n")
+    for k, v in FOLD.items():
+        text = text.replace(k, v)
+    return text.encode("ascii", "replace")
+
+
+# ───────────────────────────────────────────────────────────────
+# PACK
+def split(data, block):
+    """Cuts <= block bytes, at the last whitespace so no word straddles two"""
+    chunks = []
+    pos = 0
+    while pos < len(data):
+        end = min(pos + block, len(data))
+        if end < len(data):
+            cut = max(data.rfind(b" ", pos, end), data.rfind(b"\n", pos, end))
+            if cut > pos:
+                end = cut + 1
+        chunks.append(data[pos:end])
+        pos = end
+    return chunks
+
+
+def deflate(chunk, wbits):
+    c = zlib.compressobj(9, zlib.DEFLATED, -wbits, 9)
+    return c.compress(chunk) + c.flush()
+
+
+def pack(data, block=BLOCK, wbits=WBITS):
+    chunks = split(data, block)
+    streams = [deflate(c, wbits) for c in chunks]
+    head = struct.calcsize(HEADER) + struct.calcsize(ENTRY) * len(chunks)
+    out = bytearray(struct.pack(HEADER, MAGIC, wbits, 0, block, len(chunks), len(data)))
+    raw_off = 0
+    file_off = head
+    for c, s in zip(chunks, streams):
+        out += struct.pack(ENTRY, raw_off, file_off, len(s), len(c))
+        raw_off += len(c)
+        file_off += len(s)
+    for s in streams:
+        out += s
+    return bytes(out)
+
+
+def verify(blob):
+    """Inflates every block on its own; returns (data, worst block us)"""
+    magic, wbits, _, block, count, raw_len = struct.unpack_from(HEADER, blob, 0)
+    if magic != MAGIC:
+        raise ValueError("not a TPK1 pack")
+    base = struct.calcsize(HEADER)
+    data = bytearray()
+    worst = 0
+    for i in range(count):
+        raw_off, file_off, comp_len, n = struct.unpack_from(
+            ENTRY, blob, base + i * struct.calcsize(ENTRY))
+        t0 = time.perf_counter()
+        chunk = zlib.decompress(blob[file_off:file_off + comp_len], -wbits)
+        worst = max(worst, (time.perf_counter() - t0) * 1e6)
+        if len(chunk) != n or raw_off != len(data):
+            raise ValueError(f"block {i} does not round-trip")
+        data += chunk
+    if len(data) != raw_len:
+        raise ValueError("length mismatch")
+    return bytes(data), worst
+
+
+# ───────────────────────────────────────────────────────────────
+# ENTRY
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Text -> block-deflated .tpk for TextPack.py")
+    ap.add_argument("text")
+    ap.add_argument("-o", "--output", help=".tpk to write (default: print stats only)")
+    ap.add_argument("--block", type=int, default=BLOCK, help="max raw bytes per block")
+    ap.add_argument("--wbits", type=int, default=WBITS, help="deflate window, 9..15")
+    ap.add_argument("--raw", action="store_true", help="keep bytes as-is (no ASCII fold)")
+    args = ap.parse_args(argv)
+    if not 9 <= args.wbits <= 15:
+        ap.error("--wbits must be 9..15")
+
+    with open(args.text, "rb") as f:
+        original = f.read()
+    data = original if args.raw else fold(original.decode("utf-8"))
+    blob = pack(data, args.block, args.wbits)
+    check, worst = verify(blob)
+    assert check == data
+
+    count = struct.unpack_from(HEADER, blob, 0)[4]
+    print(f"{args.text}: {len(original)} B raw -> {len(blob)} B packed "
+          f"({100 * len(blob) // len(original)}%), {count} blocks of <= {args.block} B, "
+          f"window {1 << args.wbits} B")
+    print(f"host inflate worst block {worst:.0f} us; device: TextPack.report()")
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(blob)
+        print(f"wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
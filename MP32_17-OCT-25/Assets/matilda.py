@@ -0,0 +1,31 @@
+"""
+matilda.py
+Generated by HostTools/img2vlsb.py from Matilda.dib - do not edit
+MONO_VLSB, 50x56, 350 bytes
+"""
+WIDTH = 50
+HEIGHT = 56
+DATA = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x80\xe0\xc0\xe0\xe0\xf0\xf0\xf8'
+    b'\xf8\xf8\xfc\xfc\xfc\xfc\xfc\xfc\xfc\xfe\xfe\xfe\xfc\xfc\xfc\xfc'
+    b'\xfc\xfc\xf8\xf8\xf0\xe0\xe0\xc0\x00\x00\x00\x00\x00\x00``'
+    b'\x1c<\x00\x00\xf0\xfc\xfe~\xff\xff?\xff\xff\xff\xff\xef'
+    b'\xff\xdf\x9f\xff\xff\xff\xff\xff\xff\xff\xff\xff\x7f\x9f?\x1f'
+    b'\x1f\x1f\xff\xff?\x1f\x1f\x9f\xc7\xe7\x8f\x1cx`\x80\x00'
+    b'\xe3\xe0\xe0\xc0\x00\x03\x1f\x07\xff\x06\x01\x03\x00\x00\x03\x87'
+    b'\x9f\xff\xff\xff\xff\xff\xff\xff\xff\xf8\xc1\x07\x0f\x1f\xfc\xc3'
+    b'\x00\x00\x00\x00\x00\x07\x01\x00\x00\x00\x00\xff\xff\x1f\x00\x00'
+    b'\x01\x0f\xfd\xfd\xff\x1f\x00\x00\x00\x00\x07\x1c\x04\x00\x00\x00'
+    b'\x01\x03\x03\x02\x07?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xfe\xfe\xff\xff\xfe\xfe\xfe\xf8\xfc\xff\xff\xfe'
+    b'\xfe\xff\xff\xff\xff\x7f\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00@\x00\x00\x00\x00\x00\x00\xe0\x80\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\x7f\x7f\x7f\xff\xff\xdf\x9f\x9f\x8f\x8f'
+    b'\x0f\x0f\x07\x03\x01\x01\x00\x00\x10q\x00\x00\x00\x00\x00\x00'
+    b'\x02\x00\x06\x02\x00\x00\x00\x00\x00\x02\x11\x01\t\t\x01\x01'
+    b'\x81\x80\x80\x80\x80\xc0\xe0\xe0\xf0\xf8\xfe\xfd\x7f\x7f\x7f|'
+    b'??\x1c\x18\x00\x00\x00\x00\x00\x0cL@\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x02\x03\x03\x03\x03\x03\x03\x03\x03\x01\x01\x03\x03\x03\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
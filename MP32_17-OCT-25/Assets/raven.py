@@ -0,0 +1,31 @@
+"""
+raven.py
+Generated by HostTools/img2vlsb.py from pixel-art-raven.bmp - do not edit
+MONO_VLSB, 50x56, 350 bytes
+"""
+WIDTH = 50
+HEIGHT = 56
+DATA = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\x80\x80\x80\x80'
+    b'\x80\x80\x80\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x06\x0f\x0f\x1f\x1f?'
+    b'\xff\xff\x8f\x03\xc3\xe3s7>8p`\xe0\xc0\x80\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x01\x1f\x1f8s\xef\xde\xbc|\xfc\xf8p\xf8\xfd'
+    b'\xff\xff\xfe\xfc\xf8\xf0\xe0\xc0\x80\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x80\xc0p00ppppq{~\x7fw\x7f'
+    b'\x7foo\xff\xdf\xbf?\x7f\xff\xff\xff\xff\xff\xfe\xfc\xf8'
+    b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xf8'
+    b'\xfe\x0e\x0f\x1d90000\xf8\xfc\xce\x06\x00\x00\x00'
+    b'\x00\x00\xc0\xc0\x80\x00\x01\x03\x7f\xfe\xc0\x80\x01\x01\x03\x03'
+    b'\x03\x07\x0f\x0f\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e'
+    b'\x0f\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x0f\x0e\x00'
+    b'\x00\x00\x00\x00\x00\x01\x03\x0f\x0e\x00\x00\x00\x01\x03\x0f\x0e'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
@@ -0,0 +1,255 @@
+"""
+Bench.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"ON-DEVICE MICRO-BENCHMARKS"
+
+Registered cases, each ::
+    warm-up calls (caches, first-call allocations, bus clock switch)
+    N timed calls into one preallocated sample array
+    min / median / p95 / max (us) into preallocated result arrays
+
+Default cases (default_cases) ::
+    null        empty call; the loop's own cost, subtracted from the rest
+    i2c_w<N>    OLED command write of N bytes (NOPs, nothing visible)
+    show        SSD1306.show(), whole panel
+    text        framebuf text(), 8 characters
+    r.upd       Radio.update()
+show / r.upd time the class methods, not the instance attributes that
+    Telemetry, Mirror and FlushWorker replace with wrappers.
+    irq_lat     edge -> handler entry, loopback on a spare pin (self-timed)
+    irq_fsm     encoder irq_handler body (self-timed)
+
+A self_timed case returns its own sample (us); otherwise the call is timed.
+
+Machine-readable output, one line per case ::
+    BENCH,<board>,<firmware>,<case>,<n>,<min>,<med>,<p95>,<max>
+Grep 'BENCH,' from the REPL logs of two boards/firmwares and diff.
+
+Usage ::
+    from Bench import bench_all
+    bench_all()                 # default cases, 200 iterations
+    bench_all(1000, emit=True)
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import os
+import utime as time
+from array import array
+from machine import Pin
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# LIMITS
+MAX_CASES = const(12)
+MAX_ITER = const(1000)      # sample array size; bigger runs are capped
+WARMUP = const(10)
+IRQ_PIN = const(4)          # spare GPIO, nothing attached (loopback via OUT+IRQ)
+IRQ_WAIT = const(20_000)    # spin limit waiting for the handler
+
+
+def _shell_sort(a, n):
+    """In-place on an array; no allocation (array has no sort())"""
+    gap = n // 2
+    while gap:
+        for i in range(gap, n):
+            v = a[i]
+            j = i
+            while j >= gap and a[j - gap] > v:
+                a[j] = a[j - gap]
+                j -= gap
+            a[j] = v
+        gap //= 2
+
+
+class Bench:
+    def __init__(self, cases=MAX_CASES, max_iter=MAX_ITER):
+        self.names = [None] * cases
+        self.fns = [None] * cases
+        self.self_timed = bytearray(cases)
+        self.count = 0
+        self.max_iter = max_iter
+        self.samples = array("L", [0] * max_iter)
+        # Results per case (us)
+        self.n = array("L", [0] * cases)
+        self.min = array("L", [0] * cases)
+        self.med = array("L", [0] * cases)
+        self.p95 = array("L", [0] * cases)
+        self.max = array("L", [0] * cases)
+        self.overhead = 0           # null-case median, subtracted from timed cases
+        self.failures = 0           # cases that raised
+
+    def case(self, name, fn, self_timed=False):
+        """Registers fn(); self_timed fns return their own sample in us"""
+        if self.count >= len(self.names):
+            raise ValueError("Bench :: out of case slots")
+        self.names[self.count] = name
+        self.fns[self.count] = fn
+        self.self_timed[self.count] = self_timed
+        self.count += 1
+
+    # ───────────────────────────────────────────────────────────
+    # RUN
+    def run(self, slot, iterations=200, warmup=WARMUP):
+        fn = self.fns[slot]
+        n = min(iterations, self.max_iter)
+        s = self.samples
+        ticks_us = time.ticks_us
+        ticks_diff = time.ticks_diff
+        overhead = self.overhead
+        for _ in range(warmup):
+            fn()
+        if self.self_timed[slot]:
+            for i in range(n):
+                s[i] = fn()
+        else:
+            for i in range(n):
+                t0 = ticks_us()
+                fn()
+                dt = ticks_diff(ticks_us(), t0)
+                s[i] = dt - overhead if dt > overhead else 0
+        _shell_sort(s, n)
+        self.n[slot] = n
+        self.min[slot] = s[0]
+        self.med[slot] = s[n // 2]
+        self.p95[slot] = s[min(n - 1, n * 95 // 100)]
+        self.max[slot] = s[n - 1]
+
+    def run_all(self, iterations=200, warmup=WARMUP):
+        for slot in range(self.count):
+            try:
+                self.run(slot, iterations, warmup)
+                if self.names[slot] == "null":
+                    self.overhead = self.med[slot]
+            except Exception as e:
+                self.failures += 1
+                self.n[slot] = 0
+                print("Bench ::", self.names[slot], "failed e>", e)
+
+    # ───────────────────────────────────────────────────────────
+    # OUTPUT
+    def report(self):
+        print("─────── BENCH (us) ───────")
+        print(f"{'case':<9}{'n':>5}{'min':>7}{'med':>7}{'p95':>7}{'max':>7}")
+        for i in range(self.count):
+            if self.n[i]:
+                print(f"{self.names[i]:<9}{self.n[i]:>5}{self.min[i]:>7}"
+                      f"{self.med[i]:>7}{self.p95[i]:>7}{self.max[i]:>7}")
+        print(f"loop overhead {self.overhead} us (subtracted)")
+        print("──────────────────────────")
+
+    def emit(self):
+        board, firmware = platform()
+        for i in range(self.count):
+            if self.n[i]:
+                print("BENCH,{},{},{},{},{},{},{},{}".format(
+                    board, firmware, self.names[i], self.n[i],
+                    self.min[i], self.med[i], self.p95[i], self.max[i]))
+
+
+def platform():
+    """(board, firmware) with commas stripped so CSV stays intact"""
+    u = os.uname()
+    board = u.machine.replace(",", " ")
+    firmware = "{} {}".format(u.release, u.version).replace(",", " ")
+    return board, firmware
+
+
+# ───────────────────────────────────────────────────────────────
+# DEFAULT CASES
+class _IrqProbe:
+    """
+    Loopback edge on a spare pin (ESP32 OUT pins read back, so IRQs fire).
+    The handler stamps entry time, then runs the real encoder handler.
+    """
+    def __init__(self, encoder, pin=IRQ_PIN):
+        self.encoder = encoder
+        self.pin = Pin(pin, Pin.OUT, value=0)
+        self.t = array("l", [0, 0, 0])      # edge, entry, exit
+        self.done = False
+        self.pin.irq(trigger=Pin.IRQ_RISING, handler=self._handler)
+
+    def _handler(self, pin):
+        self.t[1] = time.ticks_us()
+        self.encoder.irq_handler(self.encoder.left)
+        self.t[2] = time.ticks_us()
+        self.done = True
+
+    def _fire(self):
+        self.pin.value(0)
+        self.done = False
+        self.t[0] = time.ticks_us()
+        self.pin.value(1)
+        spin = 0
+        while not self.done and spin < IRQ_WAIT:
+            spin += 1
+        if not self.done:
+            raise OSError("no IRQ on pin")
+
+    def latency(self):
+        self._fire()
+        return time.ticks_diff(self.t[1], self.t[0])
+
+    def handler_time(self):
+        self._fire()
+        return time.ticks_diff(self.t[2], self.t[1])
+
+    def close(self):
+        self.pin.irq(handler=None)
+
+
+def _unwrapped(obj, name):
+    """
+    obj's class method; skips any instance-level wrapper.
+    A lambda, not __get__ (not on every port); 'null' cancels its call cost.
+    """
+    method = getattr(type(obj), name)
+    return lambda: method(obj)
+
+
+def default_cases(bench, write_sizes=(2, 16, 64)):
+    from Globals import screen, radio, oled_i2c, flush_worker
+    from HardwareLayer import hal
+
+    bench.case("null", lambda: None)
+    if oled_i2c:
+        for size in write_sizes:
+            # control byte 0x00 + NOP commands (0xE3)
+            buf = bytes([0x00] + [0xE3] * (size - 1))
+            bench.case("i2c_w{}".format(size),
+                       lambda b=buf: oled_i2c.writeto(0x3C, b))
+    if screen:
+        show = _unwrapped(screen, "show")
+        if flush_worker and flush_worker.threaded:
+            # the worker may still be sending; never interleave with it
+            lock = flush_worker.panel_lock
+
+            def show(show=show):
+                with lock:
+                    show()
+        bench.case("show", show)
+        bench.case("text", lambda: screen.text("101.1MHz", 0, 0))
+    if radio:
+        bench.case("r.upd", _unwrapped(radio, "update"))
+    try:
+        probe = _IrqProbe(hal.Inputs.EncoderPins)
+        bench.case("irq_lat", probe.latency, True)
+        bench.case("irq_fsm", probe.handler_time, True)
+    except Exception as e:
+        print("Bench :: no IRQ probe e>", e)
+        probe = None
+    return probe
+
+
+def bench_all(iterations=200, emit=True):
+    bench = Bench()
+    probe = default_cases(bench)
+    bench.run_all(iterations)
+    if probe:
+        probe.close()
+    bench.report()
+    if emit:
+        bench.emit()
+    return bench
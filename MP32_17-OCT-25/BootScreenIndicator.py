@@ -12,11 +12,14 @@ I2C = Globals.I2C
 Pin = Globals.Pin
 ssd1306 = Globals.ssd1306
 time = Globals.time
-
+# Pre-baked MONO_VLSB boot art (HostTools/img2vlsb.py -> Assets/)
+import Images
 
 
 # I2C setup
-Screen_i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400000)
+# Rides the shared bus at the display's clock profile;
+# a fresh I2C(0) here would silently re-clock the bus under Globals
+Screen_i2c = Globals.bus.device("bsi", Globals.I2C_DISPLAY_FREQ)
 
 # Screen object
 screen = ssd1306.SSD1306_I2C(128, 64, Screen_i2c)
@@ -32,6 +35,20 @@ def run_animation():
     screen.fill(0)
     screen.show()
 
+    "Art on Start"
+    # Blitted straight from the asset bytes; no decode, no copy
+    try:
+        screen.blit(Images.load("raven"), 4, 4)
+        screen.blit(Images.load("matilda"), 74, 4)
+        screen.show()
+        time.sleep(0.5)
+    except Exception as e:
+        print("BSI :: no boot art e>", e)
+    finally:
+        Images.unload()
+    screen.fill(0)
+    screen.show()
+
     "The Ready Blink"
     screen.text("Ready", 38, 28)
     screen.show()
@@ -0,0 +1,204 @@
+"""
+FlushWorker.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"SECOND-CORE DISPLAY FLUSH"
+
+show() / show_region() block the uasyncio loop for the whole I2C transfer
+    (~25 ms a full frame at 400 kHz); encoder input waits behind it.
+Optional _thread worker ::
+    UI draws into screen.buffer (BACK) exactly as before
+    submit  : copy BACK -> FRONT[fill] under the lock (1 KB memcpy), wake worker
+    worker  : swap fill/send under the lock, push FRONT[send] over I2C
+    the lock is only held for the copy / the swap - never for the transfer
+Frames submitted while the worker is busy coalesce (newest wins,
+    dirty regions unioned), so a slow panel never queues work up.
+
+Fallback ::
+    no _thread, or the thread won't start -> attach() leaves show()
+    untouched and flushing stays synchronous. stop() restores it too.
+
+The bus is shared with the radio; I2CBus proxies take bus.lock per transfer.
+That alone isn't enough for the panel: a region flush is a command
+    sequence (column/page window, then data) and the driver's temp/write_list
+    scratch is shared. So the worker holds panel_lock for each whole flush,
+    and attach() wraps every other command sequence on the screen
+    (PANEL_CMDS: contrast, init_display, power...) to take it as well.
+Real overlap needs the port to release the GIL during the transfer
+    (ESP32 does for machine.I2C); measure with
+    python HostTools/flush_latency.py
+
+Usage ::
+    worker = FlushWorker(screen).attach()     # before Mirror/Telemetry wrap show()
+    worker.report()
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import utime as time
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+# Screen methods that talk to the panel outside show()/show_region()
+PANEL_CMDS = ("init_display", "poweroff", "poweron", "contrast", "invert", "rotate")
+
+
+class FlushWorker:
+    def __init__(self, screen):
+        self.screen = screen
+        self.width = screen.width
+        self.pages = screen.pages
+        size = len(screen.buffer)
+        self.bufs = (bytearray(size), bytearray(size))
+        self.fill = 0               # FRONT buffer the next submit copies into
+        self.pending = False
+        self._x0 = self._x1 = self._p0 = self._p1 = 0
+        self.running = False
+        self.threaded = False
+        self.alive = False          # worker thread inside _run()
+        self._sync_show = None
+        self._sync_region = None
+        self._guarded = {}          # PANEL_CMDS name -> original, while attached
+        if _thread:
+            self.lock = _thread.allocate_lock()
+            self.panel_lock = _thread.allocate_lock()   # one command sequence at a time
+            self._wake = _thread.allocate_lock()
+            self._wake.acquire()
+        # Stats
+        self.submitted = 0
+        self.coalesced = 0          # submits merged into a frame not yet sent
+        self.sent = 0
+        self.errors = 0
+        self.submit_us_max = 0      # main-thread cost per frame
+        self.send_us_total = 0      # worker-thread cost
+        self.send_us_max = 0
+
+    # ───────────────────────────────────────────────────────────
+    # LIFECYCLE
+    def attach(self):
+        """Starts the worker and redirects show()/show_region(); returns self"""
+        if not _thread or self.running:
+            return self
+        screen = self.screen
+        self._sync_show = screen.show
+        self._sync_region = screen.show_region
+        # guards go on before the thread exists; panels without a command skip it
+        for name in PANEL_CMDS:
+            method = getattr(screen, name, None)
+            if method is not None:
+                self._guarded[name] = method
+                setattr(screen, name, self._guard(method))
+        self.running = True
+        try:
+            _thread.start_new_thread(self._run, ())
+        except Exception as e:
+            print("FlushWorker :: no thread, staying synchronous e>", e)
+            self.running = False
+            self._unguard()
+            return self
+        screen.show = self.submit
+        screen.show_region = self.submit
+        self.threaded = True
+        return self
+
+    def _guard(self, method):
+        """Bound panel method -> same, under panel_lock (waits out a flush)"""
+        lock = self.panel_lock
+
+        def guarded(*args):
+            with lock:
+                return method(*args)
+        return guarded
+
+    def _unguard(self):
+        for name, method in self._guarded.items():
+            setattr(self.screen, name, method)
+        self._guarded = {}
+
+    def stop(self):
+        """Back to synchronous flushing (the last frame still goes out)"""
+        if not self.threaded:
+            return
+        self.screen.show = self._sync_show
+        self.screen.show_region = self._sync_region
+        self._unguard()
+        self.threaded = False
+        self.running = False
+        self._signal()
+        # don't let a synchronous show() interleave with the last send
+        for _ in range(200):
+            if not self.alive:
+                break
+            time.sleep_ms(1)
+
+    # ───────────────────────────────────────────────────────────
+    # MAIN THREAD
+    def submit(self, x0=0, x1=None, p0=0, p1=None):
+        """Drop-in for show()/show_region(); copies, never waits for I2C"""
+        if x1 is None:
+            x1 = self.width - 1
+        if p1 is None:
+            p1 = self.pages - 1
+        t0 = time.ticks_us()
+        with self.lock:
+            self.bufs[self.fill][:] = self.screen.buffer
+            if self.pending:
+                self.coalesced += 1
+                self._x0 = min(self._x0, x0)
+                self._x1 = max(self._x1, x1)
+                self._p0 = min(self._p0, p0)
+                self._p1 = max(self._p1, p1)
+            else:
+                self._x0, self._x1, self._p0, self._p1 = x0, x1, p0, p1
+                self.pending = True
+            self.submitted += 1
+        self._signal()
+        dt = time.ticks_diff(time.ticks_us(), t0)
+        if dt > self.submit_us_max:
+            self.submit_us_max = dt
+
+    def _signal(self):
+        try:
+            self._wake.release()
+        except RuntimeError:
+            pass                    # already signalled
+
+    # ───────────────────────────────────────────────────────────
+    # WORKER THREAD
+    def _run(self):
+        self.alive = True
+        while True:
+            self._wake.acquire()
+            while True:
+                with self.lock:
+                    if not self.pending:
+                        break
+                    send = self.fill
+                    self.fill ^= 1
+                    x0, x1, p0, p1 = self._x0, self._x1, self._p0, self._p1
+                    self.pending = False
+                t0 = time.ticks_us()
+                try:
+                    with self.panel_lock:
+                        self._sync_region(x0, x1, p0, p1, self.bufs[send])
+                    self.sent += 1
+                except Exception as e:
+                    self.errors += 1
+                    print("FlushWorker :: send fail e>", e)
+                dt = time.ticks_diff(time.ticks_us(), t0)
+                self.send_us_total += dt
+                if dt > self.send_us_max:
+                    self.send_us_max = dt
+            if not self.running:
+                self.alive = False
+                return
+
+    def report(self):
+        avg = self.send_us_total // self.sent if self.sent else 0
+        print(f"FlushWorker :: {'threaded' if self.threaded else 'synchronous'}  "
+              f"submitted {self.submitted} sent {self.sent} coalesced {self.coalesced} "
+              f"errors {self.errors}")
+        print(f"  submit us max {self.submit_us_max}  send us avg {avg} max {self.send_us_max}")
@@ -25,7 +25,7 @@ To-Do::
 """
 # ───────────────────────────────────────────────────────────────
 # CORE IMPORTS
-from machine import Pin, I2C
+from machine import Pin, I2C, SoftI2C
 import uasyncio as asyncio
 import utime as time
 # ───────────────────────────────────────────────────────────────
@@ -36,6 +36,35 @@ from HardwareLayer import hal
 from lib import ssd1306
 # Radio Module (TEA5767 — I2C FM Receiver)
 from lib.TEA5767 import Radio
+# Heap / allocation counters (preallocated, cheap to leave on)
+from Telemetry import telemetry
+TELEMETRY = True
+# Event-loop lateness / step-time histograms
+from Profiler import profiler
+# Retained-mode widgets (diagnostics page)
+from Widgets import Scene, Label, Countdown
+# Popups that restore what they covered (menus, toasts, diagnostics)
+from Overlay import Overlay
+overlay = None
+# OLED mirror over USB serial (delta + RLE); off unless debugging
+from ScreenMirror import Mirror
+MIRROR = False
+mirror = None
+# Wi-Fi remote control (RemoteServer.py); off by default
+REMOTE = False
+WIFI_SSID = ""
+WIFI_KEY = ""
+# Signal history on flash (SignalLog.py); off by default
+SIGNAL_LOG = False
+SIGNAL_LOG_MS = 1000
+# Shared bus with per-device clock profiles
+from I2CBus import SharedBus, RADIO_MAX_FREQ
+# Last station / mode / contrast / mute, journaled on flash
+from ResumeState import ResumeState
+# OLED flush on a second thread (double-buffered); off by default
+from FlushWorker import FlushWorker
+FLUSH_WORKER = False
+flush_worker = None
 #
 asyncio.sleep_ms(10)
 # ───────────────────────────────────────────────────────────────
@@ -46,24 +75,65 @@ Define universal I2C bus
     (all I2C in future)
 I/O pins are flexible;
     adjust here for board variant
+Per-device clocks (see I2CBus.py);
+    radio stays <= 400 kHz (TEA5767 limit)
+    display runs as fast as calibration finds stable
 """
+I2C_SDA = 21
+I2C_SCL = 22
+I2C_FREQ = 400_000          # underscore is comma; radio / boot clock
+I2C_DISPLAY_FREQ = 400_000  # safe start; raised by calibration below
+I2C_CALIBRATE = True        # probe fastest stable display clock at boot
+I2C_SOFT = False            # True = bit-banged SoftI2C on the same pins
+I2C_TIMEOUT_US = 50_000     # per transfer cap; see I2CBus.py for retry/recovery
 try:
-    I2C_SDA = 21
-    I2C_SCL = 22
-    I2C_FREQ = 400_000  # underscore is comma
-    i2c = I2C(0, scl=Pin(I2C_SCL), sda=Pin(I2C_SDA), freq=I2C_FREQ)
+    if I2C_SOFT:
+        i2c = SoftI2C(scl=Pin(I2C_SCL), sda=Pin(I2C_SDA), freq=I2C_FREQ,
+                      timeout=I2C_TIMEOUT_US)
+    else:
+        i2c = I2C(0, scl=Pin(I2C_SCL), sda=Pin(I2C_SDA), freq=I2C_FREQ,
+                  timeout=I2C_TIMEOUT_US)
+    bus = SharedBus(i2c, I2C_SCL, I2C_SDA, I2C_FREQ, timeout_us=I2C_TIMEOUT_US)
+    if not bus.recover():   # a slave left mid-byte by a reset holds SDA
+        print("Globals :: I2C SDA stuck low")
+    oled_i2c = bus.device("oled", I2C_DISPLAY_FREQ)
+    radio_i2c = bus.device("radio", I2C_FREQ, RADIO_MAX_FREQ)
     asyncio.sleep_ms(10)
 except Exception as e:
     print("Globals :: I2C Fail e>", e)
-    i2c = None
+    i2c = bus = oled_i2c = radio_i2c = None
+# ───────────────────────────────────────────────────────────────
+# RESUME STATE
+"""
+Read before the display & radio come up,
+    so the first tune is already the last station.
+Missing/corrupt journal -> defaults (100.0 MHz, Fine)
+"""
+resume = ResumeState()
+try:
+    if resume.load():
+        print("Globals :: Resume", resume.tenths / 10, "MHz")
+except Exception as e:
+    print("Globals :: Resume Load Fail e>", e)
+hal.CoarseEncoderStep = resume.coarse
 # ───────────────────────────────────────────────────────────────
 # DISPLAY HANDLER
 """
 OLED Screen
 If missing, system prints E.
+One retry after a bus clear; a glitch at power-up shouldn't lose the panel.
 """
+def _oled():
+    try:
+        return ssd1306.SSD1306_I2C(128, 64, oled_i2c)
+    except OSError as e:
+        print("Globals :: OLED retry e>", e)
+        with bus.lock:
+            bus.recover()
+        return ssd1306.SSD1306_I2C(128, 64, oled_i2c)
 try:
-    screen = ssd1306.SSD1306_I2C(128, 64, i2c)
+    screen = _oled()
+    screen.contrast(resume.contrast)
     screen.fill(0)
     screen.text("Display Booting...", 0, 0)
     print(		"Display Booting...")
@@ -80,12 +150,16 @@ FM Radio via TEA5767
     - Controlled via Radio.set_frequency(float MHz)
 """
 try:
-    radio = Radio(i2c)
-    asyncio.sleep_ms(10)
+    # the constructor's update() IS the first tune: resumed station + mute,
+    # never a band-minimum blip first
     try:
-        radio.set_frequency(100.0)
-    except Exception as e:
-        print("Globals :: Radio Freq Fail e>", e)
+        radio = Radio(radio_i2c, freq=resume.tenths / 10, mute=resume.mute)
+    except OSError as e:
+        print("Globals :: Radio retry e>", e)
+        with bus.lock:
+            bus.recover()
+        radio = Radio(radio_i2c, freq=resume.tenths / 10, mute=resume.mute)
+    asyncio.sleep_ms(10)
     try:
         screen.text("Radio Booting...", 0, 8)
         print(		"Radio Booting...")
@@ -97,6 +171,40 @@ except Exception as e:
     radio = None
 asyncio.sleep_ms(10)
 # ───────────────────────────────────────────────────────────────
+# DISPLAY CLOCK CALIBRATION
+"""
+Fastest display clock that ACKs every frame
+    and leaves the radio reading back sanely.
+Radio transactions keep their own <= 400 kHz profile.
+"""
+if I2C_CALIBRATE and screen and bus:
+    try:
+        I2C_DISPLAY_FREQ = bus.calibrate_display(screen, radio)
+    except Exception as e:
+        print("Globals :: I2C Calibrate Fail e>", e)
+        oled_i2c.freq = I2C_DISPLAY_FREQ
+# ───────────────────────────────────────────────────────────────
+# BUS FAULT POLICY
+"""
+Boot is over; from here a failing device degrades instead of raising
+    (writes dropped, reads repeat the last good data, see I2CBus.py).
+Main runs bus.supervise(); a device that comes back is re-initialised here.
+"""
+def _oled_back():
+    # init_display() clears the buffer; keep what the UI last drew
+    frame = bytes(screen.buffer)
+    screen.init_display()
+    screen.contrast(resume.contrast)
+    screen.buffer[:] = frame
+    screen.show()
+
+if bus:
+    bus.strict = False
+    if screen:
+        oled_i2c.on_recover = _oled_back
+    if radio:
+        radio_i2c.on_recover = radio.write  # re-sends the tuning registers
+# ───────────────────────────────────────────────────────────────
 # CONVENIENCE IMPORTS
 """
 Exposes common modules & shortcuts
@@ -106,25 +214,74 @@ sleep = time.sleep
 Inputs = hal.Inputs
 CoarseEncoderStep = hal.CoarseEncoderStep
 # ───────────────────────────────────────────────────────────────
+# DISPLAY FLUSH WORKER
+"""
+show()/show_region() become a buffer copy; a _thread worker does the I2C.
+Attached before Telemetry/Mirror so they wrap the cheap submit.
+No _thread -> stays synchronous.
+"""
+if FLUSH_WORKER and screen:
+    flush_worker = FlushWorker(screen).attach()
+# ───────────────────────────────────────────────────────────────
+# TELEMETRY PROBES
+"""
+Hot driver paths, probed once at boot
+    Main adds the RadioTuner paths
+Set TELEMETRY = False to leave drivers untouched
+"""
+if TELEMETRY:
+    telemetry.calibrate()
+    telemetry.instrument(screen, "show", "show")
+    # Scene commits & overlays flush partial frames through show_region
+    telemetry.instrument(screen, "show_region", "s.reg")
+    telemetry.instrument(radio, "update", "r.upd")
+# ───────────────────────────────────────────────────────────────
+# SCREEN MIRROR
+"""
+Streams changed page spans to the PC viewer
+    python HostTools/mirror_view.py --port <serial>
+"""
+if MIRROR and screen:
+    mirror = Mirror(screen, max_fps=10).attach()
+# ───────────────────────────────────────────────────────────────
+# POPUP OVERLAY
+"""
+One per screen; saves only the pages a popup covers (1 KB buffer, preallocated).
+Main's scene paints under it; diagnostics, toasts & the menu draw on it.
+"""
+if screen:
+    overlay = Overlay(screen)
+# ───────────────────────────────────────────────────────────────
 # SYSTEM HEALTH / DEBUG
 """
 Optional, display boot diagnostics and versioning info
 For verifying startup chain integrity
 Could be fun for a Pip-Boy-Style startup
 """
-async def diagnostics(Holdopen = 1, summary = False): # 1-second default for debug
+async def diagnostics(Holdopen = 1, summary = False, pacer = None): # 1-second default for debug
     print("─────── SYSTEM DIAGNOSTICS ───────")
     print(f"SoftVers:	{SoftVers}")
     print(f"I2C: 		{i2c}")
+    print(f"I2C clk: 	oled {I2C_DISPLAY_FREQ} radio {I2C_FREQ}")
     print(f"OLED: 		{'OK' if screen else 'FAIL'}")
     print(f"Radio: 		{'OK' if radio else 'FAIL'}")
     print(f"HAL: 		{hal}")
     print(f"Asyncio: 	{asyncio}")
+    hal.Inputs.EncoderPins.report()
+    hal.Inputs.EncoderButton.report()
+    if bus:
+        bus.report()
+    if pacer:
+        pacer.report()    # dropped / coalesced / over-budget frames
     print("──────────────────────────────────")
-    if screen:
-        screen.fill(0)
-        screen.text("Diagnostics", 1, 0)
-        screen.text(f"Soft.V {SoftVers}", 1, 9)
+    if overlay:
+        # Full-screen overlay; whatever was showing comes back untouched
+        # Static rows are widgets too; painted by the overlay, then only
+        #   the countdown box repaints
+        page = Scene(screen)
+        page.add(Label(1, 0, 11, value="Diagnostics"))
+        soft = f"Soft.V {SoftVers}"
+        page.add(Label(1, 9, len(soft), value=soft))  # box = text; Scene clips at the edge
         y = 18
         for name, ok in [
             ("HAL  ", hal),
@@ -133,26 +290,42 @@ async def diagnostics(Holdopen = 1, summary = False): # 1-second default for deb
             ("RADIO", radio)
             ]:
             msg = f"{name} : {'OK' if ok else 'FAIL'}"
-            screen.text(msg, 0, y)
+            page.add(Label(0, y, len(msg), value=msg))
             y += 8 # smallest reasonable        
-        screen.show()
         
         # :: Creative Lisence ::
         # numerical hold-open count-down
         # three-digit, bottom right corner
         # Holdopen 	= 10
-        cornerX 	= 106 #106
+        cornerX 	= 104 #106, 3 chars must fit in 128
         cornerY 	= 57 #57
+        countdown = page.add(Countdown(cornerX, cornerY))
+        countdown.set(Holdopen)
+        full = (0, 0, screen.width, screen.height)
+        overlay.show(*full, lambda fb, x, y, w, h: page.repaint(fb),
+                     owner=diagnostics, border=False)
         for X in range(Holdopen, 0, -1):
-            #clears old digits (T-Left, B-Right, B-Left, B-Right, Colour)
-            screen.fill_rect(cornerX, cornerY, 24, 8, 0)
-            screen.text(str(X), 105, 57) # 105, 57
-            screen.show()
+            #only the counter box repaints after the first frame
+            countdown.set(X)
+            page.commit()
             print(str(X))
             await asyncio.sleep(1)
-            
-        screen.fill(0)
-        screen.show()
+
+        # Heap telemetry page; allocation per hot path + GC pauses
+        if TELEMETRY:
+            telemetry.report()
+            overlay.show(*full, lambda fb, x, y, w, h: telemetry.render(fb),
+                         owner=diagnostics, border=False)
+            await asyncio.sleep(Holdopen)
+
+        # Loop latency page; how late each task resumes, how long it runs
+        profiler.report()
+        overlay.show(*full, lambda fb, x, y, w, h: profiler.render(fb),
+                     owner=diagnostics, border=False)
+        await asyncio.sleep(Holdopen)
+
+        overlay.dismiss(diagnostics)
+        overlay.report()
         await asyncio.sleep_ms(10)
 # ───────────────────────────────────────────────────────────────
 # ENTRYPOINT — optional self-test
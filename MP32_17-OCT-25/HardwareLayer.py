@@ -30,11 +30,44 @@ All editorial choices, layout, comments, tinkering, testing, and style choices a
 """
 
 # IMPORTS
-from machine import Pin, I2C
+from machine import Pin, I2C, Timer
 import utime as time
 import uasyncio as asyncio
+from array import array
+# Loop latency histograms (standalone, no Globals)
+from Profiler import profiler
 # DONT IMPORT .PY
 
+# ───────────────────────────────────────────────────────────────
+# ENCODER INPUT MODES
+# IRQ    : FSM runs on every edge; cheapest when the contacts are clean
+# TIMER  : both pins sampled at ENC_SAMPLE_HZ, FSM only on a change;
+#          fixed cost, immune to bounce storms
+# auto_mode() flips between them on the measured edge rate (with hysteresis)
+MODE_IRQ = 0
+MODE_TIMER = 1
+ENC_AUTO_MODE = True
+ENC_TIMER_ID = 0        # hardware timer for sampled mode
+ENC_SAMPLE_HZ = 1000    # well above a fast spin (~100 edges/s)
+ENC_WINDOW_MS = 100     # rate measuring window
+ENC_STORM_HZ = 1500     # IRQ edges/s above this -> TIMER
+ENC_CALM_HZ = 100       # sampled changes/s below this...
+ENC_CALM_MS = 2000      # ...for this long -> back to IRQ
+
+# ───────────────────────────────────────────────────────────────
+# BUTTON GESTURES
+# Accepted edge -> pin IRQ masked for BTN_LOCKOUT_MS (one-shot timer unmasks)
+# ShortPress -> CoarseToggle, LongPress -> Seek up, DoubleClick -> settings Menu
+# While a menu is open (hal.modal) every gesture goes to it as ("Menu", gesture)
+BTN_TIMER_ID = 1        # one-shot lockout timer (encoder uses 0)
+BTN_LOCKOUT_MS = 25
+BTN_LONG_MS = 600       # held this long -> LongPress (fires while held)
+BTN_DOUBLE_MS = 250     # next press within this of release -> DoubleClick
+G_SHORT = 0
+G_LONG = 1
+G_DOUBLE = 2
+GESTURES = ("ShortPress", "LongPress", "DoubleClick")
+
 # ───────────────────────────────────────────────────────────────
 # HAL CORE
 """
@@ -60,6 +93,8 @@ class HAL:
         # Default is fine; the button flips it, IRQ style.
         self._coarse_toggle_pending = False
         self.CoarseEncoderStep = False
+        # True while a popup menu owns the button (Main keeps it in step)
+        self.modal = False
 
         # ───────────────────────────────────────────────────────
         # Structured namespace for all input devices
@@ -104,7 +139,7 @@ class HAL:
     
     ##yet another irq handler/wrapper ::
     def ToggleCoarse(self, pin=None):
-        "Called directly by encoder button IRQ"
+        "Called on a ShortPress gesture (was: every button IRQ)"
         self._coarse_toggle_pending = True
         self.mark_activity()
     # ───────────────────────────────────────────────────────────────
@@ -122,6 +157,16 @@ class HAL:
             #print("Poll Killer :: HAL Waking Poll Killer")
             self._polling_active = True
 
+    # ───────────────────────────────────────────────────────────────
+    # Button gestures -> one HAL event each
+    def _gesture(self, gesture):
+        if self.modal or gesture == G_DOUBLE:
+            self._update_queue.put_nowait(("Menu", gesture))
+        elif gesture == G_SHORT:
+            self.ToggleCoarse()
+        elif gesture == G_LONG:
+            self._update_queue.put_nowait(("Seek", 1))
+
     # ───────────────────────────────────────────────────────────────
     # Minimal Polling / Watchdog Task
     async def monitor_inputs(self):
@@ -144,8 +189,10 @@ class HAL:
             - Poll Killer: kills polling when idle
         """
         #print("Poll Killer :: Starting Monitor")
+        tid = profiler.task("hal")
         while True:
             if self._polling_active:
+                self.Inputs.EncoderButton.poll(self._gesture)
                 if self._coarse_toggle_pending:
                     self.CoarseEncoderStep = not self.CoarseEncoderStep
                     await self._update_queue.put(("CoarseToggle",
@@ -165,10 +212,18 @@ class HAL:
                 #print("Poll Killer :: Heart DOWN", self._polling_active) #Debug, DROWNS REPL
                 
                 # Sleep longer to save cycles while idle
+                profiler.sleeping(tid, self._poll_sleep_ms)
                 await asyncio.sleep_ms(self._poll_sleep_ms)
+                profiler.woke(tid)
+
+            # Encoder IRQ storm guard (IRQ <-> timer-sampled)
+            if ENC_AUTO_MODE:
+                self.Inputs.EncoderPins.auto_mode()
 
             #TaskStarvationStopper ::
+            profiler.sleeping(tid, 50)
             await asyncio.sleep_ms(50)
+            profiler.woke(tid)
  
             # Placeholder for future sensor expansion
             # e.g. self.Inputs.ExtraButton.was_pressed()
@@ -194,12 +249,11 @@ class HAL:
             self.EncoderPins = self.Encoder(left_pin=14, right_pin=26)
             self.EncoderPins.enable_irq() #already stated in .Encoder
 
-            # Encoder push-button: toggles Coarse/Fine
-            self.EncoderButton = self.Button(pin=27, pull=Pin.PULL_UP)
-            self.EncoderButton.pin.irq(
-                trigger=Pin.IRQ_FALLING,
-                handler=self.hal.ToggleCoarse
-            )
+            # Encoder push-button: debounced gestures
+            #   short = Coarse/Fine, long = seek up, double = menu (seek down lives there)
+            self.EncoderButton = self.GestureButton(pin=27, pull=Pin.PULL_UP)
+            self.EncoderButton.on_edge = self.hal.mark_activity
+            self.EncoderButton.enable()
         # ───────────────────────────────────────────────────────────────
         class Button:
             """
@@ -227,6 +281,130 @@ class HAL:
                     self.last_state = 1
                 return False
 
+        # ───────────────────────────────────────────────────────────────
+        class GestureButton(Button):
+            """
+            Time-debounced button; one gesture per press pattern.
+            IRQ side ::
+                accept a level change, stamp it, MASK the pin IRQ;
+                a one-shot timer unmasks after BTN_LOCKOUT_MS
+                and accepts a change that happened while masked.
+            HAL side ::
+                poll() turns stamped edges into
+                ShortPress / LongPress / DoubleClick.
+            """
+            EDGES = 8
+
+            def __init__(self, pin, pull=Pin.PULL_UP):
+                super().__init__(pin, pull)
+                self.level = self.pin.value()
+                self.on_edge = None             # e.g. hal.mark_activity
+                self.timer = Timer(BTN_TIMER_ID)
+                # Accepted edges (ring; IRQ writes head, poll reads tail)
+                self._t = array("l", [0] * self.EDGES)
+                self._lv = bytearray(self.EDGES)
+                self._head = 0
+                self._tail = 0
+                # Bound once; re-arming from IRQ context allocates nothing
+                self._irq_cb = self._irq
+                self._unmask_cb = self._unmask
+                # Gesture FSM
+                self.state = 0      # 0 idle, 1 down, 2 up (double window), 3 down again, 4 long held
+                self._t_down = 0
+                self._t_up = 0
+                # Stats
+                self.irqs = 0           # IRQ entries that got past the mask
+                self.accepted = 0       # debounced edges
+                self.dropped = 0        # ring full
+                self._pending_irqs = 0  # IRQs since the last gesture
+                self.gestures = array("L", [0, 0, 0])
+                self.gesture_irqs = array("L", [0, 0, 0])
+
+            def enable(self):
+                self.pin.irq(trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING,
+                             handler=self._irq_cb)
+
+            def _irq(self, pin):
+                self.irqs += 1
+                self._pending_irqs += 1
+                self._accept(pin.value())
+
+            def _accept(self, level):
+                if level == self.level:
+                    return          # bounce back to the accepted level
+                self.level = level
+                self.pin.irq(handler=None)
+                self.timer.init(mode=Timer.ONE_SHOT, period=BTN_LOCKOUT_MS,
+                                callback=self._unmask_cb)
+                nxt = (self._head + 1) % self.EDGES
+                if nxt == self._tail:
+                    self.dropped += 1
+                else:
+                    self._t[self._head] = time.ticks_ms()
+                    self._lv[self._head] = level
+                    self._head = nxt
+                    self.accepted += 1
+                if self.on_edge:
+                    self.on_edge()
+
+            def _unmask(self, timer):
+                self.enable()
+                # settled somewhere else while masked -> that's an edge too
+                self._accept(self.pin.value())
+
+            def poll(self, emit):
+                """HAL loop; emit(gesture) once per ShortPress/LongPress/DoubleClick"""
+                while self._tail != self._head:
+                    t = self._t[self._tail]
+                    pressed = self._lv[self._tail] == 0
+                    self._tail = (self._tail + 1) % self.EDGES
+                    self._step(pressed, t, emit)
+                now = time.ticks_ms()
+                if self.state == 1 and time.ticks_diff(now, self._t_down) >= BTN_LONG_MS:
+                    self.state = 4
+                    self._fire(G_LONG, emit)
+                elif self.state == 2 and time.ticks_diff(now, self._t_up) > BTN_DOUBLE_MS:
+                    self.state = 0
+                    self._fire(G_SHORT, emit)
+
+            def _step(self, pressed, t, emit):
+                state = self.state
+                if state == 0 and pressed:
+                    self.state, self._t_down = 1, t
+                elif state == 1 and not pressed:
+                    if time.ticks_diff(t, self._t_down) >= BTN_LONG_MS:
+                        self.state = 0
+                        self._fire(G_LONG, emit)      # poll ran late
+                    else:
+                        self.state, self._t_up = 2, t
+                elif state == 2 and pressed:
+                    if time.ticks_diff(t, self._t_up) <= BTN_DOUBLE_MS:
+                        self.state = 3
+                    else:
+                        self._fire(G_SHORT, emit)     # poll ran late
+                        self.state, self._t_down = 1, t
+                elif state == 3 and not pressed:
+                    self.state = 0
+                    self._fire(G_DOUBLE, emit)
+                elif state == 4 and not pressed:
+                    self.state = 0
+                    self.gesture_irqs[G_LONG] += self._pending_irqs
+                    self._pending_irqs = 0
+
+            def _fire(self, gesture, emit):
+                self.gestures[gesture] += 1
+                self.gesture_irqs[gesture] += self._pending_irqs
+                self._pending_irqs = 0
+                emit(gesture)
+
+            def report(self):
+                """IRQ load per gesture; 2 per click = clean, masked bounce never counts"""
+                print(f"Button :: irqs {self.irqs}  accepted {self.accepted}  dropped {self.dropped}")
+                for g in range(3):
+                    n = self.gestures[g]
+                    per = self.gesture_irqs[g] / n if n else 0
+                    print(f"  {GESTURES[g]:<12} {n:>5}  irqs/gesture {per:.1f}")
+
         # ───────────────────────────────────────────────────────────────
         class Encoder:
             """
@@ -240,6 +418,22 @@ class HAL:
                 self.position = 0
                 self.state = 0
                 self.irq_enabled = False
+                # Opt-in edge recorder (InputTrace.start_capture)
+                self.trace = None
+                # Input mode + cost accounting, per mode [IRQ, TIMER]
+                self.mode = MODE_IRQ
+                self.timer = None
+                self.edges = 0          # IRQ entries this window
+                self.changes = 0        # sampled pin changes this window
+                self.rate = 0           # last window's edges (or changes) per second
+                self.switches = 0
+                self._last_pins = 3
+                self._calm_ms = 0
+                self._window_t0 = time.ticks_ms()
+                self._mode_t0 = self._window_t0
+                self.cpu_us = array("L", [0, 0])
+                self.calls = array("L", [0, 0])
+                self.mode_ms = array("L", [0, 0])
 
             def read_pins(self):
                 return self.left.value(), self.right.value()
@@ -284,7 +478,16 @@ class HAL:
                 """
                 Safe wrapper for MicroPython Pin.irq #cant read 'Bool=None'
                 """
+                t0 = time.ticks_us()
+                self.edges += 1
+                trace = self.trace
+                if trace is not None:
+                    # stores into preallocated arrays; IRQ-safe
+                    trace.record(0 if pin is self.left else 1, pin.value(),
+                                 self.position, self.state)
                 changed = self.update()   # run FSM
+                self.cpu_us[MODE_IRQ] += time.ticks_diff(time.ticks_us(), t0)
+                self.calls[MODE_IRQ] += 1
                 """
                 AI SUGGESTED OPTINALS ::
                 # Optionally push to HAL queue here if needed:
@@ -305,6 +508,107 @@ class HAL:
                                handler=self.irq_handler)
                 self.irq_enabled = True
 
+            def disable_irq(self):
+                self.left.irq(handler=None)
+                self.right.irq(handler=None)
+                self.irq_enabled = False
+
+            # ───────────────────────────────────────────────────
+            # Timer-sampled mode
+            def timer_handler(self, timer):
+                """
+                Both pins every tick; FSM only when they moved.
+                Idle ticks are one read + one compare.
+                A fast turn can move both pins inside one tick; the FSM
+                    takes one state per call, so step it until it settles.
+                """
+                t0 = time.ticks_us()
+                pins = self.left.value() << 1 | self.right.value()
+                moved = pins ^ self._last_pins
+                if moved:
+                    trace = self.trace
+                    if trace is not None:
+                        if moved & 2:
+                            trace.record(0, pins >> 1, self.position, self.state)
+                        if moved & 1:
+                            trace.record(1, pins & 1, self.position, self.state)
+                    self._last_pins = pins
+                    self.changes += 1
+                    for _ in range(3):
+                        state = self.state
+                        self.update()
+                        if self.state == state:
+                            break
+                self.cpu_us[MODE_TIMER] += time.ticks_diff(time.ticks_us(), t0)
+                self.calls[MODE_TIMER] += 1
+
+            def enable_timer(self, hz=ENC_SAMPLE_HZ):
+                if self.timer:
+                    return
+                self.disable_irq()
+                self._last_pins = self.left.value() << 1 | self.right.value()
+                self.timer = Timer(ENC_TIMER_ID)
+                self.timer.init(mode=Timer.PERIODIC, freq=hz,
+                                callback=self.timer_handler)
+
+            def disable_timer(self):
+                if self.timer:
+                    self.timer.deinit()
+                    self.timer = None
+
+            def set_mode(self, mode):
+                """MODE_IRQ / MODE_TIMER; FSM state carries over"""
+                if mode == self.mode:
+                    return
+                now = time.ticks_ms()
+                self.mode_ms[self.mode] += time.ticks_diff(now, self._mode_t0)
+                self._mode_t0 = now
+                if mode == MODE_TIMER:
+                    self.enable_timer()
+                else:
+                    self.disable_timer()
+                    self.enable_irq()
+                self.mode = mode
+                self.switches += 1
+
+            def auto_mode(self):
+                """
+                Called from the HAL loop; no allocation.
+                IRQ edge rate > ENC_STORM_HZ -> TIMER at once,
+                sampled change rate < ENC_CALM_HZ for ENC_CALM_MS -> IRQ.
+                """
+                now = time.ticks_ms()
+                window = time.ticks_diff(now, self._window_t0)
+                if window < ENC_WINDOW_MS:
+                    return
+                self._window_t0 = now
+                if self.mode == MODE_IRQ:
+                    self.rate = self.edges * 1000 // window
+                    if self.rate > ENC_STORM_HZ:
+                        self._calm_ms = 0
+                        self.set_mode(MODE_TIMER)
+                else:
+                    self.rate = self.changes * 1000 // window
+                    if self.rate < ENC_CALM_HZ:
+                        self._calm_ms += window
+                        if self._calm_ms >= ENC_CALM_MS:
+                            self.set_mode(MODE_IRQ)
+                    else:
+                        self._calm_ms = 0
+                self.edges = 0
+                self.changes = 0
+
+            def report(self):
+                """Time, handler calls and CPU spent per mode"""
+                live = time.ticks_diff(time.ticks_ms(), self._mode_t0)
+                print(f"Encoder :: mode {('IRQ', 'TIMER')[self.mode]}  "
+                      f"switches {self.switches}  rate {self.rate}/s")
+                for m, name in ((MODE_IRQ, "IRQ"), (MODE_TIMER, "TIMER")):
+                    ms = self.mode_ms[m] + (live if m == self.mode else 0)
+                    pct = self.cpu_us[m] / (ms * 10) if ms else 0
+                    print(f"  {name:<5} {ms // 1000:>6} s  calls {self.calls[m]:>8}  "
+                          f"cpu {self.cpu_us[m] // 1000:>6} ms  ({pct:.2f}%)")
+
             def read(self):
                 """Current 'absolute' encoder position"""
                 return self.position
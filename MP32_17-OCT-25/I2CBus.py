@@ -0,0 +1,387 @@
+"""
+I2CBus.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"SHARED I2C BUS - PER-DEVICE CLOCK PROFILES"
+
+Display and radio share one bus.
+A single fixed clock means the SSD1306 framebuffer (1 KB a frame)
+    crawls along at the TEA5767's 400 kHz ceiling.
+
+Here each device gets its own clock profile ::
+    bus = SharedBus(I2C(0, ...), scl=22, sda=21, freq=400_000)
+    oled = bus.device("oled", 1_000_000)
+    fm   = bus.device("radio", 400_000)     # clamped to RADIO_MAX_FREQ
+    screen = SSD1306_I2C(128, 64, oled)     # drivers can't tell the difference
+
+A device proxy looks like machine.I2C (writeto/readfrom/writevto...)
+    and re-clocks the bus only when the *other* device spoke last.
+So bursts of display writes pay one re-clock, not one per call.
+
+Thread safety ::
+    every proxy transfer holds bus.lock (a _thread lock when the port has one),
+    so a second-core flush worker and the radio never interleave on the wire.
+
+Fault handling (bounded stalls) ::
+    timeout     every transfer is capped at timeout_us by the bus itself
+    retry       RETRIES more tries, backoff BACKOFF_US, x2 each time
+    recover()   timeout / SDA held low -> 9 SCL clocks + STOP, bus rebuilt;
+                at most once per call (a second one in a row rarely helps)
+    down        FAIL_LIMIT failed calls in a row -> device marked down;
+                its calls then cost nothing (writes dropped, reads
+                return the last good data) instead of stalling the loop
+    supervise() async task; re-probes down devices, runs their on_recover
+    strict      bus-wide; True = failures raise OSError (boot, calibration),
+                False = the above degrade-don't-crash behaviour (runtime)
+Worst single call ::
+    (RETRIES + 1) x timeout_us + backoffs + one recover()
+    and only until the device goes down. report() shows the real max.
+
+Extras ::
+    calibrate_display() - fastest display clock that stays stable
+    use_soft()          - swap hardware I2C <-> SoftI2C under the drivers
+    benchmark()         - time a full frame on both, report bytes/s
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+from machine import Pin, I2C, SoftI2C
+import uasyncio as asyncio
+import utime as time
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+# ───────────────────────────────────────────────────────────────
+# LIMITS
+RADIO_MAX_FREQ = 400_000        # TEA5767 datasheet: fast-mode max
+DISPLAY_CANDIDATES = (1_000_000, 800_000, 700_000, 600_000, 400_000)
+TIMEOUT_US = 50_000             # per transfer; a full frame at 400 kHz is ~25 ms
+RETRIES = 2                     # extra tries after the first
+BACKOFF_US = 200                # first retry delay, doubles
+FAIL_LIMIT = 3                  # failed calls in a row -> device down
+REPROBE_MS = 2000               # supervise() period
+CLOCKOUT = 9                    # SCL pulses; frees a slave mid-byte
+ETIMEDOUT = 116                 # MicroPython errno for a bus timeout
+
+
+class _NoLock:
+    """Single-threaded builds; same 'with' shape, no cost"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class SharedBus:
+    """
+    Owns the bus object and its current clock.
+    Hardware I2C re-init costs a driver reinstall (~100s of us);
+    SoftI2C re-clock is just a delay change.
+    """
+    def __init__(self, i2c, scl, sda, freq, bus_id=0, timeout_us=TIMEOUT_US):
+        self.i2c = i2c
+        self.scl = scl
+        self.sda = sda
+        self.bus_id = bus_id
+        self.freq = freq
+        self.soft = isinstance(i2c, SoftI2C)
+        self.devices = []
+        self.switches = 0           # re-clocks so far; high = devices interleaving
+        self.lock = _thread.allocate_lock() if _thread else _NoLock()
+        self.timeout_us = timeout_us
+        self.strict = True          # boot: let failures raise
+        self.recoveries = 0
+        self.stuck = 0              # recoveries that found SDA held low
+
+    # ───────────────────────────────────────────────────────────
+    # CLOCKING
+    def clock(self, freq):
+        """Re-clocks the bus if needed; cheap no-op when already there"""
+        if freq == self.freq:
+            return
+        self.i2c.init(scl=Pin(self.scl), sda=Pin(self.sda), freq=freq,
+                      timeout=self.timeout_us)
+        self.freq = freq
+        self.switches += 1
+
+    def device(self, name, freq, max_freq=None):
+        """New per-device proxy; hand it to a driver in place of I2C"""
+        if max_freq:
+            freq = min(freq, max_freq)
+        dev = BusDevice(self, name, freq, max_freq)
+        self.devices.append(dev)
+        return dev
+
+    def scan(self):
+        return self.i2c.scan()
+
+    # ───────────────────────────────────────────────────────────
+    # HARDWARE / SOFTWARE SWAP
+    def use_soft(self, soft=True):
+        """
+        Rebuilds the bus as SoftI2C (bit-banged) or hardware I2C,
+        same pins, current clock. Proxies follow automatically.
+        """
+        if soft == self.soft:
+            return
+        self.soft = soft
+        self._build()
+
+    def _build(self):
+        if self.soft:
+            self.i2c = SoftI2C(scl=Pin(self.scl), sda=Pin(self.sda), freq=self.freq,
+                               timeout=self.timeout_us)
+        else:
+            self.i2c = I2C(self.bus_id, scl=Pin(self.scl), sda=Pin(self.sda),
+                           freq=self.freq, timeout=self.timeout_us)
+
+    # ───────────────────────────────────────────────────────────
+    # FAULT RECOVERY
+    def recover(self):
+        """
+        Bus-clear (I2C spec 3.1.16): a slave reset mid-read can hold SDA low
+            forever. Clock SCL until it lets go (max 9), STOP, rebuild the bus.
+        Call with bus.lock held (proxies do). Returns True if SDA is free.
+        """
+        scl = Pin(self.scl, Pin.OPEN_DRAIN, value=1)
+        sda = Pin(self.sda, Pin.OPEN_DRAIN, value=1)
+        time.sleep_us(5)
+        if not sda.value():
+            self.stuck += 1
+        for _ in range(CLOCKOUT):
+            if sda.value():
+                break
+            scl.value(0)
+            time.sleep_us(5)
+            scl.value(1)
+            time.sleep_us(5)
+        # STOP: SDA low -> high while SCL is high
+        sda.value(0)
+        time.sleep_us(5)
+        scl.value(1)
+        time.sleep_us(5)
+        sda.value(1)
+        time.sleep_us(5)
+        free = sda.value() == 1
+        self._build()
+        self.recoveries += 1
+        return free
+
+    def reprobe(self, dev):
+        """Empty write to a down device; back up -> its on_recover runs"""
+        try:
+            with self.lock:
+                self.clock(dev.freq)
+                self.i2c.writeto(dev.addr, b"")
+        except OSError:
+            return False
+        dev.down = False
+        dev.fails = 0
+        dev.revived += 1
+        print("I2CBus ::", dev.name, "back up")
+        if dev.on_recover:
+            try:
+                dev.on_recover()
+            except Exception as e:
+                print("I2CBus ::", dev.name, "re-init fail e>", e)
+        return True
+
+    async def supervise(self, period_ms=REPROBE_MS):
+        """Background task; only devices that went down cost any bus time"""
+        while True:
+            await asyncio.sleep_ms(period_ms)
+            for dev in self.devices:
+                if dev.down and dev.addr is not None:
+                    self.reprobe(dev)
+
+    def report(self):
+        print(f"I2CBus :: {'soft' if self.soft else 'hw'} @{self.freq}  "
+              f"switches {self.switches} recoveries {self.recoveries} stuck {self.stuck}")
+        print(f"  {'dev':<6}{'calls':>7}{'err':>5}{'retry':>6}{'t/o':>5}{'drop':>6}"
+              f"{'avg':>6}{'max us':>8}")
+        for dev in self.devices:
+            avg = dev.us_total // dev.calls if dev.calls else 0
+            print(f"  {dev.name:<6}{dev.calls:>7}{dev.errors:>5}{dev.retries:>6}"
+                  f"{dev.timeouts:>5}{dev.dropped:>6}{avg:>6}{dev.us_max:>8}"
+                  f"{'  DOWN' if dev.down else ''}")
+
+    # ───────────────────────────────────────────────────────────
+    # CALIBRATION
+    def calibrate_display(self, screen, radio=None,
+                          candidates=DISPLAY_CANDIDATES, rounds=8):
+        """
+        Walks candidates fastest-first; keeps the first clock where ::
+            - every display frame ACKs (no OSError) for 'rounds' frames
+            - the radio, clocked back at its own rate, still reads back sanely
+        The SSD1306 is write-only over I2C, so ACKs + a healthy neighbour
+            are the best stability evidence available.
+        Returns the chosen clock (and applies it to the display proxy).
+        """
+        dev = screen.i2c
+        strict = self.strict
+        self.strict = True          # failures must surface here
+        chosen = None
+        for freq in candidates:
+            dev.freq = freq
+            try:
+                for _ in range(rounds):
+                    screen.show()
+                if radio is not None and not _radio_sane(radio):
+                    raise OSError("radio readback drifted")
+                chosen = freq
+                break
+            except OSError as e:
+                print("I2CBus :: display unstable @", freq, "e>", e)
+                time.sleep_ms(5)
+        if chosen is None:
+            chosen = candidates[-1]
+        dev.freq = chosen
+        self.strict = strict
+        for d in self.devices:      # probing failures aren't faults
+            d.fails = 0
+            d.down = False
+        print("I2CBus :: display clock", chosen)
+        return chosen
+
+    def benchmark(self, screen, rounds=10):
+        """
+        Full-frame show() timing; hardware I2C vs SoftI2C at the display clock.
+        Returns {"hw": us_per_frame, "soft": us_per_frame}; prints bytes/s.
+        Leaves the bus as it found it.
+        """
+        was_soft = self.soft
+        results = {}
+        frame = len(screen.buffer)
+        for label, soft in (("hw", False), ("soft", True)):
+            self.use_soft(soft)
+            screen.show()                       # warm-up + clock
+            t0 = time.ticks_us()
+            for _ in range(rounds):
+                screen.show()
+            per = time.ticks_diff(time.ticks_us(), t0) // rounds
+            results[label] = per
+            print("I2CBus :: {:<4} {:>6} us/frame {:>7} B/s".format(
+                label, per, frame * 1_000_000 // max(per, 1)))
+        self.use_soft(was_soft)
+        return results
+
+
+def _radio_sane(radio):
+    """Re-reads TEA5767 status; frequency should match what it was told"""
+    told = radio.frequency
+    radio.read()
+    ok = abs(radio.frequency - told) < 0.15
+    radio.frequency = told
+    return ok
+
+
+# ───────────────────────────────────────────────────────────────
+# DEVICE PROXY
+class BusDevice:
+    """
+    Quacks like machine.I2C for one device.
+    Every call first makes sure the bus runs at this device's clock,
+        then goes through _transfer (retry / recover / down / counters).
+    """
+    def __init__(self, bus, name, freq, max_freq=None):
+        self.bus = bus
+        self.name = name
+        self.freq = freq
+        self.max_freq = max_freq
+        self.addr = None            # learnt from the first call; for re-probing
+        self.down = False
+        self.fails = 0              # failed calls in a row
+        self.on_recover = None      # re-init callback once re-probed OK
+        self._last = None           # last good readfrom() result
+        # Stats
+        self.calls = 0
+        self.errors = 0             # failed attempts (incl. retried ones)
+        self.retries = 0
+        self.timeouts = 0
+        self.dropped = 0            # calls given up on, or skipped while down
+        self.revived = 0
+        self.us_total = 0
+        self.us_max = 0             # worst call incl. retries; the loop stall
+
+    def _transfer(self, op, addr, arg, stop):
+        """op names the machine.I2C method; looked up per try (recover rebuilds i2c)"""
+        bus = self.bus
+        self.addr = addr
+        if self.down and not bus.strict:
+            self.dropped += 1
+            return self._fallback(op, arg)
+        self.calls += 1
+        t0 = time.ticks_us()
+        attempt = 0
+        recovered = False
+        while True:
+            try:
+                with bus.lock:
+                    bus.clock(self.freq)
+                    result = getattr(bus.i2c, op)(addr, arg, stop)
+                break
+            except OSError as e:
+                self.errors += 1
+                if e.args and e.args[0] == ETIMEDOUT:
+                    self.timeouts += 1
+                    if not recovered:
+                        recovered = True
+                        with bus.lock:
+                            bus.recover()
+                if attempt >= RETRIES:
+                    self._account(t0)
+                    self.fails += 1
+                    if bus.strict:
+                        raise
+                    if self.fails >= FAIL_LIMIT and not self.down:
+                        self.down = True
+                        print("I2CBus ::", self.name, "down e>", e)
+                    self.dropped += 1
+                    return self._fallback(op, arg)
+                self.retries += 1
+                time.sleep_us(BACKOFF_US << attempt)
+                attempt += 1
+        self.fails = 0
+        if op == "readfrom":
+            self._last = result
+        self._account(t0)
+        return result
+
+    def _account(self, t0):
+        dt = time.ticks_diff(time.ticks_us(), t0)
+        self.us_total += dt
+        if dt > self.us_max:
+            self.us_max = dt
+
+    def _fallback(self, op, arg):
+        """Give-up value: writes vanish, reads repeat the last good data"""
+        if op == "readfrom":
+            if self._last is not None and len(self._last) == arg:
+                return self._last
+            return bytes(arg)
+        return None                 # readfrom_into leaves buf as it was
+
+    def writeto(self, addr, buf, stop=True):
+        return self._transfer("writeto", addr, buf, stop)
+
+    def writevto(self, addr, bufs, stop=True):
+        return self._transfer("writevto", addr, bufs, stop)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        return self._transfer("readfrom", addr, nbytes, stop)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        return self._transfer("readfrom_into", addr, buf, stop)
+
+    def scan(self):
+        with self.bus.lock:
+            self.bus.clock(self.freq)
+            return self.bus.i2c.scan()
+
+    def __repr__(self):
+        return "<BusDevice {} @{}{}>".format(self.name, self.freq,
+                                             " DOWN" if self.down else "")
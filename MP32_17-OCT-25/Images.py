@@ -0,0 +1,81 @@
+"""
+Images.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"ZERO-COPY IMAGE ASSETS"
+
+Boot art arrives pre-baked by HostTools/img2vlsb.py;
+    Assets/<name>.py  ->  WIDTH, HEIGHT, DATA (MONO_VLSB bytes)
+No BMP decode on the board, no pixel loops at boot.
+
+load(name) returns something screen.blit() accepts,
+    without copying DATA ::
+        1. FrameBuffer over memoryview(DATA)  (firmware that takes read-only buffers)
+        2. (DATA, w, h, MONO_VLSB) blit tuple (MicroPython 1.20+)
+        3. FrameBuffer over bytearray(DATA)   (old firmware; one copy, last resort)
+
+Flash residency ::
+    Frozen into firmware (or mpy-cross'd), DATA is a bytes constant in flash;
+    as plain .py it's compiled into RAM once on import.
+
+Usage ::
+    import Images
+    raven = Images.load("raven")
+    screen.blit(raven, 0, 7)
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import framebuf
+
+# Loaded images, by name; avoids re-wrapping on every boot frame
+_cache = {}
+
+
+def asset(name):
+    """Imports Assets/<name>.py; returns the module"""
+    return getattr(__import__("Assets." + name), name)
+
+
+def size(name):
+    mod = asset(name)
+    return mod.WIDTH, mod.HEIGHT
+
+
+def load(name):
+    """Blit-able image for name; cached, never copies unless firmware forces it"""
+    img = _cache.get(name)
+    if img is not None:
+        return img
+    mod = asset(name)
+    data = mod.DATA
+    try:
+        img = framebuf.FrameBuffer(memoryview(data), mod.WIDTH, mod.HEIGHT,
+                                   framebuf.MONO_VLSB)
+    except (TypeError, ValueError):
+        img = (data, mod.WIDTH, mod.HEIGHT, framebuf.MONO_VLSB)
+        if not _blit_takes_tuples():
+            print("Images :: old firmware, copying", name)
+            img = framebuf.FrameBuffer(bytearray(data), mod.WIDTH, mod.HEIGHT,
+                                       framebuf.MONO_VLSB)
+    _cache[name] = img
+    return img
+
+
+def _blit_takes_tuples():
+    """Probe once; 1x8 scratch FrameBuffer, 1-byte source"""
+    probe = framebuf.FrameBuffer(bytearray(1), 1, 8, framebuf.MONO_VLSB)
+    try:
+        probe.blit((b"\x00", 1, 8, framebuf.MONO_VLSB), 0, 0)
+        return True
+    except TypeError:
+        return False
+
+
+def unload(name=None):
+    """Drops cached images (all, if name is None)"""
+    if name is None:
+        _cache.clear()
+    else:
+        _cache.pop(name, None)
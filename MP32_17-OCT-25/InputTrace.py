@@ -0,0 +1,275 @@
+"""
+InputTrace.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"ENCODER TRACE CAPTURE & DETERMINISTIC REPLAY"
+
+Encoder bugs only show up under a real hand.
+So: record the hand once, replay it forever.
+
+CAPTURE (opt-in, IRQ-safe) ::
+    trace = start_capture(hal.Inputs.EncoderPins)   # attaches a ring buffer
+    ... twiddle the knob ...
+    stop_capture(hal.Inputs.EncoderPins, "/enc_trace.bin")
+  Each edge -> (ticks_us, pin, level) into preallocated arrays, plus the
+  encoder's position and FSM state just before it (so a wrapped ring knows
+  where its oldest event started); no allocation, no prints, stores only.
+  A wrapped ring is written from its oldest surviving event at rest
+  (FSM idle, first edge of a detent); the header's start_pos is the
+  position there, so the replay still checks the end position.
+
+REPLAY ::
+    events, meta = load("/enc_trace.bin")
+    result = Replay(encoder, tuner).run(events, speed=1)   # 1 = real time
+    result = Replay(encoder).run(events, speed=0)          # 0 = flat out
+  Pins are swapped for StandInPins and the real irq_handler -> update()
+  FSM runs, then RadioTuner.update_frequency() if a tuner is given.
+  result.ok is True when the replay lands on the captured end position.
+
+On a PC ::
+    python HostTools/replay_trace.py enc_trace.bin
+
+File layout (little endian) ::
+    header  'ENCT' u16 version, u16 count, i32 start_pos, i32 end_pos
+    records u32 ticks_us, u8 pin (0 = left, 1 = right), u8 level
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import struct
+import utime as time
+from array import array
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# FORMAT
+MAGIC = b"ENCT"
+VERSION = const(1)
+HEADER = "<4sHHii"
+RECORD = "<IBB"
+DEFAULT_CAPACITY = const(1024)
+DEFAULT_PATH = "/enc_trace.bin"
+
+
+# ───────────────────────────────────────────────────────────────
+# CAPTURE
+class TraceRecorder:
+    """
+    Fixed ring buffer of edge events.
+    Oldest events are overwritten once full; 'total' keeps counting.
+    """
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.ticks = array("L", [0] * capacity)
+        self.pins = bytearray(capacity)
+        self.levels = bytearray(capacity)
+        self.positions = array("l", [0] * capacity)    # encoder position before the edge
+        self.states = bytearray(capacity)               # FSM state before the edge
+        self.head = 0
+        self.total = 0
+        self.start_pos = 0
+        self.end_pos = 0
+
+    def record(self, pin, level, position, state):
+        """IRQ context; stores only"""
+        i = self.head
+        self.ticks[i] = time.ticks_us()
+        self.pins[i] = pin
+        self.levels[i] = level
+        self.positions[i] = position
+        self.states[i] = state
+        i += 1
+        self.head = 0 if i == self.capacity else i
+        self.total += 1
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def events(self, skip=0):
+        """Chronological (ticks_us, pin, level); oldest surviving first"""
+        n = len(self)
+        start = self.head - n
+        for k in range(skip, n):
+            i = (start + k) % self.capacity
+            yield self.ticks[i], self.pins[i], self.levels[i]
+
+    def _resume_point(self):
+        """
+        (events to skip, position there). Unwrapped: (0, start_pos).
+        Wrapped: the oldest surviving edge the FSM took at rest (idle state,
+            both pins high, this edge falling) - where a replay can start cold.
+        """
+        if self.total <= self.capacity:
+            return 0, self.start_pos
+        n = self.capacity
+        for k in range(n):
+            i = (self.head + k) % n
+            if self.states[i] == 0 and self.levels[i] == 0:
+                return k, self.positions[i]
+        return n, self.end_pos          # never at rest; nothing replayable
+
+    def dump(self, path=DEFAULT_PATH):
+        skip, start_pos = self._resume_point()
+        count = len(self) - skip
+        with open(path, "wb") as f:
+            f.write(struct.pack(HEADER, MAGIC, VERSION, count, start_pos, self.end_pos))
+            rec = bytearray(struct.calcsize(RECORD))
+            for t, pin, level in self.events(skip):
+                struct.pack_into(RECORD, rec, 0, t, pin, level)
+                f.write(rec)
+        return count
+
+
+def start_capture(encoder, capacity=DEFAULT_CAPACITY):
+    """Attaches a fresh recorder to encoder.irq_handler"""
+    trace = TraceRecorder(capacity)
+    trace.start_pos = encoder.position
+    encoder.trace = trace
+    return trace
+
+
+def stop_capture(encoder, path=DEFAULT_PATH):
+    """Detaches the recorder, writes it to flash; returns events written"""
+    trace = encoder.trace
+    encoder.trace = None
+    if trace is None:
+        return 0
+    trace.end_pos = encoder.position
+    written = trace.dump(path)
+    if written < trace.total:
+        # ring wrapped; the file starts at the oldest event the FSM was at rest
+        print("InputTrace :: ring wrapped, dropped", trace.total - written)
+    return written
+
+
+def load(path=DEFAULT_PATH):
+    """Returns (events list, meta dict)"""
+    with open(path, "rb") as f:
+        head = f.read(struct.calcsize(HEADER))
+        magic, version, count, start_pos, end_pos = struct.unpack(HEADER, head)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("InputTrace :: not a trace file")
+        size = struct.calcsize(RECORD)
+        events = []
+        for _ in range(count):
+            events.append(struct.unpack(RECORD, f.read(size)))
+    return events, {"count": count, "start_pos": start_pos, "end_pos": end_pos}
+
+
+# ───────────────────────────────────────────────────────────────
+# REPLAY
+class StandInPin:
+    """Quacks like machine.Pin for the encoder FSM; level set by the replay"""
+    def __init__(self, level=1):
+        self.level = level
+
+    def value(self, v=None):
+        if v is None:
+            return self.level
+        self.level = v
+
+    def irq(self, *args, **kwargs):
+        return None
+
+
+class ReplayResult:
+    def __init__(self):
+        self.events = 0
+        self.steps = 0              # position changes seen by the FSM
+        self.retunes = 0            # update_frequency() calls that retuned
+        self.end_pos = 0
+        self.expected_pos = None
+        self.freq_tenths = None
+        self.handler_us_max = 0
+        self.handler_us_total = 0
+        self.tune_us_max = 0
+        self.late_us_max = 0        # real-time replay drift behind the trace
+
+    @property
+    def ok(self):
+        return self.expected_pos is None or self.end_pos == self.expected_pos
+
+    def report(self):
+        print("─────── ENCODER REPLAY ───────")
+        print(f"events {self.events}  steps {self.steps}  retunes {self.retunes}")
+        print(f"end pos {self.end_pos}  expected {self.expected_pos}  ok {self.ok}")
+        if self.freq_tenths is not None:
+            print(f"freq tenths {self.freq_tenths}")
+        avg = self.handler_us_total // self.events if self.events else 0
+        print(f"irq_handler us avg {avg} max {self.handler_us_max}")
+        print(f"update_frequency us max {self.tune_us_max}  drift us max {self.late_us_max}")
+        print("──────────────────────────────")
+
+
+class Replay:
+    """
+    Drives a captured trace through the real encoder FSM (and tuner).
+    Restores the real pins, trace, position, FSM state and the tuner's
+    last_pos afterwards, even on error; the live knob carries on as before.
+    """
+    def __init__(self, encoder, tuner=None):
+        self.encoder = encoder
+        self.tuner = tuner
+
+    def run(self, events, speed=1, meta=None):
+        """
+        speed : 1 = original timing, 4 = four times faster, 0 = no waiting
+        """
+        enc = self.encoder
+        result = ReplayResult()
+        pins = (StandInPin(1), StandInPin(1))
+        real = (enc.left, enc.right)
+        saved_trace = getattr(enc, "trace", None)
+        saved_pos, saved_state = enc.position, enc.state
+        saved_last = self.tuner.last_pos if self.tuner else None
+        enc.left, enc.right = pins
+        enc.trace = None
+        if meta:
+            enc.position = meta["start_pos"]
+            result.expected_pos = meta["end_pos"]
+        enc.state = 0
+        if self.tuner:
+            self.tuner.last_pos = enc.position
+        try:
+            t_first = events[0][0] if events else 0
+            t_start = time.ticks_us()
+            for t, pin, level in events:
+                if speed:
+                    due = int(time.ticks_diff(t, t_first) / speed)
+                    while True:
+                        lag = time.ticks_diff(time.ticks_us(), t_start) - due
+                        if lag >= 0:
+                            break
+                        if lag < -2000:
+                            time.sleep_us(1000)
+                    if lag > result.late_us_max:
+                        result.late_us_max = lag
+                pins[pin].level = level
+                before = enc.position
+                t0 = time.ticks_us()
+                enc.irq_handler(pins[pin])
+                dt = time.ticks_diff(time.ticks_us(), t0)
+                result.handler_us_total += dt
+                if dt > result.handler_us_max:
+                    result.handler_us_max = dt
+                if enc.position != before:
+                    result.steps += 1
+                    if self.tuner:
+                        t0 = time.ticks_us()
+                        if self.tuner.update_frequency():
+                            result.retunes += 1
+                        dt = time.ticks_diff(time.ticks_us(), t0)
+                        if dt > result.tune_us_max:
+                            result.tune_us_max = dt
+                result.events += 1
+            result.end_pos = enc.position
+            if self.tuner:
+                result.freq_tenths = self.tuner.freq_tenths
+        finally:
+            enc.left, enc.right = real
+            enc.trace = saved_trace
+            enc.position, enc.state = saved_pos, saved_state
+            if self.tuner:
+                self.tuner.last_pos = saved_last
+        return result
@@ -28,13 +28,30 @@ import utime as time
 
 # Internal modules
 from HardwareLayer import hal
-from Globals import screen, radio, sleep
+from Globals import screen, radio, sleep, TELEMETRY, mirror
+from Globals import REMOTE, WIFI_SSID, WIFI_KEY
+from Globals import SIGNAL_LOG, SIGNAL_LOG_MS
+from Globals import resume, bus, overlay, diagnostics
+from Telemetry import telemetry
+from Profiler import profiler
+from Widgets import Scene, FreqReadout, ModeLabel, SignalBar, StereoIcon, TuningDial
+from Seek import Seeker
+from ScanList import ScanList
+from RemoteServer import RemoteServer, wifi_up
+from SignalLog import SignalLog
+from Renderer import FramePacer
+from Overlay import Toast, Menu
+from HardwareLayer import G_SHORT
 
 # ───────────────────────────────────────────────────────────────
 # CONSTANTS / LIMITS
 FM_MIN_TENTHS = 875     # 87.5 MHz lower clamp
 FM_MAX_TENTHS = 1080    # 108.0 MHz upper clamp
-FM_DEFAULT = 100.0      # startup frequency
+PRESET_SLOTS = 8        # remote-control presets (tenths)
+RENDER_FPS = 30         # frame cap while tuning
+IDLE_FPS = 1            # ambient refresh (signal bar) when idle
+INPUT_MS = 20           # input loop period; drawing no longer rides on it
+CONTRAST_STEPS = (0x10, 0x40, 0x80, 0xFF)   # settings menu cycles these
 
 # ───────────────────────────────────────────────────────────────
 # STATE WRAPPER
@@ -51,10 +68,29 @@ class RadioTuner:
         # Create encoder instance (using HAL .sub-class)
         self.encoder = hal.Inputs.EncoderPins
         self.encoder.enable_irq()
-        # Local state caches
-        self.freq_tenths = int(FM_DEFAULT * 10)
+        # Local state caches (resumed; Globals already tuned the radio here)
+        self.freq_tenths = max(FM_MIN_TENTHS, min(FM_MAX_TENTHS, resume.tenths))
         self.last_pos = self.encoder.read()
-        self.freq = FM_DEFAULT
+        self.freq = self.freq_tenths / 10.0
+        # Retained-mode UI; each widget repaints only its own box
+        self.scene = Scene(screen, overlay)
+        self.mode_label = self.scene.add(ModeLabel(0, 0))
+        self.stereo_icon = self.scene.add(StereoIcon(112, 0))
+        self.dial = self.scene.add(TuningDial(8, 128, FM_MIN_TENTHS, FM_MAX_TENTHS))
+        self.freq_readout = self.scene.add(FreqReadout(30, 30))
+        self.signal_bar = self.scene.add(SignalBar(0, 56, 48, 8))
+        self.scene.invalidate(clear=True)
+        # Async coarse-to-fine station seek
+        self.seeker = Seeker(radio) if radio else None
+        # Preset slots (tenths); None = empty
+        self.presets = [None] * PRESET_SLOTS
+        # Scan-list monitor over the presets; slot 0 is the priority channel
+        self.scanner = ScanList(radio) if radio else None
+        # Popups over the scene; dismissing one restores the pages it covered
+        self.toast = Toast(overlay) if overlay else None
+        self.menu = Menu(overlay, self._menu_items()) if overlay else None
+        # Frame pacer; set by main(), reported by diagnostics
+        self.pacer = None
         
     # ───────────────────────────────────────────────────────────
     def update_frequency(self):
@@ -66,8 +102,19 @@ class RadioTuner:
         pos = self.encoder.read()
         if pos == self.last_pos:
             return False  # no change; skip redraw
+        if self.scanner and self.scanner.busy:
+            self.scanner.stop()  # any turn ends a scan, like a scanner's knob
+            self.last_pos = pos
+            return False
+        if self.seeker and self.seeker.busy:
+            self.last_pos = pos  # seek owns the tuner; swallow turns
+            return False
         delta = pos - self.last_pos #delta=change in val
         self.last_pos = pos
+        if self.menu and self.menu.is_open:
+            self.menu.move(delta)  # menu owns the knob while open
+            hal.mark_activity()
+            return False
         # Coarse / Fine tuning toggle from .HAL
         step = 10 if hal.CoarseEncoderStep else 1
         self.freq_tenths += delta * step
@@ -80,16 +127,155 @@ class RadioTuner:
         hal.mark_activity()
         return True
 
+    # ───────────────────────────────────────────────────────────
+    def tune_to(self, tenths):
+        """
+        Jump straight to a frequency (seek result, remote, preset)
+        Same clamp & radio push as the encoder path
+        """
+        self.freq_tenths = max(FM_MIN_TENTHS, min(FM_MAX_TENTHS, tenths))
+        self.freq = self.freq_tenths / 10.0
+        radio.set_frequency(self.freq)
+        hal.mark_activity()
+        hal._update_queue.put_nowait(("Tuned", self.freq_tenths))
+
+    def status(self):
+        """(tenths, ADC level, stereo) for remote clients"""
+        if radio:
+            return self.freq_tenths, radio.signal_adc_level, radio.is_stereo
+        return self.freq_tenths, 0, False
+
+    def _slot(self, slot):
+        # no negative indexing; -1 must not quietly mean the last slot
+        if not 0 <= slot < PRESET_SLOTS:
+            raise IndexError("preset slot 0..{}".format(PRESET_SLOTS - 1))
+        return slot
+
+    def store_preset(self, slot):
+        self.presets[self._slot(slot)] = self.freq_tenths
+
+    def recall_preset(self, slot):
+        tenths = self.presets[self._slot(slot)]
+        if tenths is not None:
+            self.tune_to(tenths)
+        return tenths
+
+    async def seek(self, direction=1):
+        """
+        Next station up/down; runs as its own task so the loop keeps drawing.
+        Returns found tenths or None.
+        """
+        if not self.seeker or self.busy():
+            return None
+        found = await self.seeker.seek(direction, self.freq_tenths)
+        if found is not None:
+            self.tune_to(found)
+        print("MAIN :: Seek", found, self.seeker.latency_ms, "ms",
+              self.seeker.probes, "probes")
+        return found
+
+    async def scan(self):
+        """
+        Monitors the filled presets (slot 0 = priority) until one breaks
+        squelch; own task, like seek. Returns found tenths or None.
+        """
+        if not self.scanner or self.busy():
+            return None
+        self.scanner.set_list(self.presets[1:], self.presets[0])
+        found = await self.scanner.scan()
+        if found is not None:
+            self.tune_to(found)
+        self.scanner.report()
+        return found
+
+    def stop_scan(self):
+        if self.scanner:
+            self.scanner.stop()
+
+    def busy(self):
+        """Seek or scan owns the radio (mutes, hops); others keep off it"""
+        return bool((self.seeker and self.seeker.busy)
+                    or (self.scanner and self.scanner.busy))
+
+    # ───────────────────────────────────────────────────────────
+    # POPUPS
+    def _menu_items(self):
+        """(label, action); labels read live. True from an action closes the menu"""
+        return [
+            (lambda: "Seek up", lambda: self._spawn(self.seek(1))),
+            (lambda: "Seek down", lambda: self._spawn(self.seek(-1))),
+            (lambda: "Scan presets", lambda: self._spawn(self.scan())),
+            (lambda: "Step " + ("Coarse" if hal.CoarseEncoderStep else "Fine"),
+             self._toggle_step),
+            (lambda: "Mute " + ("on" if radio and radio.mute_mode else "off"),
+             self._toggle_mute),
+            (lambda: "Contrast {}".format(resume.contrast), self._next_contrast),
+            (lambda: "Diagnostics", lambda: self._spawn(diagnostics(2, pacer=self.pacer))),
+            (lambda: "Close", lambda: True),
+        ]
+
+    def _spawn(self, coro):
+        asyncio.create_task(coro)
+        return True
+
+    def _toggle_step(self):
+        hal.CoarseEncoderStep = not hal.CoarseEncoderStep
+
+    def _toggle_mute(self):
+        if radio:
+            radio.mute(not radio.mute_mode)
+
+    def _next_contrast(self):
+        steps = CONTRAST_STEPS
+        c = steps[0]
+        for s in steps:
+            if s > resume.contrast:
+                c = s
+                break
+        screen.contrast(c)
+        resume.set_contrast(c)
+
+    def menu_gesture(self, gesture):
+        """DoubleClick opens; inside, ShortPress picks, anything else closes"""
+        if not self.menu:
+            return
+        if not self.menu.is_open:
+            if self.toast:
+                self.toast.hide()
+            self.menu.open()
+        elif gesture == G_SHORT:
+            self.menu.press()
+        else:
+            self.menu.close()
+
+    def close_popups(self):
+        if self.menu:
+            self.menu.close()
+        if self.toast:
+            self.toast.hide()
+
     # ───────────────────────────────────────────────────────────
     def draw_display(self):
         """
         OLED UI.
+        Feeds current values to the widgets;
+            unchanged widgets stay clean,
+            commit() flushes only the dirty pages.
         """
-        screen.fill(0)
-        screen.text(f"FM: {self.freq:.1f}", 30, 30)
-        mode = "Coarse" if hal.CoarseEncoderStep else "Fine"
-        screen.text(f"Mode: {mode}", 0, 0)
-        screen.show()
+        self.freq_readout.set(self.freq_tenths)
+        self.dial.set(self.freq_tenths)
+        self.mode_label.set(hal.CoarseEncoderStep)
+        if radio:
+            self.signal_bar.set(radio.signal_adc_level)
+            self.stereo_icon.set(radio.is_stereo)
+        self.scene.commit()
+# ───────────────────────────────────────────────────────────────
+# REMOTE CONTROL
+async def remote(tuner):
+    """Joins Wi-Fi, then serves tune/seek/preset + status pushes"""
+    if await wifi_up(WIFI_SSID, WIFI_KEY) is None:
+        return
+    await RemoteServer(tuner).run()
 # ───────────────────────────────────────────────────────────────
 # CORE RUNTIME
 async def main():
@@ -98,8 +284,28 @@ async def main():
     """
     print("MAIN :: Init Complete")
     tuner = RadioTuner()
+    #Probe render/tune paths for allocation regressions
+    if TELEMETRY:
+        telemetry.instrument(tuner, "update_frequency", "tune")
+        telemetry.instrument(tuner, "draw_display", "draw")
+    #Frame pacer owns drawing; the loop below only asks for frames
+    renderer = FramePacer(tuner.draw_display, RENDER_FPS, IDLE_FPS)
+    tuner.pacer = renderer
+    asyncio.create_task(renderer.run())
     #Launch HAL watcher (Poll Killer//idle manager)
     asyncio.create_task(hal.monitor_inputs())
+    #I2C supervisor; re-probes & re-inits devices that dropped off the bus
+    if bus:
+        asyncio.create_task(bus.supervise())
+    #Optional Wi-Fi remote control (own task; never blocks this loop)
+    if REMOTE:
+        asyncio.create_task(remote(tuner))
+    #Optional flash signal log (buffered blocks; paused while seeking)
+    if SIGNAL_LOG and radio:
+        siglog = SignalLog()
+        asyncio.create_task(siglog.run(radio, SIGNAL_LOG_MS, tuner.busy))
+    #Loop latency profiler slot (see Profiler.py)
+    tid = profiler.task("main")
     #Main operation loop
     while True:
         """Display Triggers ::"""
@@ -107,27 +313,58 @@ async def main():
         #Drain Event Queue;;
         while not hal._update_queue.empty():
             event, value = await hal.next_event()
-            if event == "CoarseToggle":
+            if event in ("CoarseToggle", "Tuned"):
+                redraw = True
+                if event == "CoarseToggle" and tuner.toast:
+                    tuner.toast.show("Coarse" if value else "Fine")
+            elif event == "Menu":
+                tuner.menu_gesture(value)
                 redraw = True
+            elif event == "Seek":
+                #value = direction (+1 / -1); never blocks the loop
+                asyncio.create_task(tuner.seek(value))
         #Check For Encoder Change;;
         if tuner.update_frequency():
             redraw = True
-        #if Redraw boolean = 'True' ANYWHERE
-        if redraw:
-            tuner.draw_display()
+        #Menu owns the button while open; toasts time out on their own
+        hal.modal = bool(tuner.menu and tuner.menu.is_open)
+        if tuner.toast:
+            tuner.toast.tick()
+        #if Redraw boolean = 'True' ANYWHERE -> ask for a frame (coalesced)
+        #otherwise an ambient refresh, paced at IDLE_FPS
+        renderer.request(background=not redraw)
         """ScreenSaver :: sleeps OLED after inactivity"""
         inactive_ms = time.ticks_diff(time.ticks_ms(), hal._last_activity)
-        if inactive_ms > hal._inactivity_limit_ms:
+        #Screensaver owns the panel until input returns
+        renderer.held = inactive_ms > hal._inactivity_limit_ms
+        if renderer.held:
+            tuner.close_popups()
             for _ in range(2):
                 screen.fill(0)
                 screen.text("z", 121,56)
                 screen.show()
+                profiler.sleeping(tid, 1100)
                 await asyncio.sleep_ms(1100)
+                profiler.woke(tid)
                 "stylistic blink"
                 screen.fill(0)
                 screen.show()
+                profiler.sleeping(tid, 900)
                 await asyncio.sleep_ms(900)
-        await asyncio.sleep_ms(100)
+                profiler.woke(tid)
+            #Screensaver drew over the widgets; repaint all on next draw
+            tuner.scene.invalidate(clear=True)
+        #Resume journal; written once the user settles (not mid-seek: it mutes)
+        if not tuner.busy():
+            resume.update(tuner.freq_tenths, hal.CoarseEncoderStep,
+                          radio.mute_mode if radio else False)
+            resume.tick()
+        #Ship any mirror frame the rate limit held back
+        if mirror:
+            mirror.tick()
+        profiler.sleeping(tid, INPUT_MS)
+        await asyncio.sleep_ms(INPUT_MS)
+        profiler.woke(tid)
 # ───────────────────────────────────────────────────────────────
 # ENTRY POINT
 """
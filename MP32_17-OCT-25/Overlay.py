@@ -0,0 +1,268 @@
+"""
+Overlay.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"COPY-ON-WRITE PAGE OVERLAY"
+
+Popups without the fill(0) + redraw-everything-afterwards dance.
+One overlay per screen ::
+    show()      copies ONLY the 8-pixel pages (and columns) the popup
+                covers into a preallocated save buffer, then draws it
+    dismiss()   copies them back and flushes just that region;
+                no application redraw, nothing else repaints
+    update()    redraws the popup in place (menu cursor moved)
+
+Copy-on-write with a Scene underneath (Scene(screen, overlay)) ::
+    a dirty widget under the popup doesn't scribble on it, and its new
+    pixels aren't lost: commit() lifts the overlay (save -> screen),
+    paints the widgets, drops it again (screen -> save, popup redrawn).
+    The save buffer always holds what the UI would show; dismiss is exact.
+
+Built on it ::
+    Toast   - one-line popup, self-dismisses (mode changes)
+    Menu    - list popup driven by encoder turns + button gestures
+    diagnostics pages in Globals (full-screen overlay)
+
+Usage ::
+    overlay = Overlay(screen)
+    scene = Scene(screen, overlay)
+    overlay.show(8, 24, 112, 16, lambda fb, x, y, w, h: fb.text("Hi", x + 4, y + 4))
+    overlay.dismiss()
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import utime as time
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# LIMITS
+MAX_PAGES = const(8)        # full screen (diagnostics); 1 KB save buffer
+PAGE_H = const(8)
+TOAST_MS = const(1200)
+TOAST_Y = const(24)         # pages 3..4, over the frequency readout
+
+
+class Overlay:
+    def __init__(self, screen, max_pages=MAX_PAGES):
+        self.screen = screen
+        self.max_pages = max_pages
+        self.saved = bytearray(screen.width * max_pages)
+        self.active = False
+        self.owner = None           # whoever showed it; dismiss(owner) won't close others
+        self.painter = None
+        self.border = True
+        self.x = self.y = self.w = self.h = 0
+        self.x0 = self.x1 = self.p0 = self.p1 = 0
+        # Stats
+        self.shows = 0
+        self.restores = 0
+        self.lifts = 0              # copy-on-write passes under a Scene commit
+        self.restore_us_max = 0     # dismiss: copy back + flush
+
+    # ───────────────────────────────────────────────────────────
+    # PAGE COPIES
+    def _copy(self, save):
+        """save: screen -> saved; else saved -> screen. Columns x0..x1, pages p0..p1"""
+        buf = memoryview(self.screen.buffer)
+        sv = memoryview(self.saved)
+        width = self.screen.width
+        n = self.x1 - self.x0 + 1
+        off = 0
+        for page in range(self.p0, self.p1 + 1):
+            base = page * width + self.x0
+            if save:
+                sv[off:off + n] = buf[base:base + n]
+            else:
+                buf[base:base + n] = sv[off:off + n]
+            off += n
+
+    def _paint(self):
+        fb = self.screen
+        fb.fill_rect(self.x, self.y, self.w, self.h, 0)
+        if self.border:
+            fb.rect(self.x, self.y, self.w, self.h, 1)
+        if self.painter:
+            self.painter(fb, self.x, self.y, self.w, self.h)
+
+    def _flush(self, x0, x1, p0, p1):
+        self.screen.show_region(x0, x1, p0, p1)
+
+    def hits(self, x, y, w, h):
+        """Box touches the saved region (whole pages, so byte-exact)"""
+        return (self.active and x <= self.x1 and x + w > self.x0
+                and y < (self.p1 + 1) * PAGE_H and y + h > self.p0 * PAGE_H)
+
+    # ───────────────────────────────────────────────────────────
+    # SHOW / DISMISS
+    def show(self, x, y, w, h, painter, owner=None, border=True):
+        """painter(fb, x, y, w, h) draws the content; the box is cleared first"""
+        screen = self.screen
+        x = max(0, x)
+        y = max(0, y)
+        w = min(w, screen.width - x)
+        h = min(h, screen.height - y)
+        p0 = y // PAGE_H
+        p1 = (y + h - 1) // PAGE_H
+        if p1 - p0 + 1 > self.max_pages:
+            raise ValueError("Overlay :: popup taller than the save buffer")
+        # replacing a popup: old region comes back first, flushed with the new one
+        fx0, fx1, fp0, fp1 = x, x + w - 1, p0, p1
+        if self.active:
+            self._copy(False)
+            fx0 = min(fx0, self.x0)
+            fx1 = max(fx1, self.x1)
+            fp0 = min(fp0, self.p0)
+            fp1 = max(fp1, self.p1)
+        self.x, self.y, self.w, self.h = x, y, w, h
+        self.x0, self.x1, self.p0, self.p1 = x, x + w - 1, p0, p1
+        self.painter = painter
+        self.owner = owner
+        self.border = border
+        self._copy(True)
+        self.active = True
+        self._paint()
+        self._flush(fx0, fx1, fp0, fp1)
+        self.shows += 1
+
+    def update(self):
+        """Redraws the popup content in place; flushes its region"""
+        if self.active:
+            self._paint()
+            self._flush(self.x0, self.x1, self.p0, self.p1)
+
+    def dismiss(self, owner=None):
+        """Puts the saved pages back; returns False if not up (or not owner's)"""
+        if not self.active or (owner is not None and owner is not self.owner):
+            return False
+        t0 = time.ticks_us()
+        self._copy(False)
+        self.active = False
+        self.owner = None
+        self.painter = None
+        self._flush(self.x0, self.x1, self.p0, self.p1)
+        dt = time.ticks_diff(time.ticks_us(), t0)
+        if dt > self.restore_us_max:
+            self.restore_us_max = dt
+        self.restores += 1
+        return True
+
+    # ───────────────────────────────────────────────────────────
+    # COPY-ON-WRITE (Scene.commit)
+    def lift(self):
+        """Underlying pixels back in the framebuffer, for widgets to paint on"""
+        self._copy(False)
+        self.lifts += 1
+
+    def drop(self):
+        """Keeps what the widgets drew, redraws the popup on top (no flush)"""
+        self._copy(True)
+        self._paint()
+
+    def cleared(self):
+        """The screen under us was wiped (Scene.invalidate(clear=True))"""
+        n = (self.x1 - self.x0 + 1) * (self.p1 - self.p0 + 1)
+        for i in range(n):
+            self.saved[i] = 0
+        self._paint()
+
+    def report(self):
+        state = f"up {self.w}x{self.h} @{self.x},{self.y}" if self.active else "down"
+        print(f"Overlay :: {state}  shows {self.shows} restores {self.restores} "
+              f"lifts {self.lifts}  restore us max {self.restore_us_max}")
+
+
+# ───────────────────────────────────────────────────────────────
+# TOAST
+class Toast:
+    """One line, centred, gone after TOAST_MS (tick() from the main loop)"""
+    def __init__(self, overlay, y=TOAST_Y, ms=TOAST_MS):
+        self.overlay = overlay
+        self.y = y
+        self.ms = ms
+        self.text = ""
+        self._until = 0
+
+    def show(self, text):
+        """Never covers someone else's popup (an open menu); returns True if shown"""
+        ov = self.overlay
+        if ov.active and ov.owner is not self:
+            return False
+        self.text = text
+        w = min(len(text) * 8 + 8, ov.screen.width)
+        ov.show((ov.screen.width - w) // 2, self.y, w, 16, self._draw, owner=self)
+        self._until = time.ticks_add(time.ticks_ms(), self.ms)
+        return True
+
+    def _draw(self, fb, x, y, w, h):
+        fb.text(self.text, x + 4, y + 4, 1)
+
+    @property
+    def shown(self):
+        return self.overlay.active and self.overlay.owner is self
+
+    def tick(self):
+        if self.shown and time.ticks_diff(time.ticks_ms(), self._until) >= 0:
+            self.overlay.dismiss(self)
+
+    def hide(self):
+        self.overlay.dismiss(self)
+
+
+# ───────────────────────────────────────────────────────────────
+# MENU
+class Menu:
+    """
+    Scrolling list popup.
+    items: [(label(), action()), ...]; label() is called on every paint,
+        so values (contrast, mute) read live.
+    move(delta) from encoder turns; press() runs the selected action.
+    An action returning True closes the menu (it hands off to something else).
+    """
+    def __init__(self, overlay, items, x=8, y=8, w=112, rows=5):
+        self.overlay = overlay
+        self.items = items
+        self.x = x
+        self.y = y
+        self.w = w
+        self.rows = rows
+        self.sel = 0
+        self.top = 0
+
+    @property
+    def is_open(self):
+        return self.overlay.active and self.overlay.owner is self
+
+    def open(self):
+        self.sel = self.top = 0
+        self.overlay.show(self.x, self.y, self.w, self.rows * 8 + 8, self._draw, owner=self)
+
+    def close(self):
+        self.overlay.dismiss(self)
+
+    def move(self, delta):
+        n = len(self.items)
+        self.sel = (self.sel + delta) % n
+        if self.sel < self.top:
+            self.top = self.sel
+        elif self.sel >= self.top + self.rows:
+            self.top = self.sel - self.rows + 1
+        self.overlay.update()
+
+    def press(self):
+        if self.items[self.sel][1]():
+            self.close()
+        elif self.is_open:
+            self.overlay.update()
+
+    def _draw(self, fb, x, y, w, h):
+        for row in range(min(self.rows, len(self.items) - self.top)):
+            i = self.top + row
+            ry = y + 4 + row * 8
+            label = self.items[i][0]()
+            if i == self.sel:
+                fb.fill_rect(x + 2, ry, w - 4, 8, 1)
+                fb.text(label, x + 4, ry, 0)
+            else:
+                fb.text(label, x + 4, ry, 1)
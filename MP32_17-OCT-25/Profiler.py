@@ -0,0 +1,220 @@
+"""
+Profiler.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"EVENT-LOOP LATENCY PROFILER"
+
+Every task here is cooperative;
+    Main.main() and HAL.monitor_inputs() sleep fixed sleep_ms values.
+One blocking call (full-frame I2C flush, radio update sleep)
+    quietly delays everyone else.
+
+This measures, per task ::
+    late  - how much later than requested each sleep resumed
+    step  - how long the task ran between resuming and its next await
+
+Both go into fixed log2 histograms;
+    bucket i holds [2^i, 2^(i+1)) microseconds
+    min/max exact, median/p99 to bucket resolution
+No allocation while recording;
+    cheap enough to leave on in the field.
+
+Usage (hot loops; zero allocation) ::
+    from Profiler import profiler
+    TID = profiler.task("main")
+    ...
+    profiler.sleeping(TID, 100)
+    await asyncio.sleep_ms(100)
+    profiler.woke(TID)
+
+Usage (anywhere else; allocates one small generator per call) ::
+    await profiler.sleep_ms(TID, 100)
+
+View ::
+    profiler.report()           # REPL
+    profiler.render(screen)     # OLED page
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import utime as time
+import uasyncio as asyncio
+from array import array
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# LIMITS
+MAX_TASKS = const(4)
+BUCKETS = const(22)         # 2^21 us ~ 2 s; anything slower lands in the top bucket
+LATE = const(0)
+STEP = const(1)
+NEVER = const(-1)           # 'not yet resumed' marker
+
+KIND_TAG = ("L", "S")       # OLED column tags
+
+
+class LoopProfiler:
+    """
+    Per-task lateness & step-time histograms.
+    Preallocated; tasks x kinds x buckets.
+    """
+    def __init__(self, tasks=MAX_TASKS):
+        self.max_tasks = tasks
+        self.names = [None] * tasks
+        self.used = 0
+        self.enabled = True
+        rows = tasks * 2                                # LATE + STEP
+        self.hist = array("L", [0] * (rows * BUCKETS))
+        self.count = array("L", [0] * rows)
+        self.vmin = array("l", [0] * rows)
+        self.vmax = array("l", [0] * rows)
+        # Scratch per task
+        self._asleep_at = array("l", [0] * tasks)
+        self._asked_us = array("l", [0] * tasks)
+        self._woke_at = array("l", [NEVER] * tasks)
+
+    # ───────────────────────────────────────────────────────────
+    # TASK REGISTRY
+    def task(self, name):
+        """Returns the id for name, registering it if new"""
+        for tid in range(self.used):
+            if self.names[tid] == name:
+                return tid
+        if self.used >= self.max_tasks:
+            raise ValueError("Profiler :: out of task slots")
+        tid = self.used
+        self.names[tid] = name
+        self.used += 1
+        return tid
+
+    # ───────────────────────────────────────────────────────────
+    # RECORDING (hot path - no allocation)
+    def _record(self, row, us):
+        if us < 0:
+            us = 0
+        n = self.count[row]
+        if n == 0 or us < self.vmin[row]:
+            self.vmin[row] = us
+        if n == 0 or us > self.vmax[row]:
+            self.vmax[row] = us
+        self.count[row] = n + 1
+        bucket = 0
+        v = us >> 1
+        while v and bucket < BUCKETS - 1:
+            v >>= 1
+            bucket += 1
+        self.hist[row * BUCKETS + bucket] += 1
+
+    def sleeping(self, tid, ms):
+        """Call right before 'await asyncio.sleep_ms(ms)'"""
+        if not self.enabled:
+            return
+        now = time.ticks_us()
+        woke = self._woke_at[tid]
+        if woke != NEVER:
+            self._record(tid * 2 + STEP, time.ticks_diff(now, woke))
+        self._asleep_at[tid] = now
+        self._asked_us[tid] = ms * 1000
+
+    def woke(self, tid):
+        """Call right after the await returns"""
+        if not self.enabled:
+            return
+        now = time.ticks_us()
+        slept = time.ticks_diff(now, self._asleep_at[tid])
+        self._record(tid * 2 + LATE, slept - self._asked_us[tid])
+        self._woke_at[tid] = now
+
+    async def sleep_ms(self, tid, ms):
+        """Convenience wrapper; allocates a generator per call"""
+        self.sleeping(tid, ms)
+        await asyncio.sleep_ms(ms)
+        self.woke(tid)
+
+    # ───────────────────────────────────────────────────────────
+    # STATISTICS
+    def percentile(self, tid, kind, pct):
+        """
+        Upper edge of the bucket holding the pct-th sample (us)
+        Clamped to the exact min/max so small sample sets read sensibly.
+        """
+        row = tid * 2 + kind
+        n = self.count[row]
+        if n == 0:
+            return 0
+        target = (n * pct + 99) // 100
+        seen = 0
+        base = row * BUCKETS
+        for bucket in range(BUCKETS):
+            seen += self.hist[base + bucket]
+            if seen >= target:
+                edge = (2 << bucket) - 1
+                return max(self.vmin[row], min(edge, self.vmax[row]))
+        return self.vmax[row]
+
+    def summary(self, tid, kind):
+        """(count, min, median, p99, max) in microseconds"""
+        row = tid * 2 + kind
+        return (self.count[row], self.vmin[row],
+                self.percentile(tid, kind, 50),
+                self.percentile(tid, kind, 99), self.vmax[row])
+
+    def reset(self):
+        for i in range(len(self.hist)):
+            self.hist[i] = 0
+        for row in range(len(self.count)):
+            self.count[row] = 0
+            self.vmin[row] = 0
+            self.vmax[row] = 0
+        for tid in range(self.max_tasks):
+            self._woke_at[tid] = NEVER
+
+    # ───────────────────────────────────────────────────────────
+    # OUTPUT
+    def report(self):
+        """REPL table, microseconds"""
+        print("─────── LOOP PROFILER (us) ───────")
+        print("task    kind      n    min    med    p99    max")
+        for tid in range(self.used):
+            for kind, label in ((LATE, "late"), (STEP, "step")):
+                n, lo, med, p99, hi = self.summary(tid, kind)
+                print("{:<7} {:<4} {:>6} {:>6} {:>6} {:>6} {:>6}".format(
+                    self.names[tid], label, n, lo, med, p99, hi))
+        print("──────────────────────────────────")
+
+    def render(self, screen, y=0):
+        """
+        OLED page (16 columns) ::
+            'tskK min med p99' per task/kind, milliseconds
+        Leaves screen.show() to the caller.
+        """
+        if screen is None:
+            return
+        screen.fill_rect(0, y, screen.width, screen.height - y, 0)
+        screen.text("ms   min med p99", 0, y)
+        y += 9
+        for tid in range(self.used):
+            for kind in (LATE, STEP):
+                if y > screen.height - 8:
+                    return
+                _, lo, med, p99, _ = self.summary(tid, kind)
+                screen.text("{:<3}{}{:>4}{:>4}{:>4}".format(
+                    self.names[tid][:3], KIND_TAG[kind],
+                    _ms(lo), _ms(med), _ms(p99)), 0, y)
+                y += 8
+
+
+def _ms(us):
+    """Three characters max; '0.4', '12', '2s'"""
+    if us < 9_950:
+        return "{:.1f}".format(us / 1000)
+    if us < 1_000_000:
+        return str(us // 1000)
+    return str(min(us // 1_000_000, 9)) + "s"
+
+
+# ───────────────────────────────────────────────────────────────
+# GLOBAL PROFILER INSTANCE
+#     from Profiler import profiler
+profiler = LoopProfiler()
@@ -0,0 +1,333 @@
+"""
+RemoteServer.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"TCP REMOTE CONTROL & STATUS SERVER"
+
+The ESP32 has Wi-Fi; until now it only ever got switched off.
+This is a small uasyncio stream server ::
+    - line commands in: tune, seek, presets, status
+    - batched status lines out (frequency, signal level, stereo)
+    - never blocks Main.main(); every step awaits
+    - per-client output capped; slow readers lose stale status, not RAM
+        (status is one latest-wins slot; command replies are never dropped:
+        past MAX_OUT the client's next line waits for its writer to drain,
+        and only a socket that doesn't drain within STALL_MS is cut off)
+    - input read in MAX_LINE chunks; an endless line is discarded, not buffered
+
+Protocol (ASCII lines, '\\n' terminated) ::
+    TUNE 101.1      -> OK 1011
+    SEEK UP|DOWN    -> OK SEEK          (result arrives as a status line)
+    SCAN            -> OK SCAN          (presets; slot 0 priority; stops on a hit)
+    SCAN STOP       -> OK STOP
+    PRESET 3        -> OK 1011          (recall slot 3)
+    PRESET SET 3    -> OK 3             (store current frequency)
+    STATUS          -> S 1011 9 1
+    QUIT
+    pushed          :  S <tenths> <adc level> <stereo 0/1>
+    errors          :  ERR <reason>
+    TUNE, SEEK, SCAN and PRESET n answer ERR BUSY while a seek or scan owns
+        the radio (its finally re-tunes; the OK would be a lie); SCAN STOP first
+
+Controller (RadioTuner provides these) ::
+    tune_to(tenths)        seek(direction)  (async)
+    scan()  (async)        stop_scan()
+    recall_preset(n)       store_preset(n)
+    status() -> (tenths, level, stereo)
+    busy()                 seek / scan in progress
+
+Usage ::
+    server = RemoteServer(tuner)
+    asyncio.create_task(server.run())
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import uasyncio as asyncio
+import utime as time
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# LIMITS
+PORT = const(8032)
+MAX_CLIENTS = const(4)
+MAX_OUT = const(256)        # queued reply bytes before input waits for the writer
+STALL_MS = const(5000)      # writer stuck this long past MAX_OUT: socket stalled, cut off
+MAX_LINE = const(64)        # longest accepted command
+PUSH_MS = const(250)        # status batch interval
+
+
+class _Client:
+    """One connection; bounded replies + one status slot + wake flags for its writer"""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.out = bytearray()      # command replies, in order
+        self.status = None          # newest unsent status line
+        self.ready = asyncio.Event()
+        self.drained = asyncio.Event()  # set by the writer after each drain
+        self.open = True
+        self.stalled = False
+        self.dropped = 0            # stale status bytes replaced before sending
+        self.waits = 0              # times input paused for the writer
+
+    def queue(self, data):
+        """Command reply; always kept (backpressure() bounds the backlog)"""
+        self.out.extend(data)
+        self.ready.set()
+
+    async def backpressure(self):
+        """
+        Called before each command; past MAX_OUT waits for the writer to drain.
+        A pipelining client just slows to its socket's pace; False only if the
+        socket hasn't drained in STALL_MS (reader gone or hostile).
+        """
+        while self.open and len(self.out) > MAX_OUT:
+            self.waits += 1
+            self.drained.clear()
+            self.ready.set()
+            try:
+                await asyncio.wait_for_ms(self.drained.wait(), STALL_MS)
+            except asyncio.TimeoutError:
+                print("Remote :: client not reading replies; closing")
+                self.stalled = True
+                self.open = False
+        return self.open
+
+    def queue_status(self, line):
+        """Latest wins; replaces a status line the writer hasn't sent yet"""
+        if self.status is not None:
+            self.dropped += len(self.status)
+        self.status = line
+        self.ready.set()
+
+
+class RemoteServer:
+    def __init__(self, controller, host="0.0.0.0", port=PORT,
+                 max_clients=MAX_CLIENTS, push_ms=PUSH_MS, backlog=None):
+        self.ctl = controller
+        self.host = host
+        self.port = port
+        self.max_clients = max_clients
+        self.backlog = backlog or max_clients + 1   # pending accepts, incl. one to reject
+        self.push_ms = push_ms
+        self.clients = []
+        self.server = None
+        self._last_status = None
+        # Stats
+        self.accepted = 0
+        self.rejected = 0
+        self.commands = 0
+        self.pushes = 0
+
+    # ───────────────────────────────────────────────────────────
+    # LIFECYCLE
+    async def start(self):
+        self.server = await asyncio.start_server(self._serve, self.host, self.port,
+                                                 backlog=self.backlog)
+        return self.server
+
+    async def run(self):
+        """Start listening, then push batched status forever"""
+        await self.start()
+        print("Remote :: listening on", self.port)
+        while True:
+            await asyncio.sleep_ms(self.push_ms)
+            self.push_status()
+
+    def close(self):
+        for c in self.clients:
+            c.open = False
+            c.ready.set()
+        if self.server:
+            self.server.close()
+
+    # ───────────────────────────────────────────────────────────
+    # STATUS BATCHING
+    def _status_line(self):
+        tenths, level, stereo = self.ctl.status()
+        return "S {} {} {}\n".format(tenths, level, 1 if stereo else 0).encode()
+
+    def push_status(self, force=False):
+        """One line per interval, only if something changed; shared by all clients"""
+        if not self.clients:
+            return
+        status = self.ctl.status()
+        if status == self._last_status and not force:
+            return
+        self._last_status = status
+        line = self._status_line()
+        for c in self.clients:
+            c.queue_status(line)
+        self.pushes += 1
+
+    # ───────────────────────────────────────────────────────────
+    # CONNECTIONS
+    async def _serve(self, reader, writer):
+        if len(self.clients) >= self.max_clients:
+            self.rejected += 1
+            writer.write(b"ERR BUSY\n")
+            await _drain_close(writer)
+            return
+        client = _Client(reader, writer)
+        self.clients.append(client)
+        self.accepted += 1
+        client.queue_status(self._status_line())
+        pump = asyncio.create_task(self._pump(client))
+        try:
+            buf = b""                   # never more than MAX_LINE + one chunk
+            skipping = False            # inside an over-long line; drop to its '\n'
+            while await client.backpressure():
+                chunk = await reader.read(MAX_LINE)
+                if not chunk:
+                    break
+                buf += chunk
+                while client.open:
+                    nl = buf.find(b"\n")
+                    if nl < 0:
+                        if len(buf) > MAX_LINE:
+                            if not skipping:
+                                client.queue(b"ERR LONG\n")
+                            skipping = True
+                            buf = b""
+                        break
+                    line = buf[:nl]
+                    buf = buf[nl + 1:]
+                    if skipping:
+                        skipping = False    # tail of the long line
+                        continue
+                    if not await client.backpressure():
+                        break
+                    if len(line) > MAX_LINE:
+                        client.queue(b"ERR LONG\n")
+                        continue
+                    reply = await self._command(line.decode().strip())
+                    if reply is None:
+                        client.open = False
+                        break
+                    client.queue(reply)
+        except Exception as e:
+            print("Remote :: client error e>", e)
+        finally:
+            client.open = False
+            client.ready.set()
+            if client in self.clients:
+                self.clients.remove(client)
+            if client.stalled:
+                pump.cancel()           # stuck in drain(); won't return by itself
+                writer.close()
+            try:
+                await pump
+            except asyncio.CancelledError:
+                pass
+
+    async def _pump(self, client):
+        """Drains a client's queue; the only place that awaits on its socket"""
+        writer = client.writer
+        try:
+            while client.open or client.out:
+                if not client.out and client.status is None:
+                    client.ready.clear()
+                    await client.ready.wait()
+                    continue
+                data = client.out
+                client.out = bytearray()
+                if client.status is not None:
+                    data.extend(client.status)
+                    client.status = None
+                writer.write(data)
+                await writer.drain()
+                client.drained.set()
+        except Exception:
+            client.open = False
+        client.drained.set()
+        await _drain_close(writer)
+
+    # ───────────────────────────────────────────────────────────
+    # COMMANDS
+    async def _command(self, text):
+        """Returns reply bytes; None closes the connection"""
+        self.commands += 1
+        parts = text.upper().split()
+        if not parts:
+            return b""
+        cmd = parts[0]
+        try:
+            if cmd in ("TUNE", "SEEK") or (cmd == "SCAN" and len(parts) == 1) or (
+                    cmd == "PRESET" and len(parts) == 2):
+                if self.ctl.busy():
+                    return b"ERR BUSY\n"     # same as the encoder: hands off mid-seek
+            if cmd == "TUNE" and len(parts) == 2:
+                tenths = int(float(parts[1]) * 10 + 0.5)
+                self.ctl.tune_to(tenths)
+                return "OK {}\n".format(self.ctl.status()[0]).encode()
+            if cmd == "SEEK" and len(parts) == 2 and parts[1] in ("UP", "DOWN"):
+                # own task; the reply doesn't wait for the station
+                asyncio.create_task(self.ctl.seek(1 if parts[1] == "UP" else -1))
+                return b"OK SEEK\n"
+            if cmd == "SCAN" and len(parts) == 1:
+                asyncio.create_task(self.ctl.scan())
+                return b"OK SCAN\n"
+            if cmd == "SCAN" and len(parts) == 2 and parts[1] == "STOP":
+                self.ctl.stop_scan()
+                return b"OK STOP\n"
+            if cmd == "PRESET" and len(parts) == 3 and parts[1] == "SET":
+                self.ctl.store_preset(int(parts[2]))
+                return "OK {}\n".format(int(parts[2])).encode()
+            if cmd == "PRESET" and len(parts) == 2:
+                tenths = self.ctl.recall_preset(int(parts[1]))
+                if tenths is None:
+                    return b"ERR EMPTY\n"
+                return "OK {}\n".format(tenths).encode()
+            if cmd == "STATUS":
+                return self._status_line()
+            if cmd == "QUIT":
+                return None
+        except (ValueError, IndexError, OverflowError) as e:
+            return "ERR {}\n".format(e).encode()
+        return b"ERR UNKNOWN\n"
+
+    def report(self):
+        print("─────── REMOTE ───────")
+        print(f"clients {len(self.clients)}  accepted {self.accepted}  rejected {self.rejected}")
+        print(f"commands {self.commands}  pushes {self.pushes}")
+        for c in self.clients:
+            print(f"  queued {len(c.out)}  dropped {c.dropped}  waits {c.waits}")
+        print("──────────────────────")
+
+
+async def _drain_close(writer):
+    try:
+        await writer.drain()
+    except Exception:
+        pass
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except Exception:
+        pass
+
+
+# ───────────────────────────────────────────────────────────────
+# WI-FI
+async def wifi_up(ssid, key, timeout_ms=10_000):
+    """
+    Station mode join; awaits instead of spinning.
+    Returns the IP string, or None on timeout.
+    """
+    import network
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(True)
+    if not wlan.isconnected():
+        wlan.connect(ssid, key)
+        t0 = time.ticks_ms()
+        while not wlan.isconnected():
+            if time.ticks_diff(time.ticks_ms(), t0) > timeout_ms:
+                print("Remote :: Wi-Fi timeout")
+                wlan.active(False)
+                return None
+            await asyncio.sleep_ms(200)
+    ip = wlan.ifconfig()[0]
+    print("Remote :: Wi-Fi up", ip)
+    return ip
@@ -0,0 +1,136 @@
+"""
+Renderer.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"FRAME-PACED RENDERER"
+
+Input handling asks for a frame; this task decides when to draw.
+    - any number of requests between frames -> ONE flush (coalesced)
+    - at most one flush per frame interval
+    - ACTIVE rate while input keeps coming, IDLE rate after it stops
+    - the main loop never waits on screen.show()
+
+Foreground request() = user input; switches to the active rate.
+Background request(background=True) = ambient refresh (signal bar);
+    never wakes the active rate, so idle costs ~1 flush/s at most.
+
+Stats ::
+    frames      flushes done
+    coalesced   requests merged into an already pending frame
+    dropped     frame slots missed because the loop/draw ran late
+    budget      draw time as % of the frame interval (avg / max)
+
+Usage ::
+    pacer = FramePacer(tuner.draw_display, active_fps=30, idle_fps=1)
+    asyncio.create_task(pacer.run())
+    pacer.request()
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import uasyncio as asyncio
+import utime as time
+from micropython import const
+from Profiler import profiler
+
+# ───────────────────────────────────────────────────────────────
+# DEFAULTS
+ACTIVE_FPS = const(30)
+IDLE_FPS = const(1)
+IDLE_AFTER_MS = const(3000)     # no foreground request this long -> idle rate
+
+
+class FramePacer:
+    def __init__(self, draw, active_fps=ACTIVE_FPS, idle_fps=IDLE_FPS,
+                 idle_after_ms=IDLE_AFTER_MS):
+        self.draw = draw
+        self.idle_after_ms = idle_after_ms
+        self.set_rates(active_fps, idle_fps)
+        self.dirty = False
+        self.held = False               # True = someone else owns the panel
+        now = time.ticks_ms()
+        self._dirty_since = now
+        self._last_flush = time.ticks_add(now, -self.active_ms)
+        self._last_input = now
+        # Stats
+        self.frames = 0
+        self.requests = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.draw_us_total = 0
+        self.draw_us_max = 0
+        self.budget_max = 0             # % of interval, worst frame
+
+    def set_rates(self, active_fps, idle_fps):
+        self.active_ms = 1000 // active_fps
+        self.idle_ms = 1000 // idle_fps
+
+    @property
+    def idle(self):
+        return time.ticks_diff(time.ticks_ms(), self._last_input) > self.idle_after_ms
+
+    def interval_ms(self):
+        return self.idle_ms if self.idle else self.active_ms
+
+    def request(self, background=False):
+        """Marks the UI stale; cheap, safe to call every loop"""
+        now = time.ticks_ms()
+        if not background:
+            self._last_input = now
+            self.requests += 1
+            if self.dirty:
+                self.coalesced += 1
+        if not self.dirty:
+            self.dirty = True
+            self._dirty_since = now
+
+    # ───────────────────────────────────────────────────────────
+    # FLUSH
+    def flush(self, now=None):
+        """One frame; returns draw time in us"""
+        if now is None:
+            now = time.ticks_ms()
+        interval = self.interval_ms()
+        # due = the later of 'slot opens' and 'became dirty'
+        due = time.ticks_add(self._last_flush, interval)
+        if time.ticks_diff(self._dirty_since, due) > 0:
+            due = self._dirty_since
+        late = time.ticks_diff(now, due)
+        if late >= interval:
+            self.dropped += late // interval
+        self.dirty = False
+        t0 = time.ticks_us()
+        self.draw()
+        dt = time.ticks_diff(time.ticks_us(), t0)
+        self._last_flush = now
+        self.frames += 1
+        self.draw_us_total += dt
+        if dt > self.draw_us_max:
+            self.draw_us_max = dt
+        budget = dt // (interval * 10)
+        if budget > self.budget_max:
+            self.budget_max = budget
+        return dt
+
+    async def run(self):
+        """Wakes every active interval; flushes when dirty and the slot is open"""
+        tid = profiler.task("render")
+        while True:
+            now = time.ticks_ms()
+            if (self.dirty and not self.held
+                    and time.ticks_diff(now, self._last_flush) >= self.interval_ms()):
+                self.flush(now)
+            profiler.sleeping(tid, self.active_ms)
+            await asyncio.sleep_ms(self.active_ms)
+            profiler.woke(tid)
+
+    def report(self):
+        avg = self.draw_us_total // self.frames if self.frames else 0
+        avg_budget = avg // (self.active_ms * 10)
+        print(f"Renderer :: {'IDLE' if self.idle else 'ACTIVE'} "
+              f"{1000 // self.active_ms}/{1000 // self.idle_ms} fps")
+        print(f"  frames {self.frames}  requests {self.requests}  coalesced {self.coalesced}  "
+              f"dropped {self.dropped}")
+        print(f"  draw us avg {avg} max {self.draw_us_max}  "
+              f"budget avg {avg_budget}% max {self.budget_max}%")
@@ -0,0 +1,225 @@
+"""
+ResumeState.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"JOURNALED RESUME STATE"
+
+Boot straight back to the last station, step mode, contrast and mute.
+
+Journal ::
+    /resume.jnl  - append-only, fixed 8-byte records, newest last
+    record '<BBHBBBB' magic, seq, tenths, flags, contrast, volume, check
+        flags bit0 = Coarse, bit1 = mute
+        check = ~sum(bytes 0..6) & 0xFF  (erased 0xFF / zeroed flash never passes)
+
+Wear ::
+    changes are held in RAM until nothing has changed for SAVE_IDLE_MS,
+    then ONE record is appended (none if it equals the last one saved).
+    After MAX_RECORDS the journal is compacted to its newest record:
+        written to /resume.tmp, then renamed over (rename is atomic;
+        FAT won't rename onto an existing file, so that removes it first).
+    A failed write (flash full, FS error) is counted and retried after
+        the next quiet spell; it never raises into the main loop.
+
+Power loss ::
+    load() walks back from the end to the last record that checks out;
+    a torn tail (partial or bad record) is skipped, a stale .tmp deleted
+    (or renamed in, if power went between FAT's remove and rename).
+
+Volume is kept for an amplifier stage; the TEA5767 itself only mutes.
+
+Usage ::
+    resume = ResumeState()
+    resume.load()                 # early in Globals, before the first tune
+    radio.set_frequency(resume.tenths / 10)
+    ...
+    resume.update(tenths, coarse, mute)    # main loop, every pass
+    resume.tick()                          # writes once the user settles
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import os
+import struct
+import utime as time
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# FORMAT
+PATH = "/resume.jnl"
+RECORD = "<BBHBBBB"
+REC_SIZE = const(8)
+MAGIC = const(0xA7)
+FLAG_COARSE = const(1)
+FLAG_MUTE = const(2)
+MAX_RECORDS = const(128)        # 1 KB, then compact
+SAVE_IDLE_MS = const(5000)      # quiet this long before a write
+
+DEFAULT_TENTHS = const(1000)
+DEFAULT_CONTRAST = const(0xFF)
+DEFAULT_VOLUME = const(8)
+
+
+def _check(buf):
+    s = 0
+    for i in range(REC_SIZE - 1):
+        s += buf[i]
+    return ~s & 0xFF
+
+
+class ResumeState:
+    def __init__(self, path=PATH, max_records=MAX_RECORDS, idle_ms=SAVE_IDLE_MS):
+        self.path = path
+        self.tmp = path.rsplit(".", 1)[0] + ".tmp"
+        self.max_records = max_records
+        self.idle_ms = idle_ms
+        # Live state
+        self.tenths = DEFAULT_TENTHS
+        self.coarse = False
+        self.mute = False
+        self.contrast = DEFAULT_CONTRAST
+        self.volume = DEFAULT_VOLUME
+        # Journal bookkeeping
+        self.rec = bytearray(REC_SIZE)
+        self.saved = bytearray(REC_SIZE)    # last record on flash
+        self.seq = 0
+        self.records = 0
+        self.dirty = False
+        self._changed = time.ticks_ms()
+        # Stats
+        self.writes = 0
+        self.compactions = 0
+        self.skipped = 0            # torn/bad records passed over by load()
+        self.failures = 0           # saves that hit a flash error
+
+    # ───────────────────────────────────────────────────────────
+    # RECORD
+    def _pack(self):
+        flags = (FLAG_COARSE if self.coarse else 0) | (FLAG_MUTE if self.mute else 0)
+        struct.pack_into(RECORD, self.rec, 0, MAGIC, self.seq & 0xFF, self.tenths,
+                         flags, self.contrast, self.volume, 0)
+        self.rec[REC_SIZE - 1] = _check(self.rec)
+
+    def _same_as_saved(self):
+        """Payload equal to flash? (ignores seq & check)"""
+        for i in range(2, REC_SIZE - 1):
+            if self.rec[i] != self.saved[i]:
+                return False
+        return True
+
+    # ───────────────────────────────────────────────────────────
+    # LOAD
+    def load(self):
+        """Newest valid record -> live state; returns True if one was found"""
+        try:
+            os.stat(self.path)
+            os.remove(self.tmp)     # interrupted compaction; journal is intact
+        except OSError:
+            try:
+                os.rename(self.tmp, self.path)  # journal removed, rename never ran
+            except OSError:
+                pass
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+        self.records = len(data) // REC_SIZE
+        for n in range(self.records - 1, -1, -1):
+            rec = data[n * REC_SIZE:(n + 1) * REC_SIZE]
+            if rec[0] == MAGIC and _check(rec) == rec[REC_SIZE - 1]:
+                _, seq, tenths, flags, contrast, volume, _ = struct.unpack(RECORD, rec)
+                self.seq = seq + 1
+                self.tenths = tenths
+                self.coarse = bool(flags & FLAG_COARSE)
+                self.mute = bool(flags & FLAG_MUTE)
+                self.contrast = contrast
+                self.volume = volume
+                self.saved[:] = rec
+                return True
+            self.skipped += 1
+        return False
+
+    # ───────────────────────────────────────────────────────────
+    # UPDATE / SAVE
+    def update(self, tenths, coarse, mute):
+        """Cheap; call every loop. Starts the quiet timer on a change"""
+        if tenths != self.tenths or coarse != self.coarse or mute != self.mute:
+            self.tenths = tenths
+            self.coarse = coarse
+            self.mute = mute
+            self._touch()
+
+    def set_contrast(self, contrast):
+        if contrast != self.contrast:
+            self.contrast = contrast
+            self._touch()
+
+    def set_volume(self, volume):
+        if volume != self.volume:
+            self.volume = volume
+            self._touch()
+
+    def _touch(self):
+        self.dirty = True
+        self._changed = time.ticks_ms()
+
+    def tick(self):
+        """Saves once nothing has changed for idle_ms; returns True if written"""
+        if self.dirty and time.ticks_diff(time.ticks_ms(), self._changed) >= self.idle_ms:
+            return self.save()
+        return False
+
+    def save(self):
+        """Appends one record now (unless flash already matches); never raises"""
+        self.dirty = False
+        self._pack()
+        if self.records and self._same_as_saved():
+            return False
+        try:
+            self._write()
+        except OSError as e:
+            # keep the change; try again after another quiet spell
+            self.failures += 1
+            self._touch()
+            print("Resume :: save fail e>", e)
+            return False
+        return True
+
+    def _write(self):
+        torn = False
+        try:
+            # torn tail? a misaligned size would shift every later record
+            torn = os.stat(self.path)[6] % REC_SIZE != 0
+        except OSError:
+            pass
+        if torn or self.records >= self.max_records:
+            self._compact()
+        else:
+            with open(self.path, "ab") as f:
+                f.write(self.rec)
+            self.records += 1
+        self.saved[:] = self.rec
+        self.seq += 1
+        self.writes += 1
+
+    def _compact(self):
+        """Journal -> just the current record; atomic via rename"""
+        with open(self.tmp, "wb") as f:
+            f.write(self.rec)
+        try:
+            os.rename(self.tmp, self.path)
+        except OSError:
+            # FAT: destination must not exist; load() recovers the gap
+            os.remove(self.path)
+            os.rename(self.tmp, self.path)
+        self.records = 1
+        self.compactions += 1
+        self.saved[:] = self.rec
+
+    def report(self):
+        print(f"Resume :: {self.tenths / 10:.1f} MHz {'Coarse' if self.coarse else 'Fine'} "
+              f"mute {self.mute} contrast {self.contrast} vol {self.volume}  "
+              f"records {self.records} writes {self.writes} compactions {self.compactions} "
+              f"failures {self.failures}")
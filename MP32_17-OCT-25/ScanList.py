@@ -0,0 +1,194 @@
+"""
+ScanList.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"PRIORITY-CHANNEL SCAN LIST"
+
+Scanner-style monitoring of a saved list (the presets), not a band sweep ::
+    hop to each channel, dwell, read the ADC, move on
+    stop on the first one at or above the squelch level
+    the priority channel is re-checked every PRIORITY_EVERY hops
+
+Cycle time is hops x (I2C + PLL settle), so a hop is kept minimal ::
+    one full register write when the scan starts (muted, no search)
+    per hop: 2-byte write (PLL only; TEA5767 keeps bytes 3..5) and a
+        4-byte read into a preallocated buffer; PLL words precomputed
+    no float maths, no allocation, no blocking sleep per hop
+Every dwell awaits, so the UI loop keeps running.
+
+A hit is confirmed by a second read one dwell later (no false stops
+    on a noise spike), then the radio is tuned there properly, unmuted.
+
+Stats ::
+    hops/s          hop rate over the last scan
+    cycle ms        one pass of the whole list
+    priority ms     worst gap between two priority checks
+    detect ms       scan start -> stop on a signal (last / worst)
+
+Usage ::
+    scanner = ScanList(radio)
+    scanner.set_list([1011, 1047, 955], priority=980)
+    tenths = await scanner.scan()       # None if stopped / nothing heard
+    scanner.stop()                      # from anywhere; ends at the next hop
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import uasyncio as asyncio
+import utime as time
+from array import array
+from micropython import const
+from Seek import SETTLE_MS
+
+# ───────────────────────────────────────────────────────────────
+# TUNING
+MAX_CHANNELS = const(16)
+SQUELCH = const(7)          # ADC level that counts as 'something there'
+PRIORITY_EVERY = const(4)   # list hops between priority checks
+MUTE_BIT = const(0x80)      # register byte 1, bit 7
+
+
+def pll_word(tenths):
+    """TEA5767 PLL (high-side injection, 32.768 kHz ref); as Radio.write()"""
+    return (4 * (tenths * 100_000 + 225_000) // 32768) & 0x3FFF
+
+
+class ScanList:
+    def __init__(self, radio, squelch=SQUELCH, dwell_ms=SETTLE_MS,
+                 priority_every=PRIORITY_EVERY):
+        self.radio = radio
+        self.squelch = squelch
+        self.dwell_ms = dwell_ms
+        self.priority_every = priority_every
+        self.channels = array("H", [0] * MAX_CHANNELS)
+        self.pll = array("H", [0] * MAX_CHANNELS)
+        self.count = 0
+        self.priority = None
+        self.pri_pll = 0
+        self.wbuf = bytearray(2)
+        self.rbuf = bytearray(4)
+        self.busy = False
+        self.found = None
+        self._stop = False
+        # Stats (last scan unless noted)
+        self.hops = 0
+        self.cycles = 0
+        self.confirms = 0           # reads at squelch that got a second look
+        self.hops_per_s = 0
+        self.cycle_ms = 0
+        self.priority_ms = 0        # worst gap between priority checks
+        self.detect_ms = 0
+        self.detect_ms_max = 0      # all scans
+
+    def set_list(self, channels, priority=None):
+        """Channels in tenths (capped at MAX_CHANNELS); priority optional"""
+        n = 0
+        for tenths in channels:
+            if n == MAX_CHANNELS:
+                break
+            if tenths is None or tenths == priority:
+                continue
+            self.channels[n] = tenths
+            self.pll[n] = pll_word(tenths)
+            n += 1
+        self.count = n
+        self.priority = priority
+        if priority is not None:
+            self.pri_pll = pll_word(priority)
+
+    def stop(self):
+        self._stop = True
+
+    # ───────────────────────────────────────────────────────────
+    # ONE HOP = 2-byte write, dwell, 4-byte read
+    async def _level(self, pll):
+        radio = self.radio
+        b = self.wbuf
+        b[0] = MUTE_BIT | pll >> 8
+        b[1] = pll & 0xFF
+        radio._i2c.writeto(radio._address, b)
+        await asyncio.sleep_ms(self.dwell_ms)
+        radio._i2c.readfrom_into(radio._address, self.rbuf)
+        self.hops += 1
+        return self.rbuf[3] >> 4
+
+    async def _heard(self, pll):
+        if await self._level(pll) < self.squelch:
+            return False
+        self.confirms += 1
+        await asyncio.sleep_ms(self.dwell_ms)
+        self.radio._i2c.readfrom_into(self.radio._address, self.rbuf)
+        return self.rbuf[3] >> 4 >= self.squelch
+
+    # ───────────────────────────────────────────────────────────
+    # SCAN
+    async def scan(self):
+        """
+        Cycles the list (and priority) until a channel breaks squelch
+        or stop() is called. Leaves the radio on the hit (or where it was).
+        """
+        if self.busy or (not self.count and self.priority is None):
+            return None
+        radio = self.radio
+        start_tenths = int(radio.frequency * 10 + 0.5)
+        self.busy = True
+        self._stop = False
+        self.found = None
+        self.hops = self.cycles = self.confirms = 0
+        self.priority_ms = 0
+        was_muted = radio.mute_mode
+        t0 = time.ticks_ms()
+        try:
+            # full register set once; hops only touch the PLL bytes
+            radio.mute_mode = True
+            radio.search_mode = False
+            radio.write()
+            i = 0
+            since_pri = self.priority_every     # priority first
+            last_pri = t0
+            cycle_t = t0
+            while not self._stop:
+                if self.priority is not None and (
+                        since_pri >= self.priority_every or not self.count):
+                    since_pri = 0
+                    now = time.ticks_ms()
+                    gap = time.ticks_diff(now, last_pri)
+                    if gap > self.priority_ms:
+                        self.priority_ms = gap
+                    last_pri = now
+                    if await self._heard(self.pri_pll):
+                        self.found = self.priority
+                        break
+                    continue
+                if await self._heard(self.pll[i]):
+                    self.found = self.channels[i]
+                    break
+                since_pri += 1
+                i += 1
+                if i == self.count:
+                    i = 0
+                    self.cycles += 1
+                    now = time.ticks_ms()
+                    self.cycle_ms = time.ticks_diff(now, cycle_t)
+                    cycle_t = now
+        finally:
+            elapsed = time.ticks_diff(time.ticks_ms(), t0)
+            radio.mute_mode = was_muted
+            target = self.found if self.found is not None else start_tenths
+            radio.frequency = target / 10
+            radio.update()
+            self.hops_per_s = self.hops * 1000 // max(elapsed, 1)
+            if self.found is not None:
+                self.detect_ms = elapsed
+                if elapsed > self.detect_ms_max:
+                    self.detect_ms_max = elapsed
+            self.busy = False
+        return self.found
+
+    def report(self):
+        print(f"ScanList :: {self.count} ch  priority {self.priority}  squelch {self.squelch}  "
+              f"dwell {self.dwell_ms} ms  found {self.found}")
+        print(f"  hops {self.hops} ({self.hops_per_s}/s)  cycles {self.cycles} "
+              f"@{self.cycle_ms} ms  priority gap {self.priority_ms} ms  confirms {self.confirms}")
+        print(f"  detect ms {self.detect_ms} max {self.detect_ms_max}")
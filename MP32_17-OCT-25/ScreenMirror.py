@@ -0,0 +1,217 @@
+"""
+ScreenMirror.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"OLED SCREEN MIRROR OVER USB SERIAL"
+
+See the OLED without looking at the hardware.
+A full 1 KB buffer per frame would drown the REPL UART,
+    so only what changed goes out ::
+        - a shadow copy remembers what the host already has
+        - per 8-pixel page, the changed column span [x0..x1]
+        - each span PackBits-style RLE compressed
+        - a keyframe (every page, full width) every KEY_EVERY frames
+            so a viewer that joins late or drops bytes resyncs
+
+Packet (little endian) ::
+    A5 5A            magic
+    u8  kind         'K' keyframe / 'D' delta
+    u16 seq
+    u8  spans
+    u16 payload length
+    spans x [u8 page, u8 x0, u8 width, u16 rle length, rle bytes]
+    u8  checksum     sum of payload bytes & 0xFF
+
+RLE control byte n ::
+    0..127   -> n+1 literal bytes follow
+    128..255 -> next byte repeated n-126 times (2..129)
+
+REPL prints still flow between packets; the viewer passes them through.
+
+Usage ::
+    from ScreenMirror import Mirror
+    mirror = Mirror(screen, max_fps=10).attach()   # wraps show()/show_region()
+    mirror.tick()       # from the main loop; ships a rate-limited last frame
+    # PC:  python HostTools/mirror_view.py --port /dev/ttyUSB0
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import sys
+import utime as time
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# FORMAT
+MAGIC0 = const(0xA5)
+MAGIC1 = const(0x5A)
+HEAD_LEN = const(8)         # magic(2) kind(1) seq(2) spans(1) length(2)
+SPAN_HEAD = const(5)        # page, x0, width, rle length(2)
+KEY_EVERY = const(50)
+MAX_RUN = const(129)
+MAX_LIT = const(128)
+
+
+class Mirror:
+    """
+    Delta + RLE framebuffer streamer.
+    All buffers preallocated; send() allocates nothing but the write.
+    """
+    def __init__(self, screen, out=None, max_fps=10):
+        self.screen = screen
+        self.width = screen.width
+        self.pages = screen.pages
+        size = self.width * self.pages
+        self.shadow = bytearray(size)
+        # worst case RLE is 'a bb c dd ...' -> 4 bytes out per 3 in; plus headers
+        worst = HEAD_LEN + 1 + self.pages * (SPAN_HEAD + self.width * 3 // 2 + 2)
+        self.packet = bytearray(worst)
+        self._mv = memoryview(self.packet)
+        if out is None:
+            out = getattr(sys.stdout, "buffer", sys.stdout)
+        self.out = out
+        self.min_gap_ms = 1000 // max_fps if max_fps else 0
+        self.enabled = True
+        self.seq = 0
+        self._last_ms = time.ticks_ms()
+        self._force_key = True
+        self.pending = False        # a change was rate-limited and not sent yet
+        # Stats
+        self.frames = 0
+        self.skipped = 0            # rate-limited; changes ride the next frame
+        self.bytes_sent = 0
+
+    # ───────────────────────────────────────────────────────────
+    # HOOK
+    def attach(self):
+        """Streams after every show()/show_region(); returns self"""
+        screen = self.screen
+        for name in ("show", "show_region"):
+            flush = getattr(screen, name, None)
+            if flush is not None:
+                setattr(screen, name, self._after(flush))
+        return self
+
+    def _after(self, flush):
+        def mirrored(*args):
+            flush(*args)
+            if self.enabled:
+                self.send()
+        return mirrored
+
+    def keyframe(self):
+        """Next send() ships the whole panel"""
+        self._force_key = True
+
+    # ───────────────────────────────────────────────────────────
+    # ENCODE
+    def _rle(self, src, start, end, pos):
+        """PackBits src[start:end] into packet at pos; returns new pos"""
+        pkt = self.packet
+        i = start
+        while i < end:
+            # run?
+            run = 1
+            while i + run < end and run < MAX_RUN and src[i + run] == src[i]:
+                run += 1
+            if run >= 2:
+                pkt[pos] = run + 126
+                pkt[pos + 1] = src[i]
+                pos += 2
+                i += run
+                continue
+            # literals until the next run of 2+ (or the cap)
+            lit = 1
+            while (i + lit < end and lit < MAX_LIT
+                   and not (i + lit + 1 < end and src[i + lit] == src[i + lit + 1])):
+                lit += 1
+            pkt[pos] = lit - 1
+            pos += 1
+            for k in range(i, i + lit):
+                pkt[pos] = src[k]
+                pos += 1
+            i += lit
+        return pos
+
+    def encode(self):
+        """Builds one packet; returns its length (0 = nothing changed)"""
+        buf = self.screen.buffer
+        shadow = self.shadow
+        w = self.width
+        key = self._force_key or (self.seq % KEY_EVERY == 0)
+        pkt = self.packet
+        pos = HEAD_LEN
+        spans = 0
+        for page in range(self.pages):
+            base = page * w
+            if key:
+                x0, x1 = 0, w - 1
+            else:
+                x0 = 0
+                while x0 < w and buf[base + x0] == shadow[base + x0]:
+                    x0 += 1
+                if x0 == w:
+                    continue
+                x1 = w - 1
+                while buf[base + x1] == shadow[base + x1]:
+                    x1 -= 1
+            span_at = pos
+            pkt[pos] = page
+            pkt[pos + 1] = x0
+            pkt[pos + 2] = x1 - x0 + 1
+            pos = self._rle(buf, base + x0, base + x1 + 1, pos + SPAN_HEAD)
+            rle_len = pos - span_at - SPAN_HEAD
+            pkt[span_at + 3] = rle_len & 0xFF
+            pkt[span_at + 4] = rle_len >> 8
+            for k in range(base + x0, base + x1 + 1):
+                shadow[k] = buf[k]
+            spans += 1
+        if spans == 0:
+            return 0
+        length = pos - HEAD_LEN
+        pkt[0] = MAGIC0
+        pkt[1] = MAGIC1
+        pkt[2] = 0x4B if key else 0x44      # 'K' / 'D'
+        pkt[3] = self.seq & 0xFF
+        pkt[4] = (self.seq >> 8) & 0xFF
+        pkt[5] = spans
+        pkt[6] = length & 0xFF
+        pkt[7] = length >> 8
+        check = 0
+        for k in range(HEAD_LEN, pos):
+            check += pkt[k]
+        pkt[pos] = check & 0xFF
+        self.seq = (self.seq + 1) & 0xFFFF
+        self._force_key = False
+        return pos + 1
+
+    # ───────────────────────────────────────────────────────────
+    # SEND
+    def send(self):
+        """Encodes & writes if the rate limit allows; returns bytes written"""
+        now = time.ticks_ms()
+        if self.min_gap_ms and time.ticks_diff(now, self._last_ms) < self.min_gap_ms:
+            self.skipped += 1
+            self.pending = True
+            return 0
+        self.pending = False
+        n = self.encode()
+        if n == 0:
+            return 0
+        self._last_ms = now
+        self.out.write(self._mv[:n])
+        self.frames += 1
+        self.bytes_sent += n
+        return n
+
+    def tick(self):
+        """Sends a frame held back by the rate limit, once the gap allows"""
+        if self.pending and self.enabled:
+            self.send()
+
+    def report(self):
+        raw = self.frames * self.width * self.pages
+        pct = self.bytes_sent * 100 // raw if raw else 0
+        print(f"Mirror :: frames {self.frames} skipped {self.skipped} "
+              f"bytes {self.bytes_sent} ({pct}% of raw)")
@@ -0,0 +1,232 @@
+"""
+Seek.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"COARSE-TO-FINE SOFTWARE SEEK"
+
+Radio.search() hands the job to the TEA5767's own search;
+    slow, blocking if you poll it naively,
+    and stuck with fixed search_adc_level thresholds (5/7/10).
+
+This seek instead ::
+    1. learns the band's noise floor (median ADC over a sparse sweep);
+        re-learned when FLOOR_AGE_MS old or after FLOOR_USES seeks, and
+        straight away when a lap finds nothing (antenna / location moved)
+    2. hops in COARSE steps away from the current station
+    3. on a probe that clears the threshold, or jumps up from the last one,
+        climbs 0.1 MHz at a time to the ADC peak
+    4. accepts the peak only if it clears floor + margin
+Everything awaits the PLL settle, so the UI loop keeps running.
+
+Stats after every run ::
+    seeker.probes, seeker.latency_ms, seeker.found (tenths or None)
+    seeker.floor, seeker.floor_refreshes
+    seeker.compare(direction) runs both software & hardware seek, prints both
+
+Usage ::
+    from Seek import Seeker
+    seeker = Seeker(radio)
+    tenths = await seeker.seek(+1, tuner.freq_tenths)
+    await seeker.measure_floor()        # force a refresh (new antenna)
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import uasyncio as asyncio
+import utime as time
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# TUNING
+SETTLE_MS = const(15)       # PLL lock + ADC refresh after a register write
+COARSE_TENTHS = const(3)    # 300 kHz hops; inside a station's ADC skirt
+FLOOR_STEP_TENTHS = const(20)   # noise-floor sweep, every 2 MHz
+MARGIN = const(2)           # ADC counts above the floor to call it a station
+MIN_LEVEL = const(3)        # never accept below this, even on a dead band
+RISE = const(2)             # coarse jump that triggers a closer look
+FLOOR_AGE_MS = const(600_000)   # re-measure the floor after 10 min...
+FLOOR_USES = const(20)      # ...or this many seeks, whichever comes first
+HW_POLL_MS = const(10)
+HW_TIMEOUT_MS = const(5000)
+
+
+class Seeker:
+    """
+    Software seek over a TEA5767 Radio.
+    Band limits come from the radio (US/JP); works in integer tenths.
+    """
+    def __init__(self, radio):
+        self.radio = radio
+        lo, hi = radio.FREQ_RANGE_JP if radio.band_limits == "JP" else radio.FREQ_RANGE_US
+        self.lo = int(lo * 10 + 0.5)
+        self.hi = int(hi * 10 + 0.5)
+        self.floor = None
+        self.threshold = MIN_LEVEL
+        self.floor_t = 0            # ticks_ms of the last measure_floor()
+        self.floor_uses = 0         # seeks run on this floor
+        self.floor_refreshes = 0
+        # Last run stats
+        self.probes = 0
+        self.latency_ms = 0
+        self.found = None
+        self.busy = False
+
+    # ───────────────────────────────────────────────────────────
+    # ONE PROBE = one register write, settle, one read
+    async def probe(self, tenths):
+        radio = self.radio
+        radio.frequency = tenths / 10
+        radio.write()
+        await asyncio.sleep_ms(SETTLE_MS)
+        radio.read()
+        self.probes += 1
+        return radio.signal_adc_level
+
+    # ───────────────────────────────────────────────────────────
+    # NOISE FLOOR
+    def floor_stale(self):
+        return (self.floor is None or self.floor_uses >= FLOOR_USES
+                or time.ticks_diff(time.ticks_ms(), self.floor_t) > FLOOR_AGE_MS)
+
+    async def measure_floor(self):
+        """Median ADC of a sparse band sweep; most of the band is empty"""
+        levels = []
+        f = self.lo
+        while f <= self.hi:
+            levels.append(await self.probe(f))
+            f += FLOOR_STEP_TENTHS
+        levels.sort()
+        self.floor = levels[len(levels) // 2]
+        self.threshold = max(MIN_LEVEL, self.floor + MARGIN)
+        self.floor_t = time.ticks_ms()
+        self.floor_uses = 0
+        self.floor_refreshes += 1
+        return self.floor
+
+    # ───────────────────────────────────────────────────────────
+    # SOFTWARE SEEK
+    def _wrap(self, tenths):
+        span = self.hi - self.lo + 1
+        return self.lo + (tenths - self.lo) % span
+
+    async def _climb(self, tenths, level, direction):
+        """Hill-climb 0.1 MHz at a time; returns (peak tenths, peak level)"""
+        best_f, best = tenths, level
+        for step in (direction, -direction):
+            f = tenths
+            while True:
+                f = self._wrap(f + step)
+                lvl = await self.probe(f)
+                if lvl <= best:
+                    break
+                best_f, best = f, lvl
+        return best_f, best
+
+    async def _lap(self, direction, start_tenths):
+        """Coarse hops once round the band; sets self.found on a station"""
+        # first hop clears the current station's skirt
+        f = self._wrap(start_tenths + direction * COARSE_TENTHS)
+        prev = await self.probe(f)
+        travelled = COARSE_TENTHS
+        span = self.hi - self.lo + 1
+        while travelled < span:
+            if prev >= self.threshold - 1:
+                peak_f, peak = await self._climb(f, prev, direction)
+                if peak >= self.threshold and peak_f != start_tenths:
+                    self.found = peak_f
+                    return
+            f = self._wrap(f + direction * COARSE_TENTHS)
+            travelled += COARSE_TENTHS
+            lvl = await self.probe(f)
+            if lvl - prev >= RISE and lvl < self.threshold - 1:
+                # rising edge but not there yet; look one fine step on
+                lvl = max(lvl, await self.probe(self._wrap(f + direction)))
+            prev = lvl
+
+    async def seek(self, direction=1, start_tenths=None):
+        """
+        Next station up (+1) or down (-1) from start_tenths.
+        Leaves the radio tuned to it (or back at the start) and unmuted.
+        Returns the station in tenths, or None after a full lap.
+        """
+        radio = self.radio
+        direction = 1 if direction >= 0 else -1
+        if start_tenths is None:
+            start_tenths = int(radio.frequency * 10 + 0.5)
+        self.busy = True
+        self.probes = 0
+        self.found = None
+        t0 = time.ticks_ms()
+        was_muted = radio.mute_mode
+        radio.mute_mode = True          # no chirps while hopping
+        try:
+            fresh = self.floor_stale()
+            if fresh:
+                await self.measure_floor()
+            self.floor_uses += 1
+            await self._lap(direction, start_tenths)
+            if self.found is None and not fresh:
+                # a whole lap of nothing on an old floor: re-learn it, and
+                # if that moved the threshold, go round once more
+                threshold = self.threshold
+                await self.measure_floor()
+                if self.threshold != threshold:
+                    await self._lap(direction, start_tenths)
+        finally:
+            radio.mute_mode = was_muted
+            target = self.found if self.found is not None else start_tenths
+            radio.frequency = target / 10
+            radio.update()
+            self.latency_ms = time.ticks_diff(time.ticks_ms(), t0)
+            self.busy = False
+        return self.found
+
+    # ───────────────────────────────────────────────────────────
+    # HARDWARE SEEK (for comparison)
+    async def hardware_seek(self, direction=1, adc=7):
+        """
+        TEA5767 built-in search; polls the ready flag without blocking.
+        Same stats as seek(); each poll counts as a probe.
+        """
+        radio = self.radio
+        self.busy = True
+        self.probes = 0
+        self.found = None
+        t0 = time.ticks_ms()
+        try:
+            radio.search(True, 1 if direction >= 0 else 0, adc)
+            while time.ticks_diff(time.ticks_ms(), t0) < HW_TIMEOUT_MS:
+                await asyncio.sleep_ms(HW_POLL_MS)
+                radio.read()
+                self.probes += 1
+                if radio.is_ready:
+                    self.found = int(radio.frequency * 10 + 0.5)
+                    break
+        finally:
+            # leave search mode without re-triggering it
+            radio.search_mode = False
+            radio.update()
+            self.latency_ms = time.ticks_diff(time.ticks_ms(), t0)
+            self.busy = False
+        return self.found
+
+    async def compare(self, direction=1, start_tenths=None):
+        """Runs both seeks from the same start; prints latency & probes"""
+        if start_tenths is None:
+            start_tenths = int(self.radio.frequency * 10 + 0.5)
+        rows = []
+        for label, run in (("soft", self.seek), ("hw", self.hardware_seek)):
+            self.radio.frequency = start_tenths / 10
+            self.radio.update()
+            if run is self.seek:
+                found = await run(direction, start_tenths)
+            else:
+                found = await run(direction)
+            rows.append((label, found, self.latency_ms, self.probes))
+        print("─────── SEEK COMPARE ───────")
+        print("kind  found  ms     probes")
+        for label, found, ms, probes in rows:
+            print("{:<5} {:>5} {:>6} {:>6}".format(label, found or "-", ms, probes))
+        print(f"floor {self.floor}  threshold {self.threshold}  refreshes {self.floor_refreshes}")
+        return rows
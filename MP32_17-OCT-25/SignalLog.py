@@ -0,0 +1,289 @@
+"""
+SignalLog.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"APPEND-ONLY SIGNAL LOG ON FLASH"
+
+Hours of frequency / ADC level / stereo from TEA5767.Radio,
+    without writing flash on every sample.
+
+Layout ::
+    /siglog/seg_0000.bin, seg_0001.bin, ...   (rotated by size, oldest deleted)
+    each segment = whole BLOCKs, nothing else
+    BLOCK (512 B) = 32 B header + 60 records x 8 B
+
+    header  '<2sHIIIH'  magic 'SL', count, seq, first_t, last_t, check
+    record  '<IHBB'     t (s), tenths, adc level, flags (bit0 stereo, bit1 ready)
+
+Writes ::
+    records buffer in one preallocated RAM block,
+    flushed only as a full BLOCK (sync() pads a partial one).
+    60 samples -> 1 flash write.
+
+Crash-safe tail ::
+    a torn block fails its magic/count/check and is ignored;
+    on open, a segment whose size isn't a BLOCK multiple is closed off
+    and logging continues in a fresh segment.
+
+Indexed reads ::
+    block headers ARE the index (first_t/last_t);
+    query() checks each segment's first/last header,
+    then binary-searches blocks by time - no full scan.
+
+Time ::
+    time.time() seconds; if the RTC restarts behind the log (no NTP),
+    an offset keeps the log monotonic across boots.
+
+Usage ::
+    log = SignalLog()
+    asyncio.create_task(log.run(radio, period_ms=1000))
+    log.sync()          # before a planned reset; otherwise <60 samples are lost
+    for t, tenths, adc, stereo in log.query(t0, t1): ...
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import os
+import struct
+import utime as time
+import uasyncio as asyncio
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# FORMAT
+BLOCK = const(512)
+HEAD_SIZE = const(32)
+HEADER = "<2sHIIIH"
+RECORD = "<IHBB"
+REC_SIZE = const(8)
+PER_BLOCK = (BLOCK - HEAD_SIZE) // REC_SIZE     # 60
+MAGIC = b"SL"
+FLAG_STEREO = const(1)
+FLAG_READY = const(2)
+
+SEGMENT_BYTES = const(64 * 1024)                # 128 blocks, ~2 h at 1 Hz
+MAX_SEGMENTS = const(8)
+LOG_DIR = "/siglog"
+
+
+def _check(buf, count):
+    """16-bit sum over the used record bytes"""
+    s = 0
+    for i in range(HEAD_SIZE, HEAD_SIZE + count * REC_SIZE):
+        s += buf[i]
+    return s & 0xFFFF
+
+
+def _seg_name(directory, n):
+    return "{}/seg_{:04d}.bin".format(directory, n)
+
+
+class SignalLog:
+    def __init__(self, directory=LOG_DIR, segment_bytes=SEGMENT_BYTES,
+                 max_segments=MAX_SEGMENTS):
+        self.dir = directory
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self.block = bytearray(BLOCK)
+        self.count = 0                  # records in the RAM block
+        self.seq = 0                    # next block sequence number
+        self.offset = 0                 # seconds added to time.time()
+        self.last_t = 0
+        # Stats
+        self.samples = 0
+        self.blocks_written = 0
+        self.torn = 0                   # bad blocks skipped by readers
+        try:
+            os.mkdir(directory)
+        except OSError:
+            pass
+        self._open_tail()
+
+    # ───────────────────────────────────────────────────────────
+    # SEGMENTS
+    def segments(self):
+        """Segment numbers, oldest first"""
+        nums = []
+        for name in os.listdir(self.dir):
+            if name.startswith("seg_") and name.endswith(".bin"):
+                nums.append(int(name[4:name.index(".")]))  # 5+ digits past 9999
+        nums.sort()
+        return nums
+
+    def _size(self, n):
+        return os.stat(_seg_name(self.dir, n))[6]
+
+    def _open_tail(self):
+        """Resume after the last good block; torn tail -> fresh segment"""
+        segs = self.segments()
+        if not segs:
+            self.segment = 0
+            return
+        self.segment = segs[-1]
+        size = self._size(self.segment)
+        if size % BLOCK or size >= self.segment_bytes:
+            self.segment += 1
+        # continue sequence & clock from the newest readable block
+        for n in reversed(segs):
+            head = self._last_header(n)
+            if head:
+                self.seq = head[2] + 1
+                self.last_t = head[4]
+                break
+        now = time.time()
+        if now <= self.last_t:
+            self.offset = self.last_t + 1 - now
+
+    def _trim(self):
+        """Deletes the oldest until max_segments remain, the open tail included"""
+        segs = self.segments()
+        while len(segs) > self.max_segments:
+            os.remove(_seg_name(self.dir, segs.pop(0)))
+
+    # ───────────────────────────────────────────────────────────
+    # WRITE
+    def append(self, tenths, adc, stereo=False, ready=True, t=None):
+        """Buffers one record; flushes a block when it fills"""
+        if t is None:
+            t = time.time() + self.offset
+        if t < self.last_t:
+            t = self.last_t
+        flags = (FLAG_STEREO if stereo else 0) | (FLAG_READY if ready else 0)
+        struct.pack_into(RECORD, self.block, HEAD_SIZE + self.count * REC_SIZE,
+                         t, tenths, adc, flags)
+        self.count += 1
+        self.last_t = t
+        self.samples += 1
+        if self.count == PER_BLOCK:
+            self._flush()
+
+    def sample(self, radio):
+        """One record from the radio's last read"""
+        self.append(int(radio.frequency * 10 + 0.5), radio.signal_adc_level,
+                    radio.is_stereo, radio.is_ready)
+
+    def sync(self):
+        """Writes a partial block (padded to BLOCK) - before power-off/reset"""
+        if self.count:
+            self._flush()
+
+    def _flush(self):
+        blk = self.block
+        first_t = struct.unpack_from("<I", blk, HEAD_SIZE)[0]
+        last_t = struct.unpack_from("<I", blk, HEAD_SIZE + (self.count - 1) * REC_SIZE)[0]
+        # zero the unused tail so padded blocks are deterministic
+        for i in range(HEAD_SIZE + self.count * REC_SIZE, BLOCK):
+            blk[i] = 0
+        struct.pack_into(HEADER, blk, 0, MAGIC, self.count, self.seq,
+                         first_t, last_t, _check(blk, self.count))
+        new = False
+        try:
+            if self._size(self.segment) >= self.segment_bytes:
+                self.segment += 1
+                new = True
+        except OSError:
+            new = True      # not on flash yet (first block, or a torn tail skipped)
+        with open(_seg_name(self.dir, self.segment), "ab") as f:
+            f.write(blk)
+        if new:
+            self._trim()    # after the tail exists, so it counts
+        self.seq += 1
+        self.count = 0
+        self.blocks_written += 1
+
+    async def run(self, radio, period_ms=1000, paused=None):
+        """
+        Sampling task; one I2C status read per period, never blocks long.
+        paused() -> True skips a sample (e.g. mid-seek, the radio is elsewhere)
+        """
+        while True:
+            if not (paused and paused()):
+                try:
+                    radio.read()
+                    self.sample(radio)
+                except OSError as e:
+                    print("SignalLog :: read fail e>", e)
+            await asyncio.sleep_ms(period_ms)
+
+    # ───────────────────────────────────────────────────────────
+    # READ
+    def _header(self, f, index):
+        """Parsed header of block index, or None if torn/invalid"""
+        f.seek(index * BLOCK)
+        blk = f.read(BLOCK)
+        if len(blk) < BLOCK:
+            return None
+        head = struct.unpack_from(HEADER, blk, 0)
+        if head[0] != MAGIC or not 0 < head[1] <= PER_BLOCK:
+            return None
+        if _check(blk, head[1]) != head[5]:
+            return None
+        return head
+
+    def _last_header(self, n):
+        with open(_seg_name(self.dir, n), "rb") as f:
+            blocks = self._size(n) // BLOCK
+            for i in range(blocks - 1, -1, -1):
+                head = self._header(f, i)
+                if head:
+                    return head
+        return None
+
+    def _lower_bound(self, f, blocks, t0):
+        """First block whose last_t >= t0 (torn blocks treated as 'later')"""
+        lo, hi = 0, blocks
+        while lo < hi:
+            mid = (lo + hi) // 2
+            head = self._header(f, mid)
+            if head and head[4] < t0:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def query(self, t0=0, t1=0xFFFFFFFF):
+        """Yields (t, tenths, adc, stereo) with t0 <= t <= t1, oldest first"""
+        for n in self.segments():
+            path = _seg_name(self.dir, n)
+            blocks = self._size(n) // BLOCK
+            if not blocks:
+                continue
+            with open(path, "rb") as f:
+                first = self._header(f, 0)
+                if first and first[3] > t1:
+                    return          # segments are in time order; done
+                last = self._last_header(n)
+                if last and last[4] < t0:
+                    continue
+                i = self._lower_bound(f, blocks, t0)
+                while i < blocks:
+                    f.seek(i * BLOCK)
+                    blk = f.read(BLOCK)
+                    i += 1
+                    head = struct.unpack_from(HEADER, blk, 0) if len(blk) == BLOCK else None
+                    if (not head or head[0] != MAGIC or not 0 < head[1] <= PER_BLOCK
+                            or _check(blk, head[1]) != head[5]):
+                        self.torn += 1
+                        continue
+                    if head[3] > t1:
+                        return
+                    for r in range(head[1]):
+                        t, tenths, adc, flags = struct.unpack_from(
+                            RECORD, blk, HEAD_SIZE + r * REC_SIZE)
+                        if t0 <= t <= t1:
+                            yield t, tenths, adc, bool(flags & FLAG_STEREO)
+        # records still in RAM
+        for r in range(self.count):
+            t, tenths, adc, flags = struct.unpack_from(
+                RECORD, self.block, HEAD_SIZE + r * REC_SIZE)
+            if t0 <= t <= t1:
+                yield t, tenths, adc, bool(flags & FLAG_STEREO)
+
+    def report(self):
+        segs = self.segments()
+        total = 0
+        for n in segs:
+            total += self._size(n)
+        print(f"SignalLog :: {len(segs)} segments {total} B  samples {self.samples}  "
+              f"blocks {self.blocks_written}  buffered {self.count}  torn {self.torn}")
@@ -0,0 +1,215 @@
+"""
+Telemetry.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"HEAP & ALLOCATION TELEMETRY"
+
+Samples gc.mem_alloc() either side of hot paths;
+    RadioTuner.draw_display, RadioTuner.update_frequency,
+    SSD1306.show, Radio.update
+Tracks per-call allocation, worst case, call time
+    and how often the GC ran mid-call (a 'pause').
+
+Counters are preallocated arrays;
+    recording a sample allocates nothing itself,
+    so the numbers describe the probed code, not the probe.
+
+Usage ::
+    from Telemetry import telemetry
+    telemetry.instrument(screen, "show", "show")
+    ...
+    telemetry.report()          # REPL
+    telemetry.render(screen)    # OLED page
+
+GC pause detection ::
+    mem_alloc() only ever grows between collections,
+    so a *drop* across a call means the collector ran inside it.
+    That sample's allocation is unknown; it is counted as a pause only.
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import gc
+import utime as time
+from array import array
+from micropython import const
+
+# ───────────────────────────────────────────────────────────────
+# LIMITS
+MAX_PROBES = const(8)   # slots; fixed so counters never grow
+NAME_CHARS = const(6)   # fits the 16-column OLED table
+
+
+class Telemetry:
+    """
+    Fixed-slot allocation counters.
+    One slot per probed code path.
+    """
+    def __init__(self, slots=MAX_PROBES):
+        self.slots = slots
+        self.names = [None] * slots
+        self.used = 0
+        self.enabled = True
+        # Per-slot counters ('L' = unsigned 32-bit, never a heap int)
+        self.calls = array("L", [0] * slots)      # every call
+        self.samples = array("L", [0] * slots)    # calls with valid alloc
+        self.alloc_total = array("L", [0] * slots)
+        self.alloc_max = array("L", [0] * slots)
+        self.alloc_last = array("L", [0] * slots)
+        self.gc_pauses = array("L", [0] * slots)
+        self.us_total = array("L", [0] * slots)
+        self.us_max = array("L", [0] * slots)
+        # In-flight start points (one per slot; probes don't nest per slot)
+        self._a0 = array("l", [0] * slots)
+        self._t0 = array("l", [0] * slots)
+        # Bytes the probe wrapper itself costs per call (see calibrate)
+        self.overhead = 0
+
+    # ───────────────────────────────────────────────────────────
+    # SLOT REGISTRY
+    def register(self, name):
+        """Returns the slot for name, claiming a new one if needed"""
+        for slot in range(self.used):
+            if self.names[slot] == name:
+                return slot
+        if self.used >= self.slots:
+            raise ValueError("Telemetry :: out of slots")
+        slot = self.used
+        self.names[slot] = name
+        self.used += 1
+        return slot
+
+    # ───────────────────────────────────────────────────────────
+    # SAMPLING (hot path - keep it allocation free)
+    def begin(self, slot):
+        self._t0[slot] = time.ticks_us()
+        self._a0[slot] = gc.mem_alloc()
+
+    def end(self, slot):
+        a1 = gc.mem_alloc()
+        dt = time.ticks_diff(time.ticks_us(), self._t0[slot])
+        self.calls[slot] += 1
+        self.us_total[slot] += dt
+        if dt > self.us_max[slot]:
+            self.us_max[slot] = dt
+        used = a1 - self._a0[slot]
+        if used < 0:
+            # collector ran mid-call; allocation unknowable
+            self.gc_pauses[slot] += 1
+            return
+        used -= self.overhead
+        if used < 0:
+            used = 0
+        self.samples[slot] += 1
+        self.alloc_last[slot] = used
+        self.alloc_total[slot] += used
+        if used > self.alloc_max[slot]:
+            self.alloc_max[slot] = used
+
+    # ───────────────────────────────────────────────────────────
+    # INSTRUMENTATION
+    def _wrap(self, fn, slot):
+        begin = self.begin
+        end = self.end
+        def probe(*args):
+            if not self.enabled:
+                return fn(*args)
+            begin(slot)
+            try:
+                return fn(*args)
+            finally:
+                end(slot)
+        return probe
+
+    def instrument(self, owner, attr, name=None):
+        """
+        Replaces owner.attr with a probed wrapper.
+        Works on instances (screen, radio, tuner) -
+            internal self.attr() calls get probed too.
+        Returns the slot, or None if owner is missing.
+        """
+        if owner is None:
+            return None
+        slot = self.register(name or attr)
+        setattr(owner, attr, self._wrap(getattr(owner, attr), slot))
+        return slot
+
+    def calibrate(self, rounds=32):
+        """
+        Measures what the wrapper allocates around a no-op,
+        so instrument() numbers report only the probed code.
+        """
+        slot = self.register("~cal")
+        noop = self._wrap(lambda: None, slot)
+        self.overhead = 0
+        gc.collect()
+        for _ in range(rounds):
+            noop()
+        if self.samples[slot]:
+            self.overhead = self.alloc_total[slot] // self.samples[slot]
+        # hand the slot back; calibration isn't a real probe
+        self.used -= 1
+        self.names[slot] = None
+        self._clear(slot)
+        return self.overhead
+
+    # ───────────────────────────────────────────────────────────
+    # RESULTS
+    def _clear(self, slot):
+        for counter in (self.calls, self.samples, self.alloc_total,
+                        self.alloc_max, self.alloc_last, self.gc_pauses,
+                        self.us_total, self.us_max):
+            counter[slot] = 0
+
+    def reset(self):
+        """Zeros counters, keeps registered probes"""
+        for slot in range(self.used):
+            self._clear(slot)
+
+    def avg_alloc(self, slot):
+        n = self.samples[slot]
+        return self.alloc_total[slot] // n if n else 0
+
+    def avg_us(self, slot):
+        n = self.calls[slot]
+        return self.us_total[slot] // n if n else 0
+
+    def report(self):
+        """REPL table; allocates freely, call it from the debug path only"""
+        print("─────── HEAP TELEMETRY ───────")
+        print(f"free {gc.mem_free()}  alloc {gc.mem_alloc()}  wrap {self.overhead}B")
+        print("probe   calls  avgB  maxB  lastB  gc  avg_us  max_us")
+        for slot in range(self.used):
+            print("{:<7} {:>5} {:>5} {:>5} {:>6} {:>3} {:>7} {:>7}".format(
+                self.names[slot], self.calls[slot], self.avg_alloc(slot),
+                self.alloc_max[slot], self.alloc_last[slot],
+                self.gc_pauses[slot], self.avg_us(slot), self.us_max[slot]))
+        print("──────────────────────────────")
+
+    def render(self, screen, y=0):
+        """
+        Diagnostics page;
+            row 0: free heap
+            rows : name avg/max bytes, gc pauses
+        Leaves screen.show() to the caller.
+        """
+        if screen is None:
+            return
+        screen.fill_rect(0, y, screen.width, screen.height - y, 0)
+        screen.text(f"Heap {gc.mem_free()}", 0, y)
+        y += 9
+        for slot in range(self.used):
+            if y > screen.height - 8:
+                break
+            name = self.names[slot][:NAME_CHARS]
+            screen.text("{:<6}{:>4}{:>4}{:>2}".format(
+                name, self.avg_alloc(slot), self.alloc_max[slot],
+                min(self.gc_pauses[slot], 99)), 0, y)
+            y += 8
+
+
+# ───────────────────────────────────────────────────────────────
+# GLOBAL TELEMETRY INSTANCE
+#     from Telemetry import telemetry
+telemetry = Telemetry()
@@ -0,0 +1,203 @@
+"""
+TextPack.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"STREAMING TEXT PACKS"
+
+Long text ships packed by HostTools/textpack.py;
+    Assets/<name>.tpk  ->  ~1 KB blocks, each raw deflate on its own
+A page open inflates ONE block (the one the page sits in)
+    straight from the file into a reused block buffer.
+The rest of the text stays compressed on flash, never in RAM.
+
+.tpk layout (little endian) ::
+    header  '<4sBBHHI'  magic b"TPK1", wbits, 0, block, count, raw_len
+    index   '<IIHH' x count   raw_off, file_off, comp_len, raw_len
+    blocks  raw deflate streams, back to back
+Blocks are cut at whitespace, so a word never spans two.
+
+RAM ::
+    block buffer (block bytes) + index (12 B a block), held
+    inflate window (2**wbits) only while a block is being opened
+Inflater ::
+    'deflate' module (MicroPython 1.21+) streams from the file;
+    older firmware falls back to zlib.decompress (reads the block first).
+
+Offsets are raw text byte offsets; a reader keeps one per page.
+
+Usage ::
+    book = TextPack("/Assets/entity.tpk")
+    lines, nxt = book.page(0)           # 16 x 8 word-wrapped, OLED sized
+    for row, line in enumerate(lines):
+        screen.text(line, 0, row * 8)
+    book.report()                       # flash vs raw, page-open us
+    book.report("/entity.txt")         # + a plain read, if the raw file is there
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+import os
+import struct
+import utime as time
+from micropython import const
+try:
+    import deflate
+except ImportError:
+    deflate = None
+    import zlib
+
+# ───────────────────────────────────────────────────────────────
+# FORMAT (mirrors HostTools/textpack.py)
+MAGIC = b"TPK1"
+HEADER = "<4sBBHHI"
+HEADER_SIZE = const(14)
+ENTRY = "<IIHH"
+ENTRY_SIZE = const(12)
+
+# OLED page, 8x8 font
+COLS = const(16)
+ROWS = const(8)
+
+
+class TextPack:
+    def __init__(self, path, cols=COLS):
+        self.path = path
+        self.f = open(path, "rb")
+        magic, self.wbits, _, block, self.count, self.raw_len = struct.unpack(
+            HEADER, self.f.read(HEADER_SIZE))
+        if magic != MAGIC:
+            raise ValueError("TextPack :: not a TPK1 pack")
+        self.index = self.f.read(ENTRY_SIZE * self.count)
+        self.buf = bytearray(block)
+        self.view = memoryview(self.buf)
+        self.line = bytearray(cols)     # page() scratch
+        self.cur = -1                   # block in buf
+        self.cur_off = 0
+        self.cur_len = 0
+        # Stats
+        self.opens = 0                  # blocks inflated
+        self.hits = 0                   # block already in buf
+        self.us_total = 0
+        self.us_max = 0
+        self.flash_read = 0             # compressed bytes inflated
+
+    def close(self):
+        self.f.close()
+
+    # ───────────────────────────────────────────────────────────
+    # BLOCKS
+    def find(self, offset):
+        """Block holding raw offset; binary search over the index"""
+        lo, hi = 0, self.count - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if struct.unpack_from("<I", self.index, mid * ENTRY_SIZE)[0] <= offset:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def load(self, i):
+        """Inflates block i into buf (no-op if it's already there)"""
+        if i == self.cur:
+            self.hits += 1
+            return
+        raw_off, file_off, comp_len, n = struct.unpack_from(ENTRY, self.index, i * ENTRY_SIZE)
+        t0 = time.ticks_us()
+        self.f.seek(file_off)
+        if deflate:
+            stream = deflate.DeflateIO(self.f, deflate.RAW, self.wbits)
+            got = 0
+            while got < n:
+                r = stream.readinto(self.view[got:n])
+                if not r:
+                    break
+                got += r
+            stream.close()
+        else:
+            chunk = zlib.decompress(self.f.read(comp_len), -self.wbits)
+            got = len(chunk)
+            self.view[:got] = chunk
+        if got != n:
+            self.cur = -1
+            raise ValueError("TextPack :: block {} short ({} of {})".format(i, got, n))
+        self.cur = i
+        self.cur_off = raw_off
+        self.cur_len = n
+        dt = time.ticks_diff(time.ticks_us(), t0)
+        self.opens += 1
+        self.flash_read += comp_len
+        self.us_total += dt
+        if dt > self.us_max:
+            self.us_max = dt
+
+    def _at(self, pos):
+        if not self.cur_off <= pos < self.cur_off + self.cur_len:
+            self.load(self.find(pos))
+        return self.buf[pos - self.cur_off]
+
+    def text(self, offset):
+        """Raw bytes from offset to the end of its block (memoryview, no copy)"""
+        self.load(self.find(offset))
+        return self.view[offset - self.cur_off:self.cur_len]
+
+    # ───────────────────────────────────────────────────────────
+    # PAGES
+    def page(self, offset, cols=COLS, rows=ROWS):
+        """
+        Word-wrapped lines from offset; returns (lines, next page offset).
+        Scans forward once, so a page straddling two blocks opens each once.
+        """
+        lines = []
+        line = self.line
+        pos = offset
+        end = self.raw_len
+        while len(lines) < rows and pos < end:
+            n = 0
+            brk = -1                    # last space in this line
+            nxt = -1
+            while n < cols and pos + n < end:
+                c = self._at(pos + n)
+                if c == 10:
+                    nxt = pos + n + 1
+                    break
+                if c == 32 or c == 13:
+                    c = 32
+                    brk = n
+                line[n] = c
+                n += 1
+            if nxt < 0:
+                if pos + n >= end:
+                    nxt = end
+                elif self._at(pos + n) in (10, 13, 32):
+                    nxt = pos + n + 1   # line ended exactly at a gap
+                elif brk > 0:
+                    n = brk
+                    nxt = pos + brk + 1
+                else:
+                    nxt = pos + n       # word longer than a line; hard cut
+            lines.append(bytes(line[:n]).decode())
+            pos = nxt
+        return lines, pos
+
+    def report(self, raw_path=None):
+        """raw_path: the unpacked text on flash, to time a plain block read"""
+        flash = os.stat(self.path)[6]
+        avg = self.us_total // self.opens if self.opens else 0
+        print(f"TextPack :: {self.path}  flash {flash} B vs raw {self.raw_len} B "
+              f"({100 * flash // max(self.raw_len, 1)}%)  {self.count} blocks")
+        print(f"  page-open us avg {avg} max {self.us_max}  opens {self.opens} hits {self.hits}  "
+              f"RAM {len(self.buf) + len(self.index)} B + {1 << self.wbits} B window")
+        if raw_path:
+            with open(raw_path, "rb") as f:
+                t0 = time.ticks_us()
+                f.seek(self.raw_len // 2)
+                f.readinto(self.view)
+                dt = time.ticks_diff(time.ticks_us(), t0)
+            # buf now holds raw bytes, not a block; _at() must reload
+            self.cur = -1
+            self.cur_off = self.cur_len = 0
+            raw = os.stat(raw_path)[6]
+            print(f"  vs {raw_path}: {raw} B on flash ({100 * flash // max(raw, 1)}% packed), "
+                  f"block read us {dt}")
@@ -0,0 +1,348 @@
+"""
+Widgets.py
+"""
+SoftVers = "17'OCT'25"
+"""
+───────────────────────────────────────────────────────────────
+"RETAINED-MODE OLED WIDGETS"
+
+Immediate mode (fill, text, text, show) repaints 1 KB for a 1-digit change.
+Retained mode instead ::
+    - each widget owns a bounding box & a value
+    - set() marks only that widget dirty, and only if the value changed
+    - paint() clears & redraws only its own box
+    - Scene.commit() paints every dirty widget,
+        then flushes the touched 8-pixel pages in one frame
+
+Widgets ::
+    Label        - formatted text
+    FreqReadout  - "FM: 100.0" from integer tenths (no float formatting)
+    ModeLabel    - "Mode: Fine"/"Mode: Coarse"
+    SignalBar    - ADC level 0..15 as a filled bar
+    StereoIcon   - "ST" badge, inverted when stereo
+    Countdown    - right-aligned seconds counter
+    TuningDial   - scanner-style MHz scale sliding under a fixed needle
+
+Popups sit on top via Overlay.py; Scene(screen, overlay) paints
+    under them copy-on-write, so dismissing one needs no redraw here.
+
+Usage ::
+    scene = Scene(screen)
+    freq = scene.add(FreqReadout(30, 30))
+    freq.set(1001)
+    scene.commit()
+"""
+# ───────────────────────────────────────────────────────────────
+# IMPORTS
+from array import array
+from micropython import const
+
+CHAR_W = const(8)   # framebuf built-in font is 8x8
+PAGE_H = const(8)   # SSD1306 page = 8 pixel rows
+NO_SPAN = const(-1)
+
+
+# ───────────────────────────────────────────────────────────────
+# WIDGET BASE
+class Widget:
+    """
+    A box on screen with a value.
+    Subclasses only implement draw(fb); clearing is handled here.
+    """
+    def __init__(self, x, y, w, h, value=None):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.value = value
+        self.dirty = True
+
+    def set(self, value):
+        """Stores value; marks dirty only on change. Returns True if changed"""
+        if value == self.value:
+            return False
+        self.value = value
+        self.dirty = True
+        return True
+
+    def invalidate(self):
+        """Pixels under the box are gone; repaint from scratch next commit"""
+        self.dirty = True
+
+    def paint(self, fb):
+        fb.fill_rect(self.x, self.y, self.w, self.h, 0)
+        self.draw(fb)
+        self.dirty = False
+
+    def draw(self, fb):
+        raise NotImplementedError
+
+
+# ───────────────────────────────────────────────────────────────
+# WIDGETS
+class Label(Widget):
+    """Text from fmt.format(value); box sized to chars"""
+    def __init__(self, x, y, chars, fmt="{}", value=None):
+        super().__init__(x, y, chars * CHAR_W, PAGE_H, value)
+        self.fmt = fmt
+
+    def text(self):
+        return self.fmt.format(self.value)
+
+    def draw(self, fb):
+        if self.value is not None:
+            fb.text(self.text(), self.x, self.y)
+
+
+class FreqReadout(Label):
+    """Value is integer tenths of MHz; 1001 -> 'FM: 100.1'"""
+    def __init__(self, x, y, value=None):
+        super().__init__(x, y, 9, "FM: {}.{}", value)
+
+    def text(self):
+        return self.fmt.format(self.value // 10, self.value % 10)
+
+
+class ModeLabel(Label):
+    """Value is CoarseEncoderStep (bool)"""
+    def __init__(self, x, y, value=None):
+        super().__init__(x, y, 12, "Mode: {}", value)
+
+    def text(self):
+        return self.fmt.format("Coarse" if self.value else "Fine")
+
+
+class SignalBar(Widget):
+    """Value is TEA5767 ADC level (0..15); outline + proportional fill"""
+    LEVELS = 15
+
+    def draw(self, fb):
+        fb.rect(self.x, self.y, self.w, self.h, 1)
+        if self.value:
+            inner = self.w - 2
+            fill = min(self.value, self.LEVELS) * inner // self.LEVELS
+            fb.fill_rect(self.x + 1, self.y + 1, fill, self.h - 2, 1)
+
+
+class StereoIcon(Widget):
+    """Value is is_stereo; inverted 'ST' badge when True, blank when mono"""
+    def __init__(self, x, y, value=None):
+        super().__init__(x, y, 2 * CHAR_W, PAGE_H, value)
+
+    def draw(self, fb):
+        if self.value:
+            fb.fill_rect(self.x, self.y, self.w, self.h, 1)
+            fb.text("ST", self.x, self.y, 0)
+
+
+class Countdown(Label):
+    """Right-aligned three-digit counter"""
+    def __init__(self, x, y, value=None):
+        super().__init__(x, y, 3, "{:>3}", value)
+
+
+class TuningDial(Widget):
+    """
+    Value is integer tenths. Full-width band, page aligned (y % 8 == 0).
+        top page    : even-MHz labels
+        bottom page : ticks, long = whole MHz, short = .5 MHz; needle at centre
+    A tune step scrolls the band by (delta x PX) pixels with framebuf.scroll
+        on a FrameBuffer over just these pages, then draws only
+        the exposed strip (from the tick table) and moves the needle.
+    Jumps wider than the band, or after invalidate(), redraw in full.
+    """
+    PX = 2              # pixels per 0.1 MHz
+    MINOR = 5           # tick every 0.5 MHz
+    LABEL_EVERY = 20    # label every 2 MHz
+
+    def __init__(self, y, width=128, lo=875, hi=1080, value=None):
+        super().__init__(0, y, width, 2 * PAGE_H, value)
+        self.cx = width // 2
+        # Tick table over the band plus half a screen either side
+        span = (self.cx // self.PX + self.MINOR) // self.MINOR * self.MINOR
+        self.t0 = (lo - span) // self.MINOR * self.MINOR
+        count = (hi + span - self.t0) // self.MINOR + 1
+        self.ticks = array("h", [self.t0 + i * self.MINOR for i in range(count)])
+        self.labels = {}
+        for t in self.ticks:
+            if t % self.LABEL_EVERY == 0 and lo <= t <= hi:
+                self.labels[t] = str(t // 10)
+        self.band = None
+        self._shown = None
+        # Stats
+        self.scrolls = 0
+        self.full_draws = 0
+        self.columns_drawn = 0
+
+    def invalidate(self):
+        self.dirty = True
+        self._shown = None
+
+    def _band(self, fb):
+        if self.band is None:
+            import framebuf
+            w = self.w
+            p0 = self.y // PAGE_H
+            mv = memoryview(fb.buffer)[p0 * w:(p0 + 2) * w]
+            self.band = framebuf.FrameBuffer(mv, w, self.h, framebuf.MONO_VLSB)
+        return self.band
+
+    def _draw_columns(self, band, c0, c1, centre):
+        """Clears columns [c0, c1) and redraws the scale there"""
+        if c1 <= c0:
+            return
+        band.fill_rect(c0, 0, c1 - c0, self.h, 0)
+        self.columns_drawn += c1 - c0
+        px = self.PX
+        # widest label reaches 12 px either side of its tick
+        lo_t = centre + (c0 - self.cx - 12) // px
+        hi_t = centre + (c1 - self.cx + 12) // px
+        i = max(0, (lo_t - self.t0) // self.MINOR)
+        n = len(self.ticks)
+        while i < n and self.ticks[i] <= hi_t:
+            t = self.ticks[i]
+            x = self.cx + (t - centre) * px
+            if c0 <= x < c1:
+                band.vline(x, 12 if t % 10 else 9, 4 if t % 10 else 7, 1)
+            label = self.labels.get(t)
+            if label is not None:
+                lx = x - len(label) * 4
+                if lx < c1 and lx + len(label) * CHAR_W > c0:
+                    band.text(label, lx, 0, 1)
+            i += 1
+
+    def _needle(self, band, on):
+        band.vline(self.cx, 8, 8, 1 if on else 0)
+
+    def paint(self, fb):
+        band = self._band(fb)
+        value = self.value
+        if value is None:
+            band.fill(0)
+            self._shown = None
+            self.dirty = False
+            return
+        w = self.w
+        shown = self._shown
+        dx = None if shown is None else (value - shown) * self.PX
+        if dx is None or abs(dx) >= w:
+            self._draw_columns(band, 0, w, value)
+            self.full_draws += 1
+        elif dx:
+            # lift the needle (restore the scale under it), slide, fill the gap
+            self._draw_columns(band, self.cx, self.cx + 1, shown)
+            band.scroll(-dx, 0)
+            if dx > 0:
+                self._draw_columns(band, w - dx, w, value)
+            else:
+                self._draw_columns(band, 0, -dx, value)
+            self.scrolls += 1
+        self._needle(band, True)
+        self._shown = value
+        self.dirty = False
+
+
+# ───────────────────────────────────────────────────────────────
+# SCENE / FRAME COMMIT
+class Scene:
+    """
+    Widget collection bound to one SSD1306.
+    Tracks a dirty column span per page (preallocated),
+        so commit() flushes only what changed.
+    overlay: optional Overlay.Overlay; widgets under it paint copy-on-write.
+    """
+    def __init__(self, screen, overlay=None):
+        self.screen = screen
+        self.overlay = overlay
+        self.widgets = []
+        pages = screen.pages if screen else 8
+        self._x0 = array("h", [NO_SPAN] * pages)
+        self._x1 = array("h", [NO_SPAN] * pages)
+        self.flushed_bytes = 0      # last commit, for telemetry/pacing
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        return widget
+
+    def dirty(self):
+        """True if any widget is waiting to be painted"""
+        for w in self.widgets:
+            if w.dirty:
+                return True
+        return False
+
+    def invalidate(self, clear=False):
+        """
+        Marks every widget dirty.
+        clear=True also wipes the framebuffer & flags the whole panel,
+            for after someone else drew over the screen (screensaver, diag)
+        """
+        for w in self.widgets:
+            w.invalidate()
+        if clear and self.screen:
+            self.screen.fill(0)
+            if self.overlay and self.overlay.active:
+                self.overlay.cleared()
+            self._mark(0, 0, self.screen.width, self.screen.height)
+
+    def repaint(self, fb=None):
+        """Every widget into the framebuffer, no flush (an overlay's painter)"""
+        fb = fb or self.screen
+        for w in self.widgets:
+            w.paint(fb)
+
+    def _mark(self, x, y, w, h):
+        last = self.screen.width - 1
+        x0 = max(0, x)
+        x1 = min(last, x + w - 1)
+        p0 = max(0, y // PAGE_H)
+        p1 = min(len(self._x0) - 1, (y + h - 1) // PAGE_H)
+        for page in range(p0, p1 + 1):
+            if self._x0[page] == NO_SPAN or x0 < self._x0[page]:
+                self._x0[page] = x0
+            if x1 > self._x1[page]:
+                self._x1[page] = x1
+
+    def commit(self):
+        """
+        Paints dirty widgets into the framebuffer,
+        then flushes runs of dirty pages as one rectangle each.
+        Returns bytes sent (0 if nothing changed).
+        """
+        screen = self.screen
+        if screen is None:
+            return 0
+        overlay = self.overlay
+        lifted = False
+        for w in self.widgets:
+            if w.dirty:
+                if not lifted and overlay and overlay.hits(w.x, w.y, w.w, w.h):
+                    overlay.lift()      # paint on what's under the popup
+                    lifted = True
+                w.paint(screen)
+                self._mark(w.x, w.y, w.w, w.h)
+        if lifted:
+            overlay.drop()
+        sent = 0
+        pages = len(self._x0)
+        page = 0
+        while page < pages:
+            if self._x0[page] == NO_SPAN:
+                page += 1
+                continue
+            # grow a run of consecutive dirty pages; union their spans
+            p0 = page
+            x0 = self._x0[page]
+            x1 = self._x1[page]
+            while page + 1 < pages and self._x0[page + 1] != NO_SPAN:
+                page += 1
+                x0 = min(x0, self._x0[page])
+                x1 = max(x1, self._x1[page])
+            screen.show_region(x0, x1, p0, page)
+            sent += (x1 - x0 + 1) * (page - p0 + 1)
+            for p in range(p0, page + 1):
+                self._x0[p] = NO_SPAN
+                self._x1[p] = NO_SPAN
+            page += 1
+        self.flushed_bytes = sent
+        return sent
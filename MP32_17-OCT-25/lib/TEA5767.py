@@ -32,7 +32,8 @@ class Radio:
     
     Initialize:
         radio = TEA5767.Radio(i2c, [addr=0x60, freq=106.7, band='US', stereo=True,
-                                    soft_mute=True, noise_cancel=True, high_cut=True])
+                                    soft_mute=True, noise_cancel=True, high_cut=True,
+                                    mute=False])
     """
     
     FREQ_RANGE_US = (87.5, 108.0)
@@ -45,13 +46,13 @@ class Radio:
                 'high_cut_mode', 'is_ready', 'is_stereo', 'signal_adc_level']
     
     def __init__(self, i2c, addr=0x60, freq=0.0, band='US', stereo=True,
-                            soft_mute=True, noise_cancel=True, high_cut=True):
+                            soft_mute=True, noise_cancel=True, high_cut=True, mute=False):
         self._i2c = i2c
         self._address = addr
         self.frequency = freq
         self.band_limits = band
         self.standby_mode = False
-        self.mute_mode = False
+        self.mute_mode = mute  # in the first write, so a muted radio never blips
         self.soft_mute_mode = soft_mute
         self.search_mode = False
         self.search_direction = 1
@@ -96,6 +97,13 @@ class Radio:
         self.signal_adc_level = int(buf[3] >> 4)
 
     def update(self):
+        self.write()
+        time.sleep_ms(1)  # i2c bus has max delay of 400 us
+        self.read()
+
+    def write(self):
+        # register write only; callers that need to wait for the PLL
+        # (seek/scan) await their own settle time and then call read()
         if self.band_limits == 'JP':
             self.frequency = min(max(self.frequency, Radio.FREQ_RANGE_JP[0]), Radio.FREQ_RANGE_JP[1])
         else:
@@ -114,8 +122,6 @@ class Radio:
         buf[3] += self.soft_mute_mode << 3 | self.high_cut_mode << 2 | self.stereo_noise_cancelling_mode << 1
         buf[4] = 0
         self._i2c.writeto(self._address, buf)
-        time.sleep_ms(1)  # i2c bus has max delay of 400 us
-        self.read()
 
 
 if __name__ == '__main__':
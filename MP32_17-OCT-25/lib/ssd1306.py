@@ -109,6 +109,26 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(self.pages - 1)
         self.write_data(self.buffer)
 
+    def show_region(self, x0, x1, p0, p1, buf=None):
+        # flush columns x0..x1 of pages p0..p1 only; the column/page
+        # window makes the controller wrap rows inside the region.
+        # buf: same-layout buffer to send instead (flush worker's front buffer)
+        mv = memoryview(self.buffer if buf is None else buf)
+        col_offset = (128 - self.width) // 2 if self.width != 128 else 0
+        self.write_cmd(SET_COL_ADDR)
+        self.write_cmd(x0 + col_offset)
+        self.write_cmd(x1 + col_offset)
+        self.write_cmd(SET_PAGE_ADDR)
+        self.write_cmd(p0)
+        self.write_cmd(p1)
+        if x0 == 0 and x1 == self.width - 1:
+            # full-width pages are contiguous in the buffer
+            self.write_data(mv[p0 * self.width : (p1 + 1) * self.width])
+            return
+        for page in range(p0, p1 + 1):
+            base = page * self.width
+            self.write_data(mv[base + x0 : base + x1 + 1])
+
 
 class SSD1306_I2C(SSD1306):
     def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):